@@ -0,0 +1,29 @@
+"""Bit codes for natural weapons and combat traits, so an animal's set of each is one int."""
+from typing import Iterable
+
+# Weapons and traits combat knows about; the index is the bit number
+WEAPON_NAMES = (
+    'claws', 'fangs', 'horns', 'tusks', 'bite', 'tail',
+    'trunk', 'ram', 'talons', 'beak', 'tentacles'
+)
+WEAPON_BITS = {name: 1 << i for i, name in enumerate(WEAPON_NAMES)}
+
+TRAIT_NAMES = ('heat_adapted', 'cold_adapted', 'pack_hunter', 'ambush_predator', 'aquatic_master')
+TRAIT_BITS = {name: 1 << i for i, name in enumerate(TRAIT_NAMES)}
+OTHER_TRAITS = 1 << len(TRAIT_NAMES)  # Set for 'none' and any trait without a bit of its own
+
+
+def weapon_mask(weapons: Iterable[str]) -> int:
+    """Get the bitmask of the known weapons in a sequence of weapon names."""
+    mask = 0
+    for weapon in weapons:
+        mask |= WEAPON_BITS.get(weapon, 0)
+    return mask
+
+
+def trait_mask(traits: str) -> int:
+    """Get the bitmask of a comma-joined combat traits string."""
+    mask = 0
+    for trait in traits.split(','):
+        mask |= TRAIT_BITS.get(trait, OTHER_TRAITS)
+    return mask
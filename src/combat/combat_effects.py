@@ -1,155 +1,139 @@
 import pygame
-import random
 import math
-from typing import Tuple, List, Dict
-
-class CombatEffect:
-    def __init__(self, x: float, y: float, effect_type: str, color: Tuple[int, int, int], duration: float = 1.0):
-        self.x = x
-        self.y = y
-        self.effect_type = effect_type
-        self.color = color
-        self.duration = duration
-        self.current_time = 0
-        self.particles: List[Dict] = []
-        self.finished = False
-        
-        # Initialize particles based on effect type
-        if effect_type == 'slash':
-            self._init_slash_effect()
-        elif effect_type == 'bite':
-            self._init_bite_effect()
-        elif effect_type == 'charge':
-            self._init_charge_effect()
-        elif effect_type == 'special':
-            self._init_special_effect()
-    
-    def _init_slash_effect(self):
-        """Initialize slash attack particles."""
-        num_particles = 15
-        for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(100, 200)
-            self.particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed,
-                'size': random.uniform(2, 4),
-                'alpha': 255
-            })
-
-    def _init_bite_effect(self):
-        """Initialize bite attack particles."""
-        num_particles = 10
-        for _ in range(num_particles):
-            angle = random.uniform(-math.pi/4, math.pi/4)
-            speed = random.uniform(50, 150)
-            self.particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed,
-                'size': random.uniform(3, 6),
-                'alpha': 255
-            })
-
-    def _init_charge_effect(self):
-        """Initialize charge attack particles."""
-        num_particles = 20
-        for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(150, 300)
-            self.particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed,
-                'size': random.uniform(2, 5),
-                'alpha': 255
-            })
-
-    def _init_special_effect(self):
-        """Initialize special ability particles."""
-        num_particles = 30
-        for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(100, 400)
-            self.particles.append({
-                'x': self.x,
-                'y': self.y,
-                'dx': math.cos(angle) * speed,
-                'dy': math.sin(angle) * speed,
-                'size': random.uniform(3, 7),
-                'alpha': 255
-            })
+import numpy as np
+from typing import Tuple, List, Dict, Optional
 
-    def update(self, dt: float):
-        """Update effect particles."""
-        self.current_time += dt
-        if self.current_time >= self.duration:
-            self.finished = True
-            return
+from utils.particle_kernels import step_particles
 
-        # Update each particle
-        for particle in self.particles:
-            # Update position
-            particle['x'] += particle['dx'] * dt
-            particle['y'] += particle['dy'] * dt
-            
-            # Apply gravity and friction
-            particle['dy'] += 400 * dt  # Gravity
-            particle['dx'] *= 0.95  # Air resistance
-            particle['dy'] *= 0.95
-            
-            # Fade out
-            fade_rate = 255 / self.duration
-            particle['alpha'] = max(0, particle['alpha'] - fade_rate * dt)
-
-    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int):
-        """Draw effect particles."""
-        for particle in self.particles:
-            alpha = int(particle['alpha'])
-            if alpha <= 0:
-                continue
-                
-            # Create color with alpha
-            color_with_alpha = (*self.color, alpha)
-            
-            # Create surface for particle
-            particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                particle_surface,
-                color_with_alpha,
-                (particle['size'], particle['size']),
-                particle['size']
-            )
-            
-            # Draw to screen
-            screen.blit(
-                particle_surface,
-                (
-                    particle['x'] - camera_x - particle['size'],
-                    particle['y'] - camera_y - particle['size']
-                )
-            )
+# Particle burst per effect type: (count, heading range, speed range, size range).
+# Effect types not listed here spawn no particles.
+_EFFECT_PARAMS: Dict[str, Tuple[int, Tuple[float, float], Tuple[float, float], Tuple[float, float]]] = {
+    'slash': (15, (0, math.pi * 2), (100, 200), (2, 4)),
+    'bite': (10, (-math.pi/4, math.pi/4), (50, 150), (3, 6)),
+    'charge': (20, (0, math.pi * 2), (150, 300), (2, 5)),
+    'special': (30, (0, math.pi * 2), (100, 400), (3, 7)),
+}
 
 class CombatEffectManager:
-    def __init__(self):
-        self.effects: List[CombatEffect] = []
+    # Per-particle arrays making up the shared pool
+    _FIELDS = ('x', 'y', 'dx', 'dy', 'size', 'alpha', 'color_id')
+
+    # Pre-rendered particle circles keyed by (radius, color, alpha)
+    _CIRCLE_CACHE: Dict[Tuple[int, Tuple[int, int, int], int], pygame.Surface] = {}
+
+    def __init__(self, capacity: int = 256, rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.duration = 1.0
+        self.count = 0  # Number of live particles at the front of the pool
+        self.colors: List[Tuple[int, int, int]] = []
+        self._color_ids: Dict[Tuple[int, int, int], int] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        """Allocate (or grow) the particle pool, keeping live particles."""
+        live = [getattr(self, name)[:self.count] for name in self._FIELDS] if self.count else []
+        self.capacity = capacity
+        self.x = np.empty(capacity, dtype=np.float32)
+        self.y = np.empty(capacity, dtype=np.float32)
+        self.dx = np.empty(capacity, dtype=np.float32)
+        self.dy = np.empty(capacity, dtype=np.float32)
+        self.size = np.empty(capacity, dtype=np.float32)
+        self.alpha = np.empty(capacity, dtype=np.float32)
+        self.color_id = np.empty(capacity, dtype=np.int16)
+        for name, values in zip(self._FIELDS, live):
+            getattr(self, name)[:self.count] = values
+
+    def _get_color_id(self, color: Tuple[int, int, int]) -> int:
+        """Map an effect color to a small integer index."""
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = len(self.colors)
+            self.colors.append(color)
+            self._color_ids[color] = color_id
+        return color_id
         
     def add_effect(self, x: float, y: float, effect_type: str, color: Tuple[int, int, int]):
         """Add a new combat effect."""
-        self.effects.append(CombatEffect(x, y, effect_type, color))
+        params = _EFFECT_PARAMS.get(effect_type)
+        if params is None:
+            return
+        n, angle_range, speed_range, size_range = params
+
+        start, end = self.count, self.count + n
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
+
+        # Spawn the burst straight into the pool with random headings, speeds and sizes
+        angles = self.rng.uniform(*angle_range, n)
+        speeds = self.rng.uniform(*speed_range, n)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.dx[start:end] = np.cos(angles) * speeds
+        self.dy[start:end] = np.sin(angles) * speeds
+        self.size[start:end] = self.rng.uniform(*size_range, n)
+        self.alpha[start:end] = 255.0
+        self.color_id[start:end] = self._get_color_id(color)
+        self.count = end
         
     def update(self, dt: float):
-        """Update all active effects."""
-        # Update effects and remove finished ones
-        self.effects = [effect for effect in self.effects if not effect.finished]
-        for effect in self.effects:
-            effect.update(dt)
+        """Update all active particles and drop the faded ones."""
+        n = self.count
+        if n == 0:
+            return
+
+        fade_rate = 255 / self.duration
+        # Steps and compacts in place so live particles stay contiguous
+        self.count = step_particles(
+            self.x[:n], self.y[:n], self.dx[:n], self.dy[:n],
+            self.size[:n], self.alpha[:n], self.color_id[:n], dt, fade_rate
+        )
             
     def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int):
-        """Draw all active effects."""
-        for effect in self.effects:
-            effect.draw(screen, camera_x, camera_y) 
\ No newline at end of file
+        """Draw all active particles in a single blits() call."""
+        n = self.count
+        if n == 0:
+            return
+
+        radii = np.maximum(self.size[:n].astype(np.int32), 1)
+        alphas = self.alpha[:n].astype(np.int32)
+        # Top-left corner of each particle in screen space
+        sx = self.x[:n] - camera_x - radii
+        sy = self.y[:n] - camera_y - radii
+
+        # Reject faded and off-screen particles before touching any surfaces
+        width, height = screen.get_size()
+        visible = (
+            (alphas > 0)
+            & (sx > -2 * radii) & (sx < width)
+            & (sy > -2 * radii) & (sy < height)
+        )
+
+        blit_seq = []
+        for i in np.flatnonzero(visible):
+            surf = self._get_circle(int(radii[i]), self.colors[self.color_id[i]], int(alphas[i]))
+            blit_seq.append((surf, (float(sx[i]), float(sy[i]))))
+
+        if blit_seq:
+            screen.blits(blit_seq, doreturn=False)
+
+    def prewarm(self, colors: List[Tuple[int, int, int]], max_radius: int = 7):
+        """Pre-render the tinted circle palette for known effect colors."""
+        for color in colors:
+            self._get_color_id(color)
+            for radius in range(1, max_radius + 1):
+                for alpha in range(15, 256, 16):
+                    self._get_circle(radius, color, alpha)
+
+    @classmethod
+    def _get_circle(cls, radius: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Get a pre-rendered particle circle, rendering it on first use."""
+        # Alpha is baked in (quantized to 16 levels) since one surface may
+        # appear several times within the same blits() batch
+        alpha |= 15
+        key = (radius, color, alpha)
+        surf = cls._CIRCLE_CACHE.get(key)
+        if surf is None:
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+            cls._CIRCLE_CACHE[key] = surf
+        return surf
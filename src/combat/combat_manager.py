@@ -1,15 +1,72 @@
-from typing import List, Tuple, Dict
+from typing import Callable, List, Optional, Tuple, Dict
 
 import pygame
 from entities.team import Team  # Changed from relative to absolute import
-import random
-from utils.helpers import generate_battle_story  # Import the battle story generator
+from utils.helpers import battle_story_from  # Import the battle story generator
 from .combat_effects import CombatEffectManager
+from .combat_codes import TRAIT_NAMES, TRAIT_BITS, OTHER_TRAITS, WEAPON_BITS
 import math
+import numpy as np
+
+# Colors of the effects that spawn particles (see _create_battle_effects and damage handling)
+_PARTICLE_COLORS = [
+    (255, 200, 50),   # Battle start
+    (255, 50, 50),    # Slash
+    (200, 50, 50),    # Bite
+    (150, 150, 150),  # Charge
+    (255, 215, 0),    # Victory
+    (100, 100, 100),  # Death
+]
+
+# Strength bonus per team formation
+_FORMATION_BONUS = {
+    'aggressive': 1.5,
+    'defensive': 0.8,
+    'scout': 1.2
+}
+
+# Damage taken per team formation
+_FORMATION_DAMAGE_MULT = {
+    'defensive': 0.7,
+    'aggressive': 1.3,
+    'scout': 1.0
+}
+
+class _Lazy:
+    """String built on first use; battle stories are only read by logs and the event summary."""
+
+    __slots__ = ('_fn', '_value')
+
+    def __init__(self, fn: Callable[[], str]):
+        self._fn = fn
+        self._value = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = self._fn()
+            self._fn = None
+        return self._value
+
+    __repr__ = __str__
+
+
+def _battle_story(winner: Team, loser: Team) -> _Lazy:
+    """Snapshot what a battle story reports now, deferring only the string building.
+
+    Holding the teams instead would tell the story as they are when it's read.
+    """
+    winner_name = winner.get_leader_name()
+    loser_name = loser.get_leader_name()
+    loser_members = [(m.name, m.health > 0) for m in loser.members]
+    return _Lazy(lambda: battle_story_from(winner_name, loser_name, loser_members))
 
 class CombatManager:
-    def __init__(self):
-        self.effect_manager = CombatEffectManager()
+    def __init__(self, seed: Optional[int] = None):
+        # Single RNG stream shared by battle rolls and particle spawning
+        self.rng = np.random.default_rng(seed)
+        self.effect_manager = CombatEffectManager(rng=self.rng)
+        self.effect_manager.prewarm(_PARTICLE_COLORS)
+        self.current_frame_ticks: int = 0  # Stamped by the game loop once per frame
         self.terrain_modifiers = {
             'aquatic': {'aquatic': 1.3, 'default': 0.7},
             'forest': {'forest': 1.2, 'default': 1.0},
@@ -108,6 +165,49 @@ class CombatManager:
             'tentacles': {'damage': 1.2, 'multi_target': True}
         }
 
+        # Flat trait table for the per-member hot path, one row per trait id
+        # ('none' is row 0 and doubles as the fallback for unknown traits)
+        self._trait_ids: Dict[str, int] = {trait: i for i, trait in enumerate(self.combat_traits)}
+        self._trait_abilities: List[Optional[str]] = [
+            trait_data.get('special_ability') for trait_data in self.combat_traits.values()
+        ]
+        bonus_terrains = sorted({
+            terrain
+            for trait_data in self.combat_traits.values()
+            for terrain in trait_data['terrain_bonus']
+            if terrain != 'default'
+        })
+        trait_dtype = np.dtype(
+            [(f'{terrain}_bonus', np.float32) for terrain in bonus_terrains]
+            + [('damage_mult', np.float32), ('team_bonus', np.uint8)]
+        )
+        self._trait_table = np.zeros(len(self.combat_traits), dtype=trait_dtype)
+        for i, trait_data in enumerate(self.combat_traits.values()):
+            ability = trait_data.get('special_ability')
+            ability_effect = trait_data['ability_effect']
+            row = self._trait_table[i]
+            for terrain in bonus_terrains:
+                row[f'{terrain}_bonus'] = trait_data['terrain_bonus'].get(terrain, 1.0)
+            row['damage_mult'] = ability_effect.get('damage', 1.0) if ability else 1.0
+            row['team_bonus'] = bool(ability and ability_effect.get('team_bonus'))
+
+        self._weapon_damage: Dict[str, float] = {
+            weapon: data['damage'] for weapon, data in self.weapon_bonuses.items()
+        }
+
+        # Lookups by bitmask (see combat_codes): the best weapon damage of every
+        # weapon mask, and the trait table row of every trait mask. Only a single
+        # known trait has a row; 'none', unknown and combined traits get row 0
+        masks = np.arange(1 << len(WEAPON_BITS))
+        self._weapon_damage_by_mask = np.ones(masks.shape[0], dtype=np.float32)
+        for weapon, bit in WEAPON_BITS.items():
+            damage = self._weapon_damage.get(weapon, 1.0)
+            np.maximum(self._weapon_damage_by_mask, np.where(masks & bit, damage, 1.0),
+                       out=self._weapon_damage_by_mask)
+        self._trait_row_by_mask = np.zeros(OTHER_TRAITS << 1, dtype=np.intp)
+        for trait in TRAIT_NAMES:
+            self._trait_row_by_mask[TRAIT_BITS[trait]] = self._trait_ids.get(trait, 0)
+
         # Combat state tracking
         self.active_abilities = {}  # Track ability cooldowns
         self.active_status_effects = {}  # Track status effects
@@ -115,10 +215,16 @@ class CombatManager:
 
     def resolve_battle(self, team1: Team, team2: Team) -> Dict:
         """Resolve battle between teams with enhanced combat mechanics."""
-        current_frame = pygame.time.get_ticks() // 16
+        current_frame = self.current_frame_ticks // 16
         team1.last_battle_frame = current_frame
         team2.last_battle_frame = current_frame
 
+        # Determine if battle occurs before paying for the strength calculation
+        battle_chance = self._calculate_battle_chance(team1, team2)
+        
+        if self.rng.random() > battle_chance:
+            return {'result': {'outcome': 'avoided', 'reason': 'Teams avoided conflict'}}
+
         # Get terrain type from first member's position
         terrain_type = self._get_terrain_at_position(team1.members[0]) if team1.members else 'grassland'
 
@@ -127,28 +233,14 @@ class CombatManager:
         t2_strength = self._calculate_team_strength(team2, terrain_type)
 
         # Apply formation multipliers
-        formation_bonuses = {
-            'aggressive': 1.5,
-            'defensive': 0.8,
-            'scout': 1.2
-        }
-        
-        t1_strength *= formation_bonuses.get(team1.formation, 1.0)
-        t2_strength *= formation_bonuses.get(team2.formation, 1.0)
+        t1_strength *= _FORMATION_BONUS.get(team1.formation, 1.0)
+        t2_strength *= _FORMATION_BONUS.get(team2.formation, 1.0)
 
         # Apply random factors
-        t1_strength *= random.uniform(0.9, 1.3)
-        t2_strength *= random.uniform(0.9, 1.3)
-
-        # Determine if battle occurs
-        battle_chance = self._calculate_battle_chance(team1, team2)
-        
-        if random.random() > battle_chance:
-            return {'result': {'outcome': 'avoided', 'reason': 'Teams avoided conflict'}}
+        t1_strength *= self.rng.uniform(0.9, 1.3)
+        t2_strength *= self.rng.uniform(0.9, 1.3)
 
         # Track initial state
-        team1_names = [a.name for a in team1.members]
-        team2_names = [a.name for a in team2.members]
         initial_health = {a.name: a.health for a in team1.members + team2.members}
         
         # Create battle effects
@@ -168,57 +260,34 @@ class CombatManager:
 
     def _calculate_team_strength(self, team: Team, terrain_type: str) -> float:
         """Calculate team strength with enhanced trait and ability modifiers."""
-        total_strength = 0.0
-        team_abilities_active = set()
-        
-        # First pass: check for team-wide abilities
-        for member in team.members:
-            # Get trait data with proper default handling
-            trait_data = self.combat_traits.get(member.combat_traits, self.combat_traits['none'])
-            if trait_data.get('special_ability'):
-                team_abilities_active.add(trait_data['special_ability'])
-        
-        for member in team.members:
-            # Base strength from attack multiplier
-            member_strength = member.attack_multiplier
-            
-            # Apply terrain modifier
-            terrain_mods = self.terrain_modifiers.get(terrain_type, {'default': 1.0})
-            habitat_mod = terrain_mods.get(member.habitat.lower(), terrain_mods['default'])
-            member_strength *= habitat_mod
-            
-            # Apply enhanced combat traits with proper default handling
-            trait_data = self.combat_traits.get(member.combat_traits, self.combat_traits['none'])
-            
-            # Apply terrain bonus from trait
-            terrain_bonus = trait_data['terrain_bonus'].get(terrain_type, 1.0)
-            member_strength *= terrain_bonus
-            
-            # Apply special ability effects
-            ability_effect = trait_data['ability_effect']
-            if trait_data.get('special_ability'):
-                # Apply individual ability effects
-                if 'damage' in ability_effect:
-                    member_strength *= ability_effect['damage']
-                
-                # Apply team-wide ability effects
-                if ability_effect.get('team_bonus') and trait_data['special_ability'] in team_abilities_active:
-                    member_strength *= 1.1  # 10% team synergy bonus
-            
-            # Apply natural weapons bonus
-            weapon_mod = 1.0
-            for weapon in member.natural_weapons:
-                weapon_data = self.weapon_bonuses.get(weapon, {'damage': 1.0})
-                weapon_mod = max(weapon_mod, weapon_data['damage'])
-            member_strength *= weapon_mod
-            
-            # Apply health scaling
-            health_ratio = member.health / member.max_health
-            member_strength *= max(0.5, health_ratio)
-            
-            total_strength += member_strength
-            
-        return total_strength
+        members = team.members
+        n = len(members)
+        if n == 0:
+            return 0.0
+
+        terrain_mods = self.terrain_modifiers.get(terrain_type, {'default': 1.0})
+        default_terrain_mod = terrain_mods['default']
+
+        # Per-member modifiers gathered into arrays, then reduced in one pass
+        attack, health_ratio = team.get_strength_arrays()
+        habitat_mod = np.fromiter(
+            (terrain_mods.get(m.habitat.lower(), default_terrain_mod) for m in members),
+            dtype=np.float32, count=n
+        )
+        weapon_mod = self._weapon_damage_by_mask[
+            np.fromiter((m.weapon_mask for m in members), dtype=np.intp, count=n)
+        ]
+
+        # Trait modifiers are gathers from the trait table
+        traits = self._trait_table[self._trait_row_by_mask[
+            np.fromiter((m.trait_mask for m in members), dtype=np.intp, count=n)
+        ]]
+        trait_mod = traits['damage_mult'] * np.where(traits['team_bonus'], 1.1, 1.0)  # Team ability synergy
+        bonus_field = f'{terrain_type}_bonus'
+        if bonus_field in self._trait_table.dtype.names:
+            trait_mod *= traits[bonus_field]
+
+        return float(np.sum(attack * habitat_mod * trait_mod * weapon_mod * np.maximum(0.5, health_ratio)))
 
     def _calculate_battle_chance(self, team1: Team, team2: Team) -> float:
         """Calculate probability of battle occurring."""
@@ -278,9 +347,8 @@ class CombatManager:
                         self.effect_manager.add_effect(member.x, member.y, 'charge', (150, 150, 150))
                 
                 # Special ability effects
-                trait_data = self.combat_traits.get(member.combat_traits, self.combat_traits['none'])
-                if trait_data['special_ability']:
-                    ability = trait_data['special_ability']
+                ability = self._trait_abilities[self._trait_row_by_mask[member.trait_mask]]
+                if ability:
                     if ability == 'heat_burst':
                         self.effect_manager.add_effect(member.x, member.y, 'burst', (255, 100, 0))
                     elif ability == 'frost_armor':
@@ -302,7 +370,7 @@ class CombatManager:
                 'outcome': 'draw',
                 'team1_casualties': casualties_t1,
                 'team2_casualties': casualties_t2,
-                'details': generate_battle_story(team1, team2, initial_health)
+                'details': _battle_story(team1, team2)
             }
         }
 
@@ -322,45 +390,49 @@ class CombatManager:
                 'winner': winner.get_leader_name(),
                 'loser': loser.get_leader_name(),
                 'casualties': casualties,
-                'details': generate_battle_story(winner, loser, initial_health)
+                'details': _battle_story(winner, loser)
             }
         }
 
     def _apply_team_damage(self, team: Team, min_dmg: int, max_dmg: int, initial_health: Dict, battle_pos: Tuple[float, float]) -> List[str]:
         """Apply damage with formation and terrain modifiers."""
         casualties = []
-        damage_mult = {
-            'defensive': 0.7,
-            'aggressive': 1.3,
-            'scout': 1.0
-        }.get(team.formation, 1.0)
+        damage_mult = _FORMATION_DAMAGE_MULT.get(team.formation, 1.0)
 
         terrain_type = self._get_terrain_at_position(team.members[0]) if team.members else 'grassland'
 
-        for animal in team.members:
-            # Calculate terrain defense bonus
-            terrain_mods = self.terrain_modifiers.get(terrain_type, {'default': 1.0})
-            terrain_def = terrain_mods.get(animal.habitat.lower(), terrain_mods['default'])
-            
-            # Apply damage with modifiers
-            base_dmg = random.randint(min_dmg, max_dmg)
-            actual_dmg = base_dmg * damage_mult / terrain_def
-            
-            # Apply armor and agility modifiers
-            actual_dmg *= (2 - animal.armor_rating)  # Higher armor reduces damage
-            dodge_chance = min(0.3, animal.agility_score / 1000)  # Cap dodge at 30%
-            
-            if random.random() < dodge_chance:
-                actual_dmg *= 0.5  # Partial dodge
-            
-            animal.health = max(0, animal.health - actual_dmg)
-            
-            if animal.health <= 0:
+        terrain_mods = self.terrain_modifiers.get(terrain_type, {'default': 1.0})
+
+        members = team.members
+        n = len(members)
+        if n:
+            # Roll and scale damage for the whole team at once
+            terrain_def = np.fromiter(
+                (terrain_mods.get(a.habitat.lower(), terrain_mods['default']) for a in members),
+                dtype=float, count=n
+            )
+            armor = np.fromiter((a.armor_rating for a in members), dtype=float, count=n)
+            agility = np.fromiter((a.agility_score for a in members), dtype=float, count=n)
+
+            damage = self.rng.integers(min_dmg, max_dmg + 1, size=n) * damage_mult / terrain_def
+            damage *= 2 - armor  # Higher armor reduces damage
+            dodged = self.rng.random(n) < np.fmin(agility / 1000, 0.3)  # Cap dodge at 30%
+            damage[dodged] *= 0.5  # Partial dodge
+
+            health = np.fromiter((a.health for a in members), dtype=float, count=n)
+            health = np.fmax(health - damage, 0)  # NaN damage still kills, as max() did
+            alive = health > 0
+            for animal, new_health in zip(members, health.tolist()):
+                animal.health = new_health
+
+            for i in np.flatnonzero(~alive):
+                animal = members[i]
                 casualties.append(animal.name)
                 # Death effect
                 self.effect_manager.add_effect(animal.x, animal.y, 'special', (100, 100, 100))
+
+            team.compact_members(alive)
         
-        team.members = [m for m in team.members if m.health > 0]
         return casualties
 
     def update(self, dt: float):
@@ -373,16 +445,17 @@ class CombatManager:
 
     def check_territory_conflicts(self, teams: List[Team]) -> None:
         """Check for territory conflicts between teams and initiate battles."""
+        current_frame = self.current_frame_ticks // 16
         for i, team1 in enumerate(teams):
             for team2 in teams[i+1:]:
                 if (team1.check_territory_conflict(team2) and 
-                    team1.is_ready_for_battle(pygame.time.get_ticks() // 16) and 
-                    team2.is_ready_for_battle(pygame.time.get_ticks() // 16)):
+                    team1.is_ready_for_battle(current_frame) and 
+                    team2.is_ready_for_battle(current_frame)):
                     
                     # Calculate battle chance based on territory overlap
                     battle_chance = self._calculate_territory_battle_chance(team1, team2)
                     
-                    if random.random() < battle_chance:
+                    if self.rng.random() < battle_chance:
                         self.resolve_battle(team1, team2)
 
     def _calculate_territory_battle_chance(self, team1: Team, team2: Team) -> float:
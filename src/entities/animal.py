@@ -3,22 +3,281 @@ import math
 import pygame
 from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from src.evolution.genome import Genome
 from src.systems.health_mood_system import HealthMoodSystem
 from src.entities.team import Team
+from src.entities.entity_kinds import ANIMAL, ROBOT
+from src.map.terrain_codes import HABITAT_IDS, SURVIVABLE_TERRAINS, TERRAIN_COMPATIBILITY, TILE_SIZE
+from src.combat.combat_codes import TRAIT_BITS, WEAPON_BITS, trait_mask, weapon_mask
+from src.resources.resource_codes import ANYONE_GATHERS, RESOURCE_BITS, TEAM_MATERIALS
 
 if TYPE_CHECKING:
     from src.entities.team import Team
     from src.resources.resource_system import ResourceSystem
 
 
-class Animal(pygame.sprite.Sprite):
+# Habitat description keywords that mark a terrain as optimal
+_HABITAT_TERRAIN_KEYWORDS = {
+    'aquatic': ['ocean', 'water', 'marine', 'coastal', 'river', 'lake'],
+    'forest': ['forest', 'woodland', 'rainforest', 'jungle'],
+    'mountain': ['mountain', 'alpine', 'highland'],
+    'desert': ['desert', 'arid', 'sand'],
+    'grassland': ['grassland', 'savanna', 'prairie', 'plain'],
+    'wetland': ['swamp', 'marsh', 'wetland', 'mangrove']
+}
+
+# Habitat description keywords that pick the preferred habitat, in priority order;
+# anything else is grassland
+_PREFERRED_HABITAT_KEYWORDS = {
+    'aquatic': ['water', 'marine', 'ocean', 'sea', 'lake', 'river', 'aquatic', 'fish', 'penguin', 'shark', 'whale'],
+    'forest': ['forest', 'jungle', 'woodland'],
+    'mountain': ['mountain', 'alpine', 'highland'],
+    'desert': ['desert', 'arid', 'sand'],
+    'wetland': ['swamp', 'marsh', 'wetland']
+}
+
+
+def _keyword_matcher(keywords_by_terrain: Dict[str, List[str]]):
+    """Compile a keyword table into one regex that finds every occurrence, overlapping ones included.
+
+    Returns the pattern and the keyword -> terrain map for its matches. No
+    keyword is a prefix of another terrain's keyword, so reporting one match
+    per position loses nothing.
+    """
+    terrain_of = {keyword: terrain for terrain, keywords in keywords_by_terrain.items() for keyword in keywords}
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, terrain_of)) + '))')
+    return pattern, terrain_of
+
+
+_OPTIMAL_KEYWORDS_RE, _OPTIMAL_TERRAIN_OF = _keyword_matcher(_HABITAT_TERRAIN_KEYWORDS)
+_PREFERRED_KEYWORDS_RE, _PREFERRED_HABITAT_OF = _keyword_matcher(_PREFERRED_HABITAT_KEYWORDS)
+
+
+@lru_cache(maxsize=1024)
+def _parse_habitat_cached(habitat_str: str, name: str) -> str:
+    """Parse habitat string to determine preferred terrain with improved detection."""
+    # More comprehensive detection for aquatic animals
+    name = name.lower()
+    if 'fish' in name or 'penguin' in name:
+        return 'aquatic'
+
+    found = {_PREFERRED_HABITAT_OF[keyword] for keyword in _PREFERRED_KEYWORDS_RE.findall(habitat_str.lower())}
+    for habitat in _PREFERRED_HABITAT_KEYWORDS:
+        if habitat in found:
+            return habitat
+    return 'grassland'
+
+
+@lru_cache(maxsize=1024)
+def _optimal_terrains_cached(habitat_str: str) -> Tuple[str, ...]:
+    """Get the terrains whose keywords appear in a habitat description."""
+    found = {_OPTIMAL_TERRAIN_OF[keyword] for keyword in _OPTIMAL_KEYWORDS_RE.findall(habitat_str.lower())}
+    optimal_terrains = tuple(terrain for terrain in _HABITAT_TERRAIN_KEYWORDS if terrain in found)
+    return optimal_terrains if optimal_terrains else ('grassland',)  # Default to grassland
+
+_TILE_SHIFT = TILE_SIZE.bit_length() - 1  # log2 of the tile size, for turning non-negative pixels into tiles
+
+# Color names animal data can use; anything else draws brown
+_COLOR_MAP = {
+    'Red': (255, 0, 0),
+    'Green': (0, 255, 0),
+    'Blue': (0, 0, 255),
+    'Yellow': (255, 255, 0),
+    'Brown': (139, 69, 19),
+    'Black': (0, 0, 0),
+    'White': (255, 255, 255),
+    'Gray': (128, 128, 128),
+    'Orange': (255, 165, 0),
+    'Purple': (128, 0, 128)
+}
+
+
+
+def _parse_natural_weapons(weapons) -> Tuple[str, ...]:
+    """Parse a comma-separated natural weapons string (or sequence) into a tuple."""
+    if not weapons or weapons == 'none':
+        return ()
+    if isinstance(weapons, str):
+        weapons = weapons.split(',')
+    return tuple(w.strip() for w in weapons)
+
+
+def _parse_color(color_str: str) -> Tuple[int, int, int]:
+    """Convert color string to RGB tuple."""
+    # Handle multiple colors
+    if ',' in color_str:
+        colors = color_str.split(',')
+        color_str = colors[0].strip()
+
+    return _COLOR_MAP.get(color_str, (139, 69, 19))  # Default to brown
+
+
+# Speed multipliers per terrain: boosted when the habitat description names the
+# keyword, reduced when it doesn't
+_TERRAIN_SPEED_BOOSTS = {
+    'water': ('aquatic', 1.5),
+    'forest': ('forest', 1.3),
+    'grassland': ('grassland', 1.3),
+    'mountain': ('mountain', 1.3),
+    'desert': ('desert', 1.3)
+}
+_TERRAIN_SPEED_PENALTIES = {
+    'water': ('aquatic', 0.5),
+    'mountain': ('mountain', 0.7),
+    'desert': ('desert', 0.8)
+}
+
+
+def _terrain_speed_factors(habitat_str: str) -> Dict[str, float]:
+    """Get the speed multiplier of every terrain that changes speed for a habitat description."""
+    habitat_str = habitat_str.lower()
+    factors = {}
+    for terrain, (keyword, boost) in _TERRAIN_SPEED_BOOSTS.items():
+        if keyword in habitat_str:
+            factors[terrain] = boost
+    for terrain, (keyword, penalty) in _TERRAIN_SPEED_PENALTIES.items():
+        if keyword not in habitat_str:
+            factors[terrain] = factors.get(terrain, 1.0) * penalty
+    return factors
+
+
+@dataclass(frozen=True)
+class SpeciesInfo:
+    """Traits parsed from species data, shared by every animal with the same data."""
+    preferred_habitat: str
+    habitat_id: int
+    survivable: Dict[str, bool]
+    compatibility: Dict[str, str]
+    optimal_terrains: Tuple[str, ...]
+    terrain_speed_factors: Dict[str, float]
+    natural_weapons: Tuple[str, ...]
+    weapon_mask: int
+    color: Tuple[int, int, int]
+    is_social: bool
+    is_carnivore: bool
+    can_eat_plants: bool
+    can_eat_meat: bool
+    gather_mask: int  # RESOURCE_BITS of what the species gathers outside a team
+
+
+@lru_cache(maxsize=1024)
+def _species_info(name: str, habitat: str, habitat_text: str, natural_weapons, color: str,
+                  social_structure: str, diet_type: str) -> SpeciesInfo:
+    """Parse the species-level fields of animal data once per distinct combination."""
+    preferred_habitat = _parse_habitat_cached(habitat, name)
+    habitat_id = HABITAT_IDS[preferred_habitat]
+    diet = diet_type.lower()
+    weapons = _parse_natural_weapons(natural_weapons)
+    can_eat_plants = diet in ('herbivore', 'omnivore')
+    can_eat_meat = diet in ('carnivore', 'omnivore')
+    return SpeciesInfo(
+        preferred_habitat=preferred_habitat,
+        habitat_id=habitat_id,
+        survivable=SURVIVABLE_TERRAINS[habitat_id],
+        compatibility=TERRAIN_COMPATIBILITY[habitat_id],
+        optimal_terrains=_optimal_terrains_cached(habitat),
+        terrain_speed_factors=_terrain_speed_factors(habitat_text),
+        natural_weapons=weapons,
+        weapon_mask=weapon_mask(weapons),
+        color=_parse_color(color),
+        is_social='social' in social_structure.lower(),
+        is_carnivore=diet == 'carnivore',
+        can_eat_plants=can_eat_plants,
+        can_eat_meat=can_eat_meat,
+        gather_mask=(ANYONE_GATHERS | (RESOURCE_BITS['food_plant'] if can_eat_plants else 0)
+                     | (RESOURCE_BITS['food_meat'] if can_eat_meat else 0)),
+    )
+
+@lru_cache(maxsize=None)
+def _load_sprite_cached(name: str) -> pygame.Surface:
+    """Load the sprite for a species once; instances share (and never modify) it."""
+    filename = name.lower().replace(" ", "_") + "_generated.png"
+    path = os.path.join("static", "images", "animals", filename)
+    if os.path.exists(path):
+        sprite = pygame.image.load(path).convert_alpha()
+        return pygame.transform.scale(sprite, (64, 64))
+    sprite = pygame.Surface((64, 64))
+    sprite.fill((random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
+    return sprite
+
+# Fonts per size and rendered label surfaces per (text, size), built on first draw
+_FONTS: Dict[int, pygame.font.Font] = {}
+_LABEL_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}
+
+
+def _render_label(text: str, size: int) -> pygame.Surface:
+    """Get white anti-aliased text, rendered once and reused across frames."""
+    label = _LABEL_CACHE.get((text, size))
+    if label is None:
+        font = _FONTS.get(size)
+        if font is None:
+            font = _FONTS[size] = pygame.font.Font(None, size)
+        label = _LABEL_CACHE[(text, size)] = font.render(text, True, (255, 255, 255))
+    return label
+
+
+_ARROW_SIZE = 6  # Height and width of the health/mood change arrows, 1.5x the bar height
+
+
+@lru_cache(maxsize=None)
+def _arrow_sprite(color: Tuple[int, int, int], up: bool) -> pygame.Surface:
+    """Get a cached colorkeyed up or down arrow, drawn like the polygon in _draw_arrow."""
+    half = _ARROW_SIZE // 2
+    sprite = pygame.Surface((_ARROW_SIZE + 1, _ARROW_SIZE + 1))
+    sprite.set_colorkey((0, 0, 0))
+    if up:
+        points = [(half, 0), (0, _ARROW_SIZE), (_ARROW_SIZE, _ARROW_SIZE)]
+    else:
+        points = [(half, _ARROW_SIZE), (0, 0), (_ARROW_SIZE, 0)]
+    pygame.draw.polygon(sprite, color, points)
+    return sprite
+
+
+def _draw_arrow(screen: pygame.Surface, color: Tuple[int, int, int], x: float, y: float, up: bool) -> None:
+    """Draw an arrow with its point at x, spanning y to y + _ARROW_SIZE."""
+    half = _ARROW_SIZE // 2
+    if x >= half and y >= 0:
+        # polygon() truncates each vertex, which for these positions is the sprite shifted
+        screen.blit(_arrow_sprite(color, up), (int(x) - half, int(y)))
+    elif up:
+        pygame.draw.polygon(screen, color, [(x, y), (x - half, y + _ARROW_SIZE), (x + half, y + _ARROW_SIZE)])
+    else:
+        pygame.draw.polygon(screen, color, [(x, y + _ARROW_SIZE), (x - half, y), (x + half, y)])
+
+
+class Animal:
+    KIND = ANIMAL
+
+    # Slots for every attribute the simulation sets. '__dict__' stays so callers
+    # (and tests) can still attach ad-hoc attributes; it is only allocated on first use.
+    __slots__ = (
+        'name', 'original_data', 'generation', 'age', 'species_info',
+        'x', 'y', 'direction', '_heading', 'speed', 'base_speed', 'rect', 'image', 'size', 'color',
+        'health', 'max_health', 'health_mood_system', 'mood_points', 'max_mood', 'status_effects',
+        'hunger', 'thirst', 'exhaustion', 'social_needs',
+        'state', 'team', 'target', 'world_grid',
+        'attack_multiplier', 'armor_rating', 'agility_score', 'stamina_rating', 'defense',
+        'apex_bonus', 'pack_bonus', '_combat_traits', 'trait_mask', 'natural_weapons', 'weapon_mask',
+        'stamina', 'current_stamina', 'stamina_recovery_rate',
+        'genome', 'maturity_score', 'reproduction_rate', 'social_score', 'generation_time',
+        'predator_pressure', 'height', 'weight',
+        'habitat', 'habitat_id', 'preferred_habitat', '_survivable', '_compatibility', '_optimal_terrains',
+        'effective_speed', 'current_terrain', 'terrain_health_effect', 'terrain_speed_effect', 'terrain_effect_timer', 'terrain_effect_start',
+        'pooled', 'wander_distance', 'seek_target', 'seek_distance', 'flee_from', 'flee_distance',
+        'perception_radius', 'nearest_threat', 'is_social', 'group_distance', 'separation_distance',
+        'group_members', 'resource_target', 'resource_target_type', 'last_resource_search',
+        'resource_search_interval', 'health_threshold',
+        'evolved_habitat_preference', 'team_role', '_being_removed', '__dict__'
+    )
+
     #########################
     # 1. Initialization
     #########################
     def __init__(self, name: str, data: Dict, genome: Optional[Genome] = None, generation: int = 1):
         """Initialize animal with optional genome for evolved instances."""
-        super().__init__()
         self.name = name
         self.original_data = data
         self.generation = generation
@@ -46,11 +305,17 @@ class Animal(pygame.sprite.Sprite):
         # Position and movement
         self.x = 0
         self.y = 0
-        self.dx = 0
-        self.dy = 0
         self.base_speed = float(data.get('Speed_Max', 30)) * (32 / 8)  # Scale speed based on tile size (32px vs original 8px)
         self.speed = self.base_speed  # Current speed (may be modified by terrain)
+        self.effective_speed = self.speed  # Movement speed, with the terrain modifier folded in
         self.direction = random.uniform(0, 2 * math.pi)
+        self._heading = (self.direction, math.cos(self.direction), math.sin(self.direction))  # See _wander
+        self.pooled = False  # When set, AnimalPool applies terrain effects, finds threats, rolls resource searches, updates needs and steps movement in batch
+        self.wander_distance: Optional[float] = None  # Length of a deferred wander step
+        self.seek_target: Optional[Tuple[float, float]] = None  # Goal of a deferred resource step
+        self.seek_distance = 0.0
+        self.flee_from: Optional[Tuple[float, float]] = None  # Threat position of a deferred flee step
+        self.flee_distance = 0.0
         
         # Combat attributes
         self.attack_multiplier = float(data.get('Attack_Multiplier', 1.0))
@@ -68,19 +333,34 @@ class Animal(pygame.sprite.Sprite):
         
         # Environmental attributes
         self.habitat = str(data.get('Habitat', 'Grassland'))
-        self.preferred_habitat = self._parse_habitat(self.habitat)
+        natural_weapons = data.get('Natural_Weapons', '')
+        self.species_info = info = _species_info(
+            name, self.habitat, str(data.get('Habitat', '')),  # Speed factors read the raw description
+            tuple(natural_weapons) if isinstance(natural_weapons, list) else natural_weapons,
+            data.get('Color', 'Brown'), data.get('Social_Structure', ''), data.get('Diet_Type', '')
+        )
+        self.preferred_habitat = info.preferred_habitat
+        self.habitat_id = info.habitat_id
+        self._survivable = info.survivable
+        self._compatibility = info.compatibility
+        self._optimal_terrains = info.optimal_terrains
         self.terrain_health_effect = 0.0  # Default: no effect
         self.terrain_speed_effect = 1.0   # Default: normal speed
         self.current_terrain = None
         self.terrain_effect_timer = 0.0   # Timer for periodic terrain effects
+        self.terrain_effect_start = 0.0   # AnimalPool clock time the timer started, when pooled
         
-        # Handle combat traits with proper validation
-        combat_traits = data.get('Combat_Traits', 'none')
-        if isinstance(combat_traits, list):
-            self.combat_traits = ','.join(combat_traits)
+        # Handle combat traits with proper validation; evolution data takes precedence
+        if 'combat_traits' in data:
+            self.combat_traits = str(data['combat_traits'])
         else:
-            self.combat_traits = str(combat_traits)
-        self.natural_weapons = self._parse_natural_weapons(data.get('Natural_Weapons', ''))
+            combat_traits = data.get('Combat_Traits', 'none')
+            if isinstance(combat_traits, list):
+                self.combat_traits = ','.join(combat_traits)
+            else:
+                self.combat_traits = str(combat_traits)
+        self.natural_weapons = info.natural_weapons
+        self.weapon_mask = info.weapon_mask
         
         # Apply genome if provided
         if genome:
@@ -88,15 +368,10 @@ class Animal(pygame.sprite.Sprite):
             # Revalidate health after genome application
             self.max_health = max(1.0, self.max_health)
             self.health = min(self.max_health, max(0, self.health))
-            
-        # Apply combat traits from evolution data if provided
-        if 'combat_traits' in data:
-            self.combat_traits = str(data['combat_traits'])
-        
+
         # Visual attributes
-        self.color = self._parse_color(data.get('Color', 'Brown'))
+        self.color = info.color
         self.size = max(3, min(15, math.sqrt(float(data.get('Weight_Max', 50))) * 0.5))  # Further reduced size
-        self.draw_surface = self._create_draw_surface()
         
         # General attributes
         h_max = data.get("Height_Max", 50.0)
@@ -109,23 +384,20 @@ class Animal(pygame.sprite.Sprite):
         self.apex_bonus = data.get("Apex_Predator_Bonus", 1.0)
         self.pack_bonus = data.get("Pack_Hunter_Bonus", 1.0)
 
-        # Position and state
+        # Behavior state; heading is self.direction, set with the other movement attributes
         self.state = "wandering"  # Default state
-        self.direction_angle = random.random() * 2 * math.pi
-        self.direction_timer = 2.0
 
         # Health and stamina
         self.stamina = max(1.0, data.get("Stamina_Rating", 50.0))
         self.current_stamina = self.stamina
         self.stamina_recovery_rate = 5.0
 
-        # Team affiliation
-        self.team = None
-
         # Habitat and behavior
-        self.is_social = 'social' in data.get('Social_Structure', '').lower()
+        self.is_social = info.is_social
         self.group_distance = 50 if self.is_social else 100
         self.separation_distance = 20
+        self.perception_radius = 300.0  # Threats farther away than this are ignored
+        self.nearest_threat = None  # Found by AnimalPool each frame when pooled
         self.group_members = []
 
         # Resource seeking behavior
@@ -135,41 +407,48 @@ class Animal(pygame.sprite.Sprite):
         self.resource_search_interval = 5.0  # Search every 5 seconds
         self.health_threshold = 0.5  # Seek resources when health below 50%
 
-        # Visual representation
+        # Visual representation: the shared species sprite is the only thing drawn
         self.image = self._load_sprite()
         self.rect = self.image.get_rect()
         self.rect.center = (self.x, self.y)
 
+    @property
+    def combat_traits(self) -> str:
+        """Comma-joined combat traits; setting it also updates trait_mask."""
+        return self._combat_traits
+
+    @combat_traits.setter
+    def combat_traits(self, traits: str) -> None:
+        self._combat_traits = traits
+        self.trait_mask = trait_mask(traits)
+
+    def has_trait(self, trait: str) -> bool:
+        """Check whether the animal has a combat trait."""
+        bit = TRAIT_BITS.get(trait)
+        if bit is None:
+            return trait in self._combat_traits.split(',')
+        return bool(self.trait_mask & bit)
+
+    def has_weapon(self, weapon: str) -> bool:
+        """Check whether the animal has a natural weapon."""
+        bit = WEAPON_BITS.get(weapon)
+        if bit is None:
+            return weapon in self.natural_weapons
+        return bool(self.weapon_mask & bit)
+
     #########################
     # 2. Core Behavior
     #########################
     
     def _is_valid_position(self, new_x: float, new_y: float, world_grid) -> bool:
         """Check if new position is valid based on terrain. Allows wrapping horizontally but not vertically."""
-        # Check for NaN values first to prevent errors
-        if math.isnan(new_x) or math.isnan(new_y):
-            return False
-            
-        # Get world dimensions
-        world_width = len(world_grid[0])
-        world_height = len(world_grid)
-        
-        # Apply horizontal wrapping
-        grid_x = int(new_x // 32) % world_width
-        
-        # Check vertical bounds with a safety margin
-        grid_y = int(new_y // 32)
-        margin = 1  # One tile margin
-        if not (margin <= grid_y < world_height - margin):
-            return False
-        
-        # Check terrain - allow movement into any terrain, but with consequences
-        try:
-            # We'll still check the terrain type, but we won't restrict movement
-            # The consequences will be applied in _update_terrain_effects
-            return True
-        except IndexError:
-            return False
+        # Horizontal movement always wraps, so only the vertical bounds matter.
+        # Movement into any terrain is allowed; its consequences are applied
+        # in _update_terrain_effects.
+        # The one-tile margin is tested in pixels, so there is no row index to
+        # compute, and NaN coordinates fail the comparisons
+        margin = 1 << _TILE_SHIFT  # One tile margin
+        return new_x == new_x and margin <= new_y < (len(world_grid) << _TILE_SHIFT) - margin
 
     def update(self, dt: float, environment, world_grid, nearby_entities, resource_system=None):
         """Update animal behavior with improved resource handling."""
@@ -177,89 +456,85 @@ class Animal(pygame.sprite.Sprite):
         if self.health <= 0:
             return
             
-        # Update terrain effects
-        self._update_terrain_effects(dt, world_grid)
+        # Update terrain effects; AnimalPool applies them in batch when pooled
+        if not self.pooled:
+            self._update_terrain_effects(dt, world_grid)
         
         # Update movement
         self._update_movement(dt, environment, world_grid, nearby_entities)
         
         # Handle resource gathering if we're at a resource
-        if resource_system and hasattr(self, 'state') and self.state == "at_resource":
+        if resource_system and self.state == "at_resource":
             grid_x, grid_y = int(self.x // 32), int(self.y // 32)
             resources = resource_system.get_resources_at(grid_x, grid_y)
             
+            # Resource types this animal can gather; team members also gather materials
+            gather_mask = self.species_info.gather_mask | (TEAM_MATERIALS if self.team else 0)
             for resource in resources:
-                if resource['amount'] > 0:
-                    # Check if we can gather this resource
-                    can_gather = False
+                resource_type = resource['type']
+                if resource['amount'] > 0 and RESOURCE_BITS.get(resource_type, 0) & gather_mask:
+                    # Gather the resource
+                    gather_amount = min(5, resource['amount'])
+                    actual_gathered = resource_system.gather_resource(
+                        grid_x, grid_y, resource_type, gather_amount
+                    )
                     
-                    if resource['type'] == 'food_plant' and self._can_eat_plants():
-                        can_gather = True
-                    elif resource['type'] == 'food_meat' and self._can_eat_meat():
-                        can_gather = True
-                    elif resource['type'] in ['water', 'medicinal']:
-                        can_gather = True
-                    elif hasattr(self, 'team') and self.team and resource['type'] in ['wood', 'stone', 'minerals']:
-                        can_gather = True
+                    if actual_gathered > 0:
+                        # If in a team, add to team inventory
+                        if self.team:
+                            if hasattr(self.team, 'inventory'):
+                                self.team.inventory[resource_type] += actual_gathered
+                        else:
+                            # Not in a team, use resource directly
+                            if resource_type == 'food_plant':
+                                # Apply effect using health_mood_system
+                                hp_change, mood_change = self.health_mood_system.apply_action('eat_plant', actual_gathered / 5.0)
+                                self.health = min(self.max_health, self.health + hp_change)
+                                self.mood_points = min(self.max_mood, self.mood_points + mood_change)
+                                self.hunger = max(0, self.hunger - actual_gathered * 10)
+                            elif resource_type == 'food_meat':
+                                # Apply effect using health_mood_system
+                                hp_change, mood_change = self.health_mood_system.apply_action('eat_meat', actual_gathered / 5.0)
+                                self.health = min(self.max_health, self.health + hp_change)
+                                self.mood_points = min(self.max_mood, self.mood_points + mood_change)
+                                self.hunger = max(0, self.hunger - actual_gathered * 15)
+                            elif resource_type == 'water':
+                                # Apply effect using health_mood_system
+                                hp_change, mood_change = self.health_mood_system.apply_action('drink_water', actual_gathered / 5.0)
+                                self.health = min(self.max_health, self.health + hp_change)
+                                self.mood_points = min(self.max_mood, self.mood_points + mood_change)
+                                self.thirst = max(0, self.thirst - actual_gathered * 20)
+                            elif resource_type == 'medicinal':
+                                # Apply healing effect
+                                self.heal(actual_gathered * 3)
+                                # Remove negative status effects
+                                if 'injured' in self.status_effects:
+                                    del self.status_effects['injured']
+                                if 'sick' in self.status_effects:
+                                    del self.status_effects['sick']
                         
-                    if can_gather:
-                        # Gather the resource
-                        gather_amount = min(5, resource['amount'])
-                        actual_gathered = resource_system.gather_resource(
-                            grid_x, grid_y, resource['type'], gather_amount
-                        )
+                        # Reset resource target after successful gathering
+                        self.resource_target = None
+                        self.state = "seeking_resource"
                         
-                        if actual_gathered > 0:
-                            # If in a team, add to team inventory
-                            if hasattr(self, 'team') and self.team:
-                                if hasattr(self.team, 'inventory'):
-                                    self.team.inventory[resource['type']] += actual_gathered
-                            else:
-                                # Not in a team, use resource directly
-                                if resource['type'] == 'food_plant' and self._can_eat_plants():
-                                    # Apply effect using health_mood_system
-                                    hp_change, mood_change = self.health_mood_system.apply_action('eat_plant', actual_gathered / 5.0)
-                                    self.health = min(self.max_health, self.health + hp_change)
-                                    self.mood_points = min(self.max_mood, self.mood_points + mood_change)
-                                    self.hunger = max(0, self.hunger - actual_gathered * 10)
-                                elif resource['type'] == 'food_meat' and self._can_eat_meat():
-                                    # Apply effect using health_mood_system
-                                    hp_change, mood_change = self.health_mood_system.apply_action('eat_meat', actual_gathered / 5.0)
-                                    self.health = min(self.max_health, self.health + hp_change)
-                                    self.mood_points = min(self.max_mood, self.mood_points + mood_change)
-                                    self.hunger = max(0, self.hunger - actual_gathered * 15)
-                                elif resource['type'] == 'water':
-                                    # Apply effect using health_mood_system
-                                    hp_change, mood_change = self.health_mood_system.apply_action('drink_water', actual_gathered / 5.0)
-                                    self.health = min(self.max_health, self.health + hp_change)
-                                    self.mood_points = min(self.max_mood, self.mood_points + mood_change)
-                                    self.thirst = max(0, self.thirst - actual_gathered * 20)
-                                elif resource['type'] == 'medicinal':
-                                    # Apply healing effect
-                                    self.heal(actual_gathered * 3)
-                                    # Remove negative status effects
-                                    if 'injured' in self.status_effects:
-                                        del self.status_effects['injured']
-                                    if 'sick' in self.status_effects:
-                                        del self.status_effects['sick']
-                            
-                            # Reset resource target after successful gathering
-                            self.resource_target = None
-                            self.state = "seeking_resource"
-                            
-                            # Look for a new resource after a delay
-                            if resource_system and random.random() < 0.3:
-                                self._find_resource_target(resource_system)
-                            
-                            break
-        
-        # Find new resource targets occasionally
-        if resource_system and random.random() < 0.01:
+                        # Look for a new resource after a delay
+                        if resource_system and random.random() < 0.3:
+                            self._find_resource_target(resource_system)
+                        
+                        break
+        
+        # Find new resource targets occasionally; AnimalPool rolls for this in batch when pooled
+        if resource_system and not self.pooled and random.random() < 0.01:
             self._find_resource_target(resource_system)
 
-        # Update animal needs
-        self._update_needs(dt)
-        
+        # Update animal needs and act on them; AnimalPool updates the needs in
+        # batch when pooled, then runs _update_condition itself
+        if not self.pooled:
+            self._update_needs(dt)
+            self._update_condition(dt, resource_system)
+
+    def _update_condition(self, dt: float, resource_system=None) -> None:
+        """Apply status effects and seek resources based on the freshly updated needs."""
         # Update status effects
         self._update_status_effects(dt)
         
@@ -275,118 +550,131 @@ class Animal(pygame.sprite.Sprite):
 
     def _update_terrain_effects(self, dt: float, world_grid):
         """Apply effects based on the current terrain with more noticeable effects."""
-        # Validate input
-        if dt <= 0 or math.isnan(dt):
+        # Validate input (NaN compares False)
+        if not dt > 0:
             return
             
-        # Get current terrain
+        # Get current terrain; effects and speed only change along with it
         current_terrain = self._get_current_terrain(world_grid)
-        self.current_terrain = current_terrain
-        
-        # Check terrain compatibility
-        compatibility = self._get_terrain_compatibility(current_terrain)
-        
-        # Apply terrain effects based on compatibility
-        if compatibility == 'optimal':
-            # In optimal terrain: health regeneration and normal speed
-            self.terrain_health_effect = 1.0
-            self.terrain_speed_effect = 1.0
-            
+        if current_terrain != self.current_terrain:
+            self.current_terrain = current_terrain
+            compatibility = self._get_terrain_compatibility(current_terrain)
+
+            # Apply terrain effects based on compatibility
+            if compatibility == 'optimal':
+                # In optimal terrain: health regeneration and normal speed
+                self.terrain_health_effect = 1.0
+                self.terrain_speed_effect = 1.0
+            elif compatibility == 'survivable':
+                # In survivable terrain: no health effect, slightly reduced speed
+                self.terrain_health_effect = 0.0
+                self.terrain_speed_effect = 0.8
+                self.terrain_effect_timer = 0.0
+            elif compatibility == 'harmful':
+                # In harmful terrain: health decrease and greatly reduced speed
+                self.terrain_health_effect = -1.0
+                self.terrain_speed_effect = 0.4
+
+            # Apply speed effect with validation
+            base_speed = self.base_speed
+            if base_speed == base_speed:  # Not NaN
+                self.speed = base_speed * self.terrain_speed_effect
+            else:
+                # Reset to default if NaN values are detected
+                self.speed = 30.0  # Default speed
+            self._update_effective_speed()
+
+        health_effect = self.terrain_health_effect
+        if health_effect > 0:
             # Heal slowly in optimal terrain
-            self.terrain_effect_timer += dt
-            if self.terrain_effect_timer >= 5.0:  # Every 5 seconds
+            timer = self.terrain_effect_timer + dt
+            if timer >= 5.0:  # Every 5 seconds
                 self.heal(self.max_health * 0.01)  # Heal 1% of max health
-                self.terrain_effect_timer = 0.0
-                
-        elif compatibility == 'survivable':
-            # In survivable terrain: no health effect, slightly reduced speed
-            self.terrain_health_effect = 0.0
-            self.terrain_speed_effect = 0.8
-            self.terrain_effect_timer = 0.0
-            
-        elif compatibility == 'harmful':
-            # In harmful terrain: health decrease and greatly reduced speed
-            self.terrain_health_effect = -1.0
-            self.terrain_speed_effect = 0.4
-            
+                timer = 0.0
+            self.terrain_effect_timer = timer
+
+        elif health_effect < 0:
             # Take damage in harmful terrain - more damage for aquatic animals on land
-            self.terrain_effect_timer += dt
-            damage_multiplier = 2.0 if self.preferred_habitat == 'aquatic' and current_terrain != 'aquatic' and current_terrain != 'wetland' else 1.0
-            
-            if self.terrain_effect_timer >= 3.0:  # Every 3 seconds
+            timer = self.terrain_effect_timer + dt
+            if timer >= 3.0:  # Every 3 seconds
+                damage_multiplier = 2.0 if self.preferred_habitat == 'aquatic' and current_terrain != 'aquatic' and current_terrain != 'wetland' else 1.0
                 self.take_damage(self.max_health * 0.02 * damage_multiplier)  # Lose 2-4% of max health
-                self.terrain_effect_timer = 0.0
-        
-        # Apply speed effect with validation
-        if not math.isnan(self.base_speed) and not math.isnan(self.terrain_speed_effect):
-            self.speed = self.base_speed * self.terrain_speed_effect
-        else:
-            # Reset to default if NaN values are detected
-            self.speed = 30.0  # Default speed
+                timer = 0.0
+            self.terrain_effect_timer = timer
+
+    def _update_effective_speed(self) -> None:
+        """Fold the terrain speed modifier into effective_speed; call whenever speed or terrain changes."""
+        self.effective_speed = self.speed * self._get_terrain_speed_modifier(self.current_terrain)
 
     def _get_current_terrain(self, world_grid) -> str:
         """Get the current terrain type at the animal's position with horizontal wrapping."""
-        try:
-            # Check for NaN values first to prevent errors
-            if math.isnan(self.x) or math.isnan(self.y):
-                return 'grassland'  # Default if coordinates are invalid
-                
-            # Get world dimensions
-            world_width = len(world_grid[0])
-            world_height = len(world_grid)
-            
-            # Calculate grid position with horizontal wrapping only
-            grid_x = int(self.x // 32) % world_width
-            grid_y = int(self.y // 32)
-            
-            # Check if within vertical bounds
-            if 0 <= grid_y < world_height:
-                return world_grid[grid_y][grid_x]
-            return 'grassland'  # Default if out of vertical bounds
-        except (IndexError, TypeError):
-            return 'grassland'  # Default if error
+        x, y = self.x, self.y
+        # Default if there is no grid, the coordinates are NaN or y is out of
+        # vertical bounds (NaN fails the range test)
+        if not world_grid or x != x or not 0 <= y < len(world_grid) << _TILE_SHIFT:
+            return 'grassland'
+        
+        # Wrap horizontally within the row; shifting only matches flooring for x >= 0
+        row = world_grid[int(y) >> _TILE_SHIFT]
+        grid_x = int(x) >> _TILE_SHIFT if x >= 0 else int(x // TILE_SIZE)
+        return row[grid_x % len(row)]
 
     def _update_movement(self, dt: float, environment, world_grid, nearby_entities) -> None:
         """Update animal movement based on state and surroundings."""
         # Skip movement if part of a team (team will handle movement)
-        if hasattr(self, 'team') and self.team:
+        if self.team:
             return
             
-        # Calculate terrain-adjusted speed
-        terrain = self._get_current_terrain(world_grid)
-        effective_speed = self.speed * self._get_terrain_speed_modifier(terrain)
+        # Terrain-adjusted speed, kept up to date by the terrain effects step
+        effective_speed = self.effective_speed
+        pooled = self.pooled
         
-        # Check for threats first
-        threat = self._find_nearest_threat(nearby_entities)
+        # Check for threats first; pooled animals had theirs found in batch
+        threat = self.nearest_threat if pooled else self._find_nearest_threat(nearby_entities)
         if threat:
             # Flee from threat
             self.state = "fleeing"
-            self._flee(threat, effective_speed, dt)
+            if pooled:
+                # AnimalPool applies the step in batch
+                self.flee_from = (threat.x, threat.y)
+                self.flee_distance = effective_speed * dt
+            else:
+                self._flee(threat, effective_speed, dt)
             return
             
         # Handle resource seeking
-        if self.state == "seeking_resource" and hasattr(self, 'resource_target'):
+        if self.state == "seeking_resource":
             # Move towards resource
             self._move_to_resource(dt, world_grid)
             return
             
         # Default to wandering
         self.state = "wandering"
-        self._wander(world_grid, effective_speed, dt)
+        if pooled:
+            self.wander_distance = effective_speed * dt
+        else:
+            self._wander(world_grid, effective_speed, dt)
 
     def _wander(self, world_grid, effective_speed, dt):
         """Wander around randomly with terrain-adjusted speed."""
+        direction = self.direction
+
         # Change direction occasionally
         if random.random() < 0.02:
-            self.direction += random.uniform(-math.pi/4, math.pi/4)
+            direction += random.uniform(-math.pi/4, math.pi/4)
+            self.direction = direction
             
-        # Calculate movement
-        dx = math.cos(self.direction) * effective_speed * dt
-        dy = math.sin(self.direction) * effective_speed * dt
+        # Calculate movement; the heading's cos/sin are only recomputed after the
+        # direction changes (here or in AnimalPool.step_wander)
+        angle, cos_d, sin_d = self._heading
+        if angle != direction:
+            cos_d = math.cos(direction)
+            sin_d = math.sin(direction)
+            self._heading = (direction, cos_d, sin_d)
         
         # Apply movement if valid position
-        new_x = self.x + dx
-        new_y = self.y + dy
+        new_x = self.x + cos_d * effective_speed * dt
+        new_y = self.y + sin_d * effective_speed * dt
         
         if self._is_valid_position(new_x, new_y, world_grid):
             self.x = new_x
@@ -400,139 +688,53 @@ class Animal(pygame.sprite.Sprite):
         # Calculate direction away from threat
         dx = self.x - threat.x
         dy = self.y - threat.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        dist_sq = dx*dx + dy*dy
         
-        if distance > 0:
-            # Normalize and apply speed
-            dx = dx / distance * effective_speed * dt
-            dy = dy / distance * effective_speed * dt
+        if dist_sq > 0:
+            # Normalize and apply speed with a single reciprocal
+            step = effective_speed * dt / math.sqrt(dist_sq)
             
             # Apply movement
-            self.x += dx
-            self.y += dy
+            self.x += dx * step
+            self.y += dy * step
 
     #########################
     # 3. Group and Terrain Logic
     #########################
     def _find_nearest_threat(self, nearby_entities):
-        """Find the nearest threat entity."""
-        threats = []
-        
+        """Find the nearest threat entity (robots and other carnivores) in one pass."""
+        closest = None
+        min_dist_sq = self.perception_radius * self.perception_radius  # Compare squared, no sqrt
+        x, y = self.x, self.y
+
         for entity in nearby_entities:
-            # Check if entity is a robot
-            if hasattr(entity, '__class__') and entity.__class__.__name__ == 'Robot':
-                threats.append(entity)
+            if entity.KIND != ROBOT and (entity is self or not entity.species_info.is_carnivore):
                 continue
-                
-            # Check if entity is a predator animal
-            if (hasattr(entity, 'original_data') and 
-                entity.original_data.get('Diet_Type', '').lower() == 'carnivore' and
-                entity != self):
-                threats.append(entity)
-        
-        if not threats:
-            return None
-            
-        # Find the closest threat
-        closest = None
-        min_dist = float('inf')
-        
-        for threat in threats:
-            dx = threat.x - self.x
-            dy = threat.y - self.y
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist < min_dist:
-                min_dist = dist
-                closest = threat
-                
+
+            dx = entity.x - x
+            dy = entity.y - y
+            dist_sq = dx*dx + dy*dy
+
+            if dist_sq < min_dist_sq:
+                min_dist_sq = dist_sq
+                closest = entity
+
         return closest
 
     def can_survive_in(self, terrain_type: str) -> bool:
         """Check if the animal can survive in the given terrain."""
-        compatibility = self._get_terrain_compatibility(terrain_type)
-        return compatibility in ['optimal', 'survivable']
+        # No terrain counts as survivable, unknown terrain doesn't
+        return self._survivable.get(terrain_type, not terrain_type)
     
     def _get_terrain_compatibility(self, terrain: str) -> str:
         """Determine if a terrain is optimal, survivable, or harmful for this animal."""
         if not terrain:
             return 'survivable'  # Default if no terrain
-            
-        # Handle transition terrains
-        if terrain in ['forest_edge', 'wooded_hills']:
-            if self.preferred_habitat == 'forest':
-                return 'optimal'
-            elif self.preferred_habitat in ['grassland', 'mountain']:
-                return 'survivable'
-            else:
-                return 'harmful'
-                
-        elif terrain == 'savanna':
-            if self.preferred_habitat in ['grassland', 'desert']:
-                return 'optimal'
-            elif self.preferred_habitat == 'forest':
-                return 'survivable'
-            else:
-                return 'harmful'
-                
-        elif terrain == 'hills':
-            if self.preferred_habitat in ['grassland', 'mountain']:
-                return 'optimal'
-            elif self.preferred_habitat == 'forest':
-                return 'survivable'
-            else:
-                return 'harmful'
-                
-        elif terrain == 'wetland':
-            if self.preferred_habitat in ['aquatic', 'grassland']:
-                return 'optimal'
-            elif self.preferred_habitat == 'forest':
-                return 'survivable'
-            else:
-                return 'harmful'
-                
-        elif terrain == 'beach':
-            if self.preferred_habitat in ['aquatic', 'desert']:
-                return 'optimal'
-            elif self.preferred_habitat == 'grassland':
-                return 'survivable'
-            else:
-                return 'harmful'
-        
-        # Handle base terrains
-        elif terrain == self.preferred_habitat:
-            return 'optimal'
-        elif (
-            (self.preferred_habitat == 'forest' and terrain in ['grassland', 'wetland']) or
-            (self.preferred_habitat == 'grassland' and terrain in ['forest', 'desert', 'wetland']) or
-            (self.preferred_habitat == 'desert' and terrain in ['grassland']) or
-            (self.preferred_habitat == 'mountain' and terrain in ['grassland', 'forest']) or
-            (self.preferred_habitat == 'aquatic' and terrain in ['wetland'])
-        ):
-            return 'survivable'
-        else:
-            return 'harmful'
+        return self._compatibility.get(terrain, 'harmful')  # Unknown terrain is harmful
 
-    def get_optimal_terrains(self) -> List[str]:
-        """Get list of optimal terrains for this animal."""
-        habitat_str = self.original_data.get('Habitat', '').lower()
-        
-        # Direct terrain mappings
-        terrain_mappings = {
-            'aquatic': ['ocean', 'water', 'marine', 'coastal', 'river', 'lake'],
-            'forest': ['forest', 'woodland', 'rainforest', 'jungle'],
-            'mountain': ['mountain', 'alpine', 'highland'],
-            'desert': ['desert', 'arid', 'sand'],
-            'grassland': ['grassland', 'savanna', 'prairie', 'plain'],
-            'wetland': ['swamp', 'marsh', 'wetland', 'mangrove']
-        }
-        
-        optimal_terrains = []
-        for terrain, keywords in terrain_mappings.items():
-            if any(keyword in habitat_str for keyword in keywords):
-                optimal_terrains.append(terrain)
-        
-        return optimal_terrains if optimal_terrains else ['grassland']  # Default to grassland
+    def get_optimal_terrains(self) -> Tuple[str, ...]:
+        """Get the optimal terrains for this animal, computed once at construction."""
+        return self._optimal_terrains
 
     #########################
     # 4. Rendering
@@ -546,10 +748,6 @@ class Animal(pygame.sprite.Sprite):
         if math.isnan(self.x) or math.isnan(self.y):
             return
         
-        # Store camera coordinates for use in other methods
-        self.camera_x = camera_x
-        self.camera_y = camera_y
-        
         # Draw the animal image
         screen.blit(self.image, (self.x - camera_x, self.y - camera_y))
             
@@ -557,12 +755,11 @@ class Animal(pygame.sprite.Sprite):
         self._draw_health_bar(screen, camera_x, camera_y)
 
     def _draw_health_bar(self, screen: pygame.Surface, camera_x: int, camera_y: int):
-        """Draw a health bar above the animal with name, health/mood bars, and change indicators."""
-        # Safety checks for health values
-        if not hasattr(self, 'health') or not hasattr(self, 'max_health'):
-            return
-            
-        if self.health is None or self.max_health is None or self.max_health <= 0:
+        """Draw a health bar above the animal with name, health/mood bars, and change indicators.
+
+        AnimalPool.draw_all draws the same for many animals in batch.
+        """
+        if self.max_health <= 0:
             return
         
         # Define basic dimensions
@@ -586,6 +783,8 @@ class Animal(pygame.sprite.Sprite):
         if not (0 <= mood_ratio <= 1):
             mood_ratio = 0
             
+        label_blits = []
+
         # Calculate fill widths
         health_fill_width = int(bar_width * health_ratio)
         mood_fill_width = int(bar_width * mood_ratio)
@@ -598,7 +797,7 @@ class Animal(pygame.sprite.Sprite):
         reason_y = mood_bar_y + bar_height + 2  # Position for reason text
         
         # Arrow size and position for health
-        arrow_size = bar_height * 1.5  # Smaller arrow
+        arrow_size = _ARROW_SIZE
         health_arrow_x = bar_x - arrow_size - 2  # Position left of health bar
         health_arrow_y = health_bar_y + (bar_height / 2) - (arrow_size / 2)  # Center with health bar
         
@@ -607,14 +806,13 @@ class Animal(pygame.sprite.Sprite):
         mood_arrow_y = mood_bar_y + (bar_height / 2) - (arrow_size / 2)  # Center with mood bar
         
         # Draw name text
-        font = pygame.font.Font(None, 16)  # Small font for name
-        name_surface = font.render(self.name, True, (255, 255, 255))  # White text
+        name_surface = _render_label(self.name, 16)  # Small white text
         name_rect = name_surface.get_rect(center=(bar_x + bar_width//2, name_y + name_height//2))
-        screen.blit(name_surface, name_rect)
+        label_blits.append((name_surface, name_rect))
         
         # Draw health bar
         pygame.draw.rect(screen, (50, 50, 50), [bar_x, health_bar_y, bar_width, bar_height])  # Border
-        
+
         # Health bar colors based on health percentage
         if health_ratio > 0.7:
             health_color = (0, 255, 0)  # Green
@@ -622,43 +820,30 @@ class Animal(pygame.sprite.Sprite):
             health_color = (255, 255, 0)  # Yellow
         else:
             health_color = (255, 0, 0)  # Red
-            
+
         # Draw health fill
         pygame.draw.rect(screen, health_color, [bar_x, health_bar_y, health_fill_width, bar_height])
         
         # Draw HP up/down indicator if health is changing
         health_change_reason = ""
-        if hasattr(self, 'terrain_health_effect'):
-            if self.terrain_health_effect < 0:
-                # Health decreasing - draw down arrow (red)
-                pygame.draw.polygon(screen, (255, 0, 0), [
-                    (health_arrow_x, health_arrow_y + arrow_size),  # Bottom point
-                    (health_arrow_x - arrow_size/2, health_arrow_y),  # Top left
-                    (health_arrow_x + arrow_size/2, health_arrow_y)   # Top right
-                ])
-                health_change_reason = "Terrain"
-            elif self.terrain_health_effect > 0:
-                # Health increasing - draw up arrow (green)
-                pygame.draw.polygon(screen, (0, 255, 0), [
-                    (health_arrow_x, health_arrow_y),            # Top point
-                    (health_arrow_x - arrow_size/2, health_arrow_y + arrow_size),  # Bottom left
-                    (health_arrow_x + arrow_size/2, health_arrow_y + arrow_size)   # Bottom right
-                ])
-                health_change_reason = "Terrain"
+        if self.terrain_health_effect < 0:
+            # Health decreasing - draw down arrow (red)
+            _draw_arrow(screen, (255, 0, 0), health_arrow_x, health_arrow_y, up=False)
+            health_change_reason = "Terrain"
+        elif self.terrain_health_effect > 0:
+            # Health increasing - draw up arrow (green)
+            _draw_arrow(screen, (0, 255, 0), health_arrow_x, health_arrow_y, up=True)
+            health_change_reason = "Terrain"
                 
         # Draw status-based health indicators
         if 'hunger' in self.status_effects or 'thirst' in self.status_effects:
             # These status effects decrease health - draw down arrow
-            pygame.draw.polygon(screen, (255, 0, 0), [
-                (health_arrow_x, health_arrow_y + arrow_size),  # Bottom point
-                (health_arrow_x - arrow_size/2, health_arrow_y),  # Top left
-                (health_arrow_x + arrow_size/2, health_arrow_y)   # Top right
-            ])
+            _draw_arrow(screen, (255, 0, 0), health_arrow_x, health_arrow_y, up=False)
             health_change_reason = "Hunger/Thirst" if not health_change_reason else health_change_reason
         
         # Draw mood bar
         pygame.draw.rect(screen, (50, 50, 50), [bar_x, mood_bar_y, bar_width, bar_height])  # Border
-        
+
         # Mood bar colors based on mood percentage
         if mood_ratio > 0.7:
             mood_color = (0, 200, 255)  # Cyan (happy)
@@ -666,7 +851,7 @@ class Animal(pygame.sprite.Sprite):
             mood_color = (200, 200, 255)  # Light blue (content)
         else:
             mood_color = (150, 50, 255)  # Purple (unhappy)
-            
+
         # Draw mood fill
         pygame.draw.rect(screen, mood_color, [bar_x, mood_bar_y, mood_fill_width, bar_height])
         
@@ -687,18 +872,10 @@ class Animal(pygame.sprite.Sprite):
         # Draw appropriate mood indicator
         if mood_decreasing:
             # Mood decreasing - draw down arrow (purple)
-            pygame.draw.polygon(screen, (150, 50, 255), [
-                (mood_arrow_x, mood_arrow_y + arrow_size),  # Bottom point
-                (mood_arrow_x - arrow_size/2, mood_arrow_y),  # Top left
-                (mood_arrow_x + arrow_size/2, mood_arrow_y)   # Top right
-            ])
+            _draw_arrow(screen, (150, 50, 255), mood_arrow_x, mood_arrow_y, up=False)
         elif mood_increasing:
             # Mood increasing - draw up arrow (cyan)
-            pygame.draw.polygon(screen, (0, 200, 255), [
-                (mood_arrow_x, mood_arrow_y),            # Top point
-                (mood_arrow_x - arrow_size/2, mood_arrow_y + arrow_size),  # Bottom left
-                (mood_arrow_x + arrow_size/2, mood_arrow_y + arrow_size)   # Bottom right
-            ])
+            _draw_arrow(screen, (0, 200, 255), mood_arrow_x, mood_arrow_y, up=True)
         
         # Draw reason text if any health or mood change is happening
         if health_change_reason or mood_change_reason:
@@ -710,15 +887,16 @@ class Animal(pygame.sprite.Sprite):
             else:
                 reason_text = mood_change_reason
                 
-            reason_font = pygame.font.Font(None, 14)  # Even smaller font for reason
-            reason_surface = reason_font.render(reason_text, True, (255, 255, 255))  # White text
+            reason_surface = _render_label(reason_text, 14)  # Even smaller white text
             reason_rect = reason_surface.get_rect(center=(bar_x + bar_width//2, reason_y + 4))
-            screen.blit(reason_surface, reason_rect)
+            label_blits.append((reason_surface, reason_rect))
+
+        screen.blits(label_blits, doreturn=False)
 
     def cleanup(self):
         """Clean up resources associated with the animal."""
         if hasattr(self, 'image'):
-            del self.image  # Delete the sprite image to free memory
+            del self.image  # Only drops this reference; the species' sprite stays cached and shared
         if self.team and not hasattr(self, '_being_removed'):
             self._being_removed = True  # Mark that we're being removed to prevent recursion
             self.team.remove_member(self)
@@ -729,84 +907,9 @@ class Animal(pygame.sprite.Sprite):
     # 5. Utility Methods
     #########################
     def _load_sprite(self):
-        """Load sprite for the animal."""
-        filename = self.name.lower().replace(" ", "_") + "_generated.png"
-        path = os.path.join("static", "images", "animals", filename)
-        if os.path.exists(path):
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, (64, 64))
-            return img
-        else:
-            surf = pygame.Surface((64, 64))
-            surf.fill((random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
-            return surf
-
-    def _parse_habitat(self, habitat_str: str) -> str:
-        """Parse habitat string to determine preferred terrain with improved detection."""
-        habitat_str = habitat_str.lower()
-        
-        # More comprehensive detection for aquatic animals
-        aquatic_keywords = ['water', 'marine', 'ocean', 'sea', 'lake', 'river', 'aquatic', 'fish', 'penguin', 'shark', 'whale']
-        if any(keyword in habitat_str for keyword in aquatic_keywords) or 'fish' in self.name.lower() or 'penguin' in self.name.lower():
-            return 'aquatic'
-        elif 'forest' in habitat_str or 'jungle' in habitat_str or 'woodland' in habitat_str:
-            return 'forest'
-        elif 'mountain' in habitat_str or 'alpine' in habitat_str or 'highland' in habitat_str:
-            return 'mountain'
-        elif 'desert' in habitat_str or 'arid' in habitat_str or 'sand' in habitat_str:
-            return 'desert'
-        elif 'swamp' in habitat_str or 'marsh' in habitat_str or 'wetland' in habitat_str:
-            return 'wetland'
-        return 'grassland'
-
-    def _parse_natural_weapons(self, weapons_str: str) -> List[str]:
-        """Parse natural weapons string into list."""
-        if not weapons_str or weapons_str == 'none':
-            return []
-        return [w.strip() for w in weapons_str.split(',')]
-        
-    def _parse_color(self, color_str: str) -> Tuple[int, int, int]:
-        """Convert color string to RGB tuple."""
-        color_map = {
-            'Red': (255, 0, 0),
-            'Green': (0, 255, 0),
-            'Blue': (0, 0, 255),
-            'Yellow': (255, 255, 0),
-            'Brown': (139, 69, 19),
-            'Black': (0, 0, 0),
-            'White': (255, 255, 255),
-            'Gray': (128, 128, 128),
-            'Orange': (255, 165, 0),
-            'Purple': (128, 0, 128)
-        }
-        
-        # Handle multiple colors
-        if ',' in color_str:
-            colors = color_str.split(',')
-            color_str = colors[0].strip()
-            
-        return color_map.get(color_str, (139, 69, 19))  # Default to brown
-        
-    def _create_draw_surface(self) -> pygame.Surface:
-        """Create the surface for drawing the animal."""
-        size = int(self.size * 2)
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        # Base shape
-        pygame.draw.circle(surface, self.color, (size//2, size//2), self.size)
-        
-        # Generation indicator (darker with higher generation)
-        if self.generation > 1:
-            darkness = min(200, self.generation * 20)
-            pygame.draw.circle(
-                surface,
-                (0, 0, 0, darkness),
-                (size//2, size//2),
-                self.size//2
-            )
-        
-        return surface
-        
+        """Load sprite for the animal, shared by every animal of the same species."""
+        return _load_sprite_cached(self.name)
+
     def _apply_genome(self, genome: Genome) -> None:
         """Apply genome traits with safety checks."""
         if not genome or not genome.genes:
@@ -830,11 +933,15 @@ class Animal(pygame.sprite.Sprite):
         self.health = self.max_health
         
     def take_damage(self, amount: float, attacker=None) -> None:
-        """Take damage with safety checks."""
-        if not isinstance(amount, (int, float)) or math.isnan(amount):
-            return
-            
-        self.health = max(0, min(self.max_health, self.health - amount))
+        """Take damage; amount must be a real number (use take_damage_checked otherwise)."""
+        if self.health <= 0:
+            return  # Dead animals can't be hurt further
+
+        # Clamp to [0, max_health] with plain comparisons (same result as max(0, min(...)))
+        health = self.health - amount
+        if not health < self.max_health:
+            health = self.max_health
+        self.health = health if health > 0 else 0
         
         # Apply the "be_attacked" action effect on mood
         _, mood_change = self.health_mood_system.apply_action('be_attacked', amount / 10.0)
@@ -845,19 +952,25 @@ class Animal(pygame.sprite.Sprite):
             self.status_effects['injured'] = 60.0  # 60 seconds of being injured
         
         # If really low health, add scared status
-        if self.health / self.max_health < 0.3:
+        if self.health < 0.3 * self.max_health:
             self.status_effects['scared'] = 30.0  # 30 seconds of being scared
             
         # If attacked, may add angry status
         if attacker and random.random() < 0.7:
             self.status_effects['angry'] = 30.0  # 30 seconds of being angry
         
+    def take_damage_checked(self, amount: float, attacker=None) -> None:
+        """Take damage from an untrusted amount, ignoring non-numeric and NaN values."""
+        if isinstance(amount, (int, float)) and amount == amount:  # NaN != NaN
+            self.take_damage(amount, attacker)
+
     def heal(self, amount: float) -> None:
         """Heal the animal by the specified amount."""
-        if amount <= 0 or self.health <= 0:
+        if not amount > 0 or self.health <= 0:  # NaN amounts heal nothing
             return
             
-        self.health = min(self.health + amount, self.max_health)
+        health = self.health + amount
+        self.health = self.max_health if self.max_health < health else health
 
         # Add content status effect after healing
         self.status_effects['content'] = 15.0  # 15 seconds of being content
@@ -868,7 +981,7 @@ class Animal(pygame.sprite.Sprite):
     def _find_resource_target(self, resource_system: 'ResourceSystem', specific_type=None):
         """Find a suitable resource target with improved effectiveness."""
         # Skip if already seeking a resource
-        if hasattr(self, 'resource_target') and self.resource_target and hasattr(self, 'resource_target_type'):
+        if self.resource_target:
             # Only override if specific type is provided and different from current target
             if specific_type and specific_type != self.resource_target_type:
                 pass  # Continue with the function to find the specific resource
@@ -883,7 +996,7 @@ class Animal(pygame.sprite.Sprite):
         health_percent = self.health / self.max_health
         
         # Check if animal is in a team
-        in_team = hasattr(self, 'team') and self.team is not None
+        in_team = self.team is not None
         
         # Prioritize resources based on needs
         if health_percent < 0.5:
@@ -927,7 +1040,7 @@ class Animal(pygame.sprite.Sprite):
 
     def _move_to_resource(self, dt: float, world_grid):
         """Move towards a resource target with proper proximity checks."""
-        if not hasattr(self, 'resource_target') or not self.resource_target:
+        if not self.resource_target:
             return
             
         # Calculate target position in world coordinates
@@ -938,7 +1051,7 @@ class Animal(pygame.sprite.Sprite):
         # Calculate direction to target
         dx = target_world_x - self.x
         dy = target_world_y - self.y
-        distance = math.sqrt(dx*dx + dy*dy)
+        dist_sq = dx*dx + dy*dy
         
         # Check if we've reached the resource
         grid_x, grid_y = int(self.x // 32), int(self.y // 32)
@@ -948,14 +1061,17 @@ class Animal(pygame.sprite.Sprite):
             return
             
         # Continue moving towards the resource
-        if distance > 5:
-            # Calculate normalized direction
-            dx /= distance
-            dy /= distance
+        if dist_sq > 25 and self.pooled:
+            # AnimalPool applies the step in batch
+            self.seek_target = (target_world_x, target_world_y)
+            self.seek_distance = self.speed * dt
+        elif dist_sq > 25:
+            # Normalized direction scaled by speed, with a single reciprocal
+            step = self.speed * dt / math.sqrt(dist_sq)
             
             # Calculate new position
-            new_x = self.x + dx * self.speed * dt
-            new_y = self.y + dy * self.speed * dt
+            new_x = self.x + dx * step
+            new_y = self.y + dy * step
             
             # Check if new position is valid
             if self._is_valid_position(new_x, new_y, world_grid):
@@ -974,47 +1090,16 @@ class Animal(pygame.sprite.Sprite):
     
     def _can_eat_plants(self):
         """Check if the animal can eat plant-based food."""
-        diet = self.original_data.get('Diet_Type', '').lower()
-        return diet in ['herbivore', 'omnivore']
+        return self.species_info.can_eat_plants
         
     def _can_eat_meat(self):
         """Check if the animal can eat meat-based food."""
-        diet = self.original_data.get('Diet_Type', '').lower()
-        return diet in ['carnivore', 'omnivore']
+        return self.species_info.can_eat_meat
 
     def _get_terrain_speed_modifier(self, terrain: str) -> float:
         """Calculate speed modifier based on terrain and animal's adaptations."""
-        # Default speed modifier
-        modifier = 1.0
-        
-        # Apply terrain speed effect if available
-        if hasattr(self, 'terrain_speed_effect'):
-            modifier = self.terrain_speed_effect
-            
-        # Apply terrain-specific modifiers based on animal's adaptations
-        if hasattr(self, 'original_data'):
-            habitat = self.original_data.get('Habitat', '').lower()
-            
-            # Boost speed in preferred habitat
-            if 'aquatic' in habitat and terrain == 'water':
-                modifier *= 1.5
-            elif 'forest' in habitat and terrain == 'forest':
-                modifier *= 1.3
-            elif 'grassland' in habitat and terrain == 'grassland':
-                modifier *= 1.3
-            elif 'mountain' in habitat and terrain == 'mountain':
-                modifier *= 1.3
-            elif 'desert' in habitat and terrain == 'desert':
-                modifier *= 1.3
-                
-            # Reduce speed in challenging terrains
-            if 'aquatic' not in habitat and terrain == 'water':
-                modifier *= 0.5
-            elif 'mountain' not in habitat and terrain == 'mountain':
-                modifier *= 0.7
-            elif 'desert' not in habitat and terrain == 'desert':
-                modifier *= 0.8
-                
+        # Terrain speed effect, scaled by the species' boost or penalty for this terrain
+        modifier = self.terrain_speed_effect * self.species_info.terrain_speed_factors.get(terrain, 1.0)
         return max(0.2, min(modifier, 2.0))  # Clamp between 0.2 and 2.0
 
     def eat(self, food_type: str, amount: float):
@@ -1088,8 +1173,9 @@ class Animal(pygame.sprite.Sprite):
             self.health = max(0, min(self.max_health, self.health + hp_change))
             self.mood_points = max(0, min(self.max_mood, self.mood_points + mood_change))
             
-            # Inflict damage on target with reference to attacker
-            target.take_damage(actual_damage, self)
+            # Inflict damage on target with reference to attacker; multipliers come
+            # from species data, so the amount is validated here at the boundary
+            target.take_damage_checked(actual_damage, self)
             
             # If carnivore, reduce hunger from attack (representing feeding)
             if self._can_eat_meat():
@@ -1198,33 +1284,28 @@ class Animal(pygame.sprite.Sprite):
 
     def _update_needs(self, dt: float):
         """Update all needs over time."""
-        # Increase needs over time
-        self.hunger += dt * 2.0  # Units per second
-        self.thirst += dt * 3.0  # Thirst increases faster than hunger
-        self.exhaustion += dt * 1.0  # Units per second
-        self.social_needs += dt * 0.5  # Units per second
-        
-        # Cap values
-        self.hunger = min(100.0, self.hunger)
-        self.thirst = min(100.0, self.thirst)
-        self.exhaustion = min(100.0, self.exhaustion)
-        self.social_needs = min(100.0, self.social_needs)
+        # Increase needs over time, capped at 100; work on locals and store each once
+        self.hunger = hunger = min(100.0, self.hunger + dt * 2.0)  # Units per second
+        self.thirst = thirst = min(100.0, self.thirst + dt * 3.0)  # Thirst increases faster than hunger
+        self.exhaustion = exhaustion = min(100.0, self.exhaustion + dt * 1.0)  # Units per second
+        self.social_needs = min(100.0, self.social_needs + dt * 0.5)  # Units per second
         
         # Apply status effects based on needs
-        if self.hunger > 80:
-            self.status_effects['hunger'] = float('inf')
-        elif self.hunger < 30 and 'hunger' in self.status_effects:
-            del self.status_effects['hunger']
+        status_effects = self.status_effects
+        if hunger > 80:
+            status_effects['hunger'] = math.inf
+        elif hunger < 30 and 'hunger' in status_effects:
+            del status_effects['hunger']
             
-        if self.thirst > 80:
-            self.status_effects['thirst'] = float('inf')
-        elif self.thirst < 30 and 'thirst' in self.status_effects:
-            del self.status_effects['thirst']
+        if thirst > 80:
+            status_effects['thirst'] = math.inf
+        elif thirst < 30 and 'thirst' in status_effects:
+            del status_effects['thirst']
             
-        if self.exhaustion > 80:
-            self.status_effects['exhaustion'] = float('inf')
-        elif self.exhaustion < 30 and 'exhaustion' in self.status_effects:
-            del self.status_effects['exhaustion']
+        if exhaustion > 80:
+            status_effects['exhaustion'] = math.inf
+        elif exhaustion < 30 and 'exhaustion' in status_effects:
+            del status_effects['exhaustion']
 
     def _update_status_effects(self, dt: float):
         """Update all status effects and apply their impacts."""
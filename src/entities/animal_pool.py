@@ -0,0 +1,536 @@
+import math
+import numpy as np
+import pygame
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+from src.map.terrain_codes import (COMPAT, HABITAT_IDS, HARMFUL, OPTIMAL, TERRAIN_IDS, TERRAIN_NAMES, TILE_SIZE,
+                                   encode_world_grid, habitat_compat_grids)
+from src.utils.movement_kernels import flee_step, pick_randomly, seek_step, turn_randomly, wander_step
+from src.utils.proximity_kernels import nearest_threats
+from src.utils.terrain_kernels import sample_terrain
+
+if TYPE_CHECKING:
+    from src.entities.animal import Animal
+
+_OFF_GRID_TERRAIN = TERRAIN_IDS['grassland']  # What Animal reports off the grid
+_AQUATIC = HABITAT_IDS['aquatic']
+
+# Terrain effects indexed by compatibility level - HARMFUL, matching Animal._update_terrain_effects
+TERRAIN_HEALTH_EFFECTS = np.array([-1.0, 0.0, 1.0])
+TERRAIN_SPEED_EFFECTS = np.array([0.4, 0.8, 1.0])
+
+# Health/mood bar layout and colors, matching Animal._draw_health_bar
+BAR_WIDTH = 32
+BAR_HEIGHT = 4
+BAR_BACKGROUND = (50, 50, 50)
+HEALTH_COLORS = ((255, 0, 0), (255, 255, 0), (0, 255, 0))  # Ratio up to 0.3, up to 0.7, above
+MOOD_COLORS = ((150, 50, 255), (200, 200, 255), (0, 200, 255))
+
+# Change arrows as (color, up) by kind, and the statuses that move mood, matching Animal._draw_health_bar
+HEALTH_DOWN, HEALTH_UP, MOOD_DOWN, MOOD_UP = range(4)
+ARROW_KINDS = (((255, 0, 0), False), ((0, 255, 0), True), ((150, 50, 255), False), ((0, 200, 255), True))
+MOOD_UP_STATUSES = frozenset(('content', 'excited'))
+MOOD_DOWN_STATUSES = frozenset(('hunger', 'thirst', 'exhaustion', 'injured', 'sick', 'scared', 'angry'))
+
+
+def _round_half_away(values: np.ndarray) -> np.ndarray:
+    """Round to the nearest int, halves away from zero, as pygame does for float Rect positions."""
+    whole = np.trunc(values)
+    return (whole + np.sign(values) * (np.abs(values - whole) >= 0.5)).astype(np.int64)
+
+
+@lru_cache(maxsize=1024)
+def _status_indicators(statuses: Tuple[str, ...]) -> Tuple[bool, int, str]:
+    """Get what a set of status effects shows: whether hunger/thirst lowers health,
+    the mood arrow kind (-1 for none) and the mood change reason."""
+    mood_up = mood_down = False
+    reason = ""
+    for status in statuses:
+        if status in MOOD_UP_STATUSES:
+            mood_up = True
+            reason = status.capitalize()
+        elif status in MOOD_DOWN_STATUSES:
+            mood_down = True
+            reason = status.capitalize()
+    mood_kind = MOOD_DOWN if mood_down else MOOD_UP if mood_up else -1
+    return 'hunger' in statuses or 'thirst' in statuses, mood_kind, reason
+
+
+@lru_cache(maxsize=None)
+def _bar_strip(color: Tuple[int, int, int]) -> pygame.Surface:
+    """Get a cached full-width bar in one color; fills blit a left part of it."""
+    strip = pygame.Surface((BAR_WIDTH, BAR_HEIGHT))
+    strip.fill(color)
+    return strip
+
+
+class AnimalPool:
+    """Applies terrain effects and finds threats for, steps and draws the animal population in batch.
+
+    Animal attributes stay the source of truth: each step gathers the
+    participating animals into float32 struct-of-arrays form, advances them
+    with a batched kernel (Numba when available), and writes the results back.
+    """
+
+    # Animals farther than this outside the view get a full update only
+    # every OFFSCREEN_INTERVAL frames, covering the time they skipped
+    CAMERA_MARGIN = 256
+    OFFSCREEN_INTERVAL = 4
+
+    # Per-update chance an animal looks for a new resource target, as in Animal.update
+    RESOURCE_SEARCH_CHANCE = 0.01
+
+    def __init__(self, world_grid, rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.clock = 0.0  # Time stepped through by step_terrain_effects; terrain timers start on it
+        self.load_terrain(world_grid)
+
+    def load_terrain(self, world_grid) -> None:
+        """Encode the world grid and precompute per-habitat compatibility grids.
+
+        Call again whenever the world terrain changes.
+        """
+        self.world_grid = world_grid
+        self.world_width = len(world_grid[0])
+        self.world_height = len(world_grid)
+        self.terrain_codes = encode_world_grid(world_grid)
+        self.compat_grids = habitat_compat_grids(self.terrain_codes)
+        self._off_grid_levels = np.ascontiguousarray(COMPAT[:, _OFF_GRID_TERRAIN])
+
+    def sample_terrain(self, animals: List['Animal']) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Look up the terrain under the given animals in one fused pass.
+
+        Sets each animal's current_terrain and returns the terrain codes, their
+        compatibility levels for the animals' habitats, and a mask of the
+        animals whose current_terrain changed.
+        """
+        n = len(animals)
+        xs = np.fromiter((a.x for a in animals), dtype=np.float32, count=n)
+        ys = np.fromiter((a.y for a in animals), dtype=np.float32, count=n)
+        # Positions stay float32: a 19200px-wide world at sub-pixel precision doesn't fit int16
+        habitat = np.fromiter((a.habitat_id for a in animals), dtype=np.int8, count=n)
+
+        # NaN and out-of-bounds rows fall back to grassland, like Animal._get_current_terrain
+        terrain = np.empty(n, dtype=np.int8)
+        level = np.empty(n, dtype=np.int8)
+        sample_terrain(xs, ys, habitat, self.terrain_codes, self.compat_grids, self._off_grid_levels,
+                       _OFF_GRID_TERRAIN, TILE_SIZE, terrain, level)
+
+        changed = []
+        for animal, t in zip(animals, terrain.tolist()):
+            # Codes past TERRAIN_NAMES are unrecognized names; look up the grid's own string
+            name = TERRAIN_NAMES[t] if t < len(TERRAIN_NAMES) else animal._get_current_terrain(self.world_grid)
+            changed.append(name != animal.current_terrain)
+            animal.current_terrain = name
+        return terrain, level, np.array(changed, dtype=np.bool_)
+
+    def step_terrain_effects(self, animals: List['Animal'], dts: List[float], frame_dt: float) -> None:
+        """Apply the terrain effects of every pooled animal in one batched pass.
+
+        Follows Animal._update_terrain_effects, which pooled animals skip;
+        dts holds each animal's own time step and frame_dt advances the clock.
+        Rather than a timer added to every frame, each animal keeps the clock
+        time its terrain timer started (terrain_effect_start), and effects and
+        speed are only rewritten for animals that changed terrain.
+        """
+        self.clock += frame_dt
+        # Select with a flag list and compress rather than building a tuple per animal
+        keep = [a.pooled and a.health > 0 and dt > 0 for a, dt in zip(animals, dts)]  # NaN dt compares False
+        pooled = list(compress(animals, keep))
+        if not pooled:
+            return
+        step_dts = list(compress(dts, keep))
+        clock = self.clock
+
+        terrain, level, changed = self.sample_terrain(pooled)
+        # Optimal terrain heals every 5 seconds and harmful terrain hurts every 3;
+        # survivable terrain holds the timer at zero
+        timed = (level == OPTIMAL) | (level == HARMFUL)
+
+        moved = np.flatnonzero(changed)
+        if moved.shape[0]:
+            health_effect = TERRAIN_HEALTH_EFFECTS[level[moved] - HARMFUL]
+            speed_effect = TERRAIN_SPEED_EFFECTS[level[moved] - HARMFUL]
+            base_speed = np.fromiter((pooled[i].base_speed for i in moved.tolist()), dtype=np.float64,
+                                     count=moved.shape[0])
+            speed = np.where(np.isnan(base_speed), 30.0, base_speed * speed_effect)  # Default speed for NaN
+            for i, h, e, v, t in zip(moved.tolist(), health_effect.tolist(), speed_effect.tolist(),
+                                     speed.tolist(), timed[moved].tolist()):
+                animal = pooled[i]
+                if t and animal.terrain_health_effect == 0.0:
+                    # Leaving survivable terrain starts the timer, counting this step
+                    animal.terrain_effect_start = clock - step_dts[i]
+                animal.terrain_health_effect = h
+                animal.terrain_speed_effect = e
+                animal.speed = v
+                animal._update_effective_speed()
+
+        timed_rows = np.flatnonzero(timed)
+        start = np.fromiter((pooled[i].terrain_effect_start for i in timed_rows.tolist()), dtype=np.float64,
+                            count=timed_rows.shape[0])
+        elapsed = clock - start
+        timed_level = level[timed_rows]
+        heals = timed_rows[(timed_level == OPTIMAL) & (elapsed >= 5.0)].tolist()
+        hurts = timed_rows[(timed_level == HARMFUL) & (elapsed >= 3.0)].tolist()
+        for i in heals + hurts:
+            pooled[i].terrain_effect_start = clock
+
+        if heals:
+            healed = [pooled[i] for i in heals]
+            self.heal(healed, [a.max_health * 0.01 for a in healed])  # Heal 1% of max health
+        # Aquatic animals on dry land lose 4% of max health instead of 2%
+        on_land = (terrain != TERRAIN_IDS['aquatic']) & (terrain != TERRAIN_IDS['wetland'])
+        for i in hurts:
+            animal = pooled[i]
+            multiplier = 2.0 if animal.habitat_id == _AQUATIC and on_land[i] else 1.0
+            animal.take_damage(animal.max_health * 0.02 * multiplier)
+
+    def find_threats(self, animals: List['Animal'], robots: List[Any],
+                     population: Optional[List['Animal']] = None) -> None:
+        """Find the nearest threat of every pooled animal in one batched search.
+
+        Threats are robots and the carnivores of population (default animals),
+        as in Animal._find_nearest_threat, so a subset of the animals can be
+        searched against the whole world; the result is stored in each
+        animal's nearest_threat.
+        """
+        pooled = [a for a in animals if a.pooled and a.health > 0]
+        n = len(pooled)
+        if n == 0:
+            return
+
+        index = {id(a): i for i, a in enumerate(pooled)}
+        carnivores = [a for a in (animals if population is None else population) if a.species_info.is_carnivore]
+        threats = list(robots) + carnivores
+        t = len(threats)
+
+        xs = np.fromiter((a.x for a in pooled), dtype=np.float32, count=n)
+        ys = np.fromiter((a.y for a in pooled), dtype=np.float32, count=n)
+        radius_sq = np.fromiter((a.perception_radius for a in pooled), dtype=np.float32, count=n) ** 2
+        threat_xs = np.fromiter((e.x for e in threats), dtype=np.float32, count=t)
+        threat_ys = np.fromiter((e.y for e in threats), dtype=np.float32, count=t)
+        # Carnivores map back to their own row so they never flee themselves
+        threat_owner = np.full(t, -1, dtype=np.intp)
+        threat_owner[len(robots):] = [index.get(id(a), -1) for a in carnivores]
+
+        nearest = np.empty(n, dtype=np.intp)
+        nearest_threats(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner, nearest)
+
+        for animal, j in zip(pooled, nearest.tolist()):
+            animal.nearest_threat = threats[j] if j >= 0 else None
+
+    def step_flee(self, animals: List['Animal']) -> None:
+        """Move every animal that deferred its flee step this frame away from its threat.
+
+        Like the per-animal step followed by the world constraint, positions
+        wrap horizontally and clamp vertically.
+        """
+        fleeing = [a for a in animals if a.flee_from is not None]
+        n = len(fleeing)
+        if n == 0:
+            return
+
+        xs = np.fromiter((a.x for a in fleeing), dtype=np.float32, count=n)
+        ys = np.fromiter((a.y for a in fleeing), dtype=np.float32, count=n)
+        threat_xs = np.fromiter((a.flee_from[0] for a in fleeing), dtype=np.float32, count=n)
+        threat_ys = np.fromiter((a.flee_from[1] for a in fleeing), dtype=np.float32, count=n)
+        distance = np.fromiter((a.flee_distance for a in fleeing), dtype=np.float32, count=n)
+
+        flee_step(xs, ys, threat_xs, threat_ys, distance, self.world_width, self.world_height, TILE_SIZE)
+
+        for animal, x, y in zip(fleeing, xs.tolist(), ys.tolist()):
+            animal.x = x
+            animal.y = y
+            animal.flee_from = None
+
+    def step_seek(self, animals: List['Animal']) -> None:
+        """Move every animal that deferred its resource-seeking step this frame.
+
+        Animals that can't move toward their target wander instead, so call
+        this before step_wander.
+        """
+        seekers = [a for a in animals if a.seek_target is not None]
+        n = len(seekers)
+        if n == 0:
+            return
+
+        xs = np.fromiter((a.x for a in seekers), dtype=np.float32, count=n)
+        ys = np.fromiter((a.y for a in seekers), dtype=np.float32, count=n)
+        target_xs = np.fromiter((a.seek_target[0] for a in seekers), dtype=np.float32, count=n)
+        target_ys = np.fromiter((a.seek_target[1] for a in seekers), dtype=np.float32, count=n)
+        distance = np.fromiter((a.seek_distance for a in seekers), dtype=np.float32, count=n)
+
+        stuck = np.empty(n, dtype=np.bool_)
+        seek_step(xs, ys, target_xs, target_ys, distance, self.world_height, TILE_SIZE, stuck)
+
+        for animal, x, y, blocked in zip(seekers, xs.tolist(), ys.tolist(), stuck.tolist()):
+            animal.x = x
+            animal.y = y
+            if blocked:
+                animal.wander_distance = animal.seek_distance
+            animal.seek_target = None
+
+    def step_wander(self, animals: List['Animal']) -> None:
+        """Move every animal that deferred its wander step this frame.
+
+        Each animal recorded the distance it covers over its own dt (culled
+        animals tick less often), so the kernel runs with a unit time step.
+        """
+        wanderers = [a for a in animals if a.wander_distance is not None]
+        n = len(wanderers)
+        if n == 0:
+            return
+
+        xs = np.fromiter((a.x for a in wanderers), dtype=np.float32, count=n)
+        ys = np.fromiter((a.y for a in wanderers), dtype=np.float32, count=n)
+        direction = np.fromiter((a.direction for a in wanderers), dtype=np.float32, count=n)
+        distance = np.fromiter((a.wander_distance for a in wanderers), dtype=np.float32, count=n)
+
+        # Random turns touch only the few animals that turn; one batched draw covers the bounces
+        turn_randomly(direction, self.rng)
+        bounce_rolls = self.rng.random(n, dtype=np.float32)
+        wander_step(xs, ys, direction, distance, bounce_rolls, np.float32(1.0),
+                    self.world_width, self.world_height, TILE_SIZE)
+
+        for animal, x, y, d in zip(wanderers, xs.tolist(), ys.tolist(), direction.tolist()):
+            animal.x = x
+            animal.y = y
+            animal.direction = d
+            animal.wander_distance = None
+
+    def step_resource_search(self, animals: List['Animal'], resource_system) -> None:
+        """Start the occasional resource search for animals that updated this frame.
+
+        One batched draw picks the few animals that search (see pick_randomly)
+        instead of rolling for every animal.
+        """
+        for i in np.sort(pick_randomly(len(animals), self.RESOURCE_SEARCH_CHANCE, self.rng)).tolist():
+            animals[i]._find_resource_target(resource_system)
+
+    @staticmethod
+    def step_needs(animals: List['Animal'], dts: List[float], resource_system=None) -> None:
+        """Advance the needs of every pooled animal in one batched pass, then let each act on them.
+
+        Follows Animal._update_needs, which pooled animals skip along with the
+        Animal._update_condition call run here afterwards; dts holds each
+        animal's own time step.
+        """
+        keep = [a.pooled and a.health > 0 for a in animals]
+        pooled = list(compress(animals, keep))
+        n = len(pooled)
+        if n == 0:
+            return
+        step_dts = list(compress(dts, keep))
+        dt = np.array(step_dts, dtype=np.float64)
+
+        # Needs grow by their rate per second, capped at 100 (fmin keeps 100 for NaN, like min)
+        hunger = np.fmin(100.0, np.fromiter((a.hunger for a in pooled), dtype=np.float64, count=n) + dt * 2.0)
+        thirst = np.fmin(100.0, np.fromiter((a.thirst for a in pooled), dtype=np.float64, count=n) + dt * 3.0)
+        exhaustion = np.fmin(100.0, np.fromiter((a.exhaustion for a in pooled), dtype=np.float64, count=n) + dt * 1.0)
+        social = np.fmin(100.0, np.fromiter((a.social_needs for a in pooled), dtype=np.float64, count=n) + dt * 0.5)
+        for animal, h, t, e, s in zip(pooled, hunger.tolist(), thirst.tolist(), exhaustion.tolist(), social.tolist()):
+            animal.hunger = h
+            animal.thirst = t
+            animal.exhaustion = e
+            animal.social_needs = s
+
+        # A need above 80 sets its status effect and one below 30 clears it
+        for status, need in (('hunger', hunger), ('thirst', thirst), ('exhaustion', exhaustion)):
+            for i in np.flatnonzero(need > 80).tolist():
+                pooled[i].status_effects[status] = math.inf
+            for i in np.flatnonzero(need < 30).tolist():
+                pooled[i].status_effects.pop(status, None)
+
+        for animal, step_dt in zip(pooled, step_dts):
+            animal._update_condition(step_dt, resource_system)
+
+    @staticmethod
+    def heal(animals: List['Animal'], amounts) -> None:
+        """Heal many animals at once by the rules of Animal.heal.
+
+        amounts is a single amount for every animal or one per animal; NaN
+        amounts heal nothing. The comparisons mirror Animal.heal's so NaN
+        health and mood land the same way.
+        """
+        n = len(animals)
+        if n == 0:
+            return
+        amount = np.broadcast_to(np.asarray(amounts, dtype=np.float64), (n,))
+        health = np.fromiter((a.health for a in animals), dtype=np.float64, count=n)
+        healed = (amount > 0) & ~(health <= 0)  # NaN amounts compare False, NaN health heals
+        if not healed.any():
+            return
+
+        max_health = np.fromiter((a.max_health for a in animals), dtype=np.float64, count=n)
+        mood = np.fromiter((a.mood_points for a in animals), dtype=np.float64, count=n)
+        max_mood = np.fromiter((a.max_mood for a in animals), dtype=np.float64, count=n)
+        new_health = health + amount
+        new_health = np.where(max_health < new_health, max_health, new_health).tolist()
+        new_mood = mood + amount / 2
+        new_mood = np.where(new_mood < max_mood, new_mood, max_mood).tolist()  # min(max_mood, new_mood)
+
+        for i in np.flatnonzero(healed).tolist():
+            animal = animals[i]
+            animal.health = new_health[i]
+            animal.status_effects['content'] = 15.0  # 15 seconds of being content
+            animal.mood_points = new_mood[i]
+
+    def near_camera(self, animals: List['Animal'], camera_x: float, camera_y: float,
+                    view_width: int, view_height: int, margin: Optional[float] = None) -> np.ndarray:
+        """Get a mask of the animals within margin (default CAMERA_MARGIN) of the view.
+
+        The test accounts for the horizontal world wrap; NaN positions are never near.
+        """
+        if margin is None:
+            margin = self.CAMERA_MARGIN
+        n = len(animals)
+        xs = np.fromiter((a.x for a in animals), dtype=np.float32, count=n)
+        ys = np.fromiter((a.y for a in animals), dtype=np.float32, count=n)
+
+        # Horizontal offset from the view center, wrapped into [-width/2, width/2)
+        width_px = self.world_width * TILE_SIZE
+        offset_x = (xs - (camera_x + view_width / 2) + width_px / 2) % width_px - width_px / 2
+        offset_y = ys - (camera_y + view_height / 2)
+        return ((np.abs(offset_x) <= view_width / 2 + margin) &
+                (np.abs(offset_y) <= view_height / 2 + margin))
+
+    def draw_all(self, screen: pygame.Surface, animals: List['Animal'], camera_x: int, camera_y: int) -> None:
+        """Draw animal sprites in one blits() call, then their health bars, change arrows and labels in one more each."""
+        drawable = [a for a in animals if a.health > 0 and a.x == a.x and a.y == a.y]  # Skip dead/NaN
+        if not drawable:
+            return
+
+        # Depth-sort so animals lower on screen overlap those above them
+        drawable.sort(key=attrgetter('y'))
+        screen.blits([(a.image, (a.x - camera_x, a.y - camera_y)) for a in drawable], doreturn=False)
+
+        # Bars skip the animals Animal._draw_health_bar would (NaN max_health still draws)
+        barred = [a for a in drawable if not a.max_health <= 0]
+        if barred:
+            self._draw_bars(screen, barred, camera_x, camera_y)
+            self._draw_indicators(screen, barred, camera_x, camera_y)
+
+    @staticmethod
+    def _bar_ratio(value: np.ndarray, maximum: np.ndarray) -> np.ndarray:
+        """Get the fill ratio of each bar, clamped the way Animal._draw_health_bar does it.
+
+        The comparisons mirror Python's min()/max() so NaN values land the same way.
+        """
+        value = np.where(maximum < value, maximum, value)
+        value = np.where(value > 0, value, 0)
+        ratio = value / np.where(maximum > 1, maximum, 1)
+        return np.where((ratio >= 0) & (ratio <= 1), ratio, 0)  # Out-of-range and NaN ratios draw empty
+
+    @classmethod
+    def _draw_bars(cls, screen: pygame.Surface, animals: List['Animal'], camera_x: int, camera_y: int) -> None:
+        """Draw the health and mood bars of all animals in one blits() call.
+
+        Backgrounds go first, then health fills, then mood fills, each blitted
+        from a pre-filled strip (fills take a left part of theirs).
+        """
+        n = len(animals)
+        xs = np.fromiter((a.x for a in animals), dtype=np.float64, count=n)
+        ys = np.fromiter((a.y for a in animals), dtype=np.float64, count=n)
+        health = np.fromiter((a.health for a in animals), dtype=np.float64, count=n)
+        max_health = np.fromiter((a.max_health for a in animals), dtype=np.float64, count=n)
+        mood = np.fromiter((a.mood_points for a in animals), dtype=np.float64, count=n)
+        max_mood = np.fromiter((a.max_mood for a in animals), dtype=np.float64, count=n)
+
+        health_ratio = cls._bar_ratio(health, max_health)
+        mood_ratio = cls._bar_ratio(mood, max_mood)
+
+        bar_x = (xs - camera_x - BAR_WIDTH // 2 + 32).tolist()
+        health_y = ys - camera_y - 30 + 10 + 2
+        mood_y = (health_y + BAR_HEIGHT + 2).tolist()
+        health_y = health_y.tolist()
+        health_width = (BAR_WIDTH * health_ratio).astype(np.int64).tolist()
+        mood_width = (BAR_WIDTH * mood_ratio).astype(np.int64).tolist()
+        health_color = [HEALTH_COLORS[i] for i in ((health_ratio > 0.3).astype(np.int8) + (health_ratio > 0.7)).tolist()]
+        mood_color = [MOOD_COLORS[i] for i in ((mood_ratio > 0.3).astype(np.int8) + (mood_ratio > 0.7)).tolist()]
+
+        background = _bar_strip(BAR_BACKGROUND)
+        blit_seq = []
+        for x, hy, my in zip(bar_x, health_y, mood_y):
+            blit_seq.append((background, (x, hy)))
+            blit_seq.append((background, (x, my)))
+        blit_seq.extend((_bar_strip(color), (x, y), (0, 0, w, BAR_HEIGHT))
+                        for x, y, w, color in zip(bar_x, health_y, health_width, health_color))
+        blit_seq.extend((_bar_strip(color), (x, y), (0, 0, w, BAR_HEIGHT))
+                        for x, y, w, color in zip(bar_x, mood_y, mood_width, mood_color))
+        screen.blits(blit_seq, doreturn=False)
+
+    @staticmethod
+    def _draw_indicators(screen: pygame.Surface, animals: List['Animal'], camera_x: int, camera_y: int) -> None:
+        """Draw the change arrows, then the name and reason labels, of all animals in batched blits.
+
+        Follows the non-bar part of Animal._draw_health_bar: positions are
+        computed for every animal at once, and the few arrows drawn as
+        polygons near the screen edge are drawn in sequence between blits.
+        """
+        from src.entities.animal import _ARROW_SIZE, _arrow_sprite, _draw_arrow, _render_label  # Animal imports this module
+
+        n = len(animals)
+        xs = np.fromiter((a.x for a in animals), dtype=np.float64, count=n)
+        ys = np.fromiter((a.y for a in animals), dtype=np.float64, count=n)
+        health_effect = np.fromiter((a.terrain_health_effect for a in animals), dtype=np.float64, count=n)
+        statuses = [_status_indicators(tuple(a.status_effects)) for a in animals]
+
+        bar_x = xs - camera_x - BAR_WIDTH // 2 + 32
+        name_y = ys - camera_y - 30
+        health_y = name_y + 10 + 2
+        mood_y = health_y + BAR_HEIGHT + 2
+        reason_y = mood_y + BAR_HEIGHT + 2
+        arrow_x = bar_x - _ARROW_SIZE - 2
+
+        # Up to three arrows per animal, in drawing order: terrain, hunger/thirst, mood
+        hungry = np.array([s[0] for s in statuses], dtype=np.bool_)
+        kinds = np.stack([
+            np.where(health_effect < 0, HEALTH_DOWN, np.where(health_effect > 0, HEALTH_UP, -1)),
+            np.where(hungry, HEALTH_DOWN, -1),
+            np.array([s[1] for s in statuses], dtype=np.int64),
+        ], axis=1).ravel()
+        health_arrow_y = health_y + BAR_HEIGHT / 2 - _ARROW_SIZE / 2
+        mood_arrow_y = mood_y + BAR_HEIGHT / 2 - _ARROW_SIZE / 2
+        shown = kinds >= 0
+        kinds = kinds[shown].tolist()
+        arrow_xs = np.repeat(arrow_x, 3)[shown]
+        arrow_ys = np.stack([health_arrow_y, health_arrow_y, mood_arrow_y], axis=1).ravel()[shown]
+
+        # Arrows blit as sprites unless too close to the edge (see _draw_arrow)
+        half = _ARROW_SIZE // 2
+        sprites = [_arrow_sprite(color, up) for color, up in ARROW_KINDS]
+        blit_seq = [(sprites[k], (x, y)) for k, x, y in zip(
+            kinds, (np.trunc(arrow_xs).astype(np.int64) - half).tolist(), np.trunc(arrow_ys).astype(np.int64).tolist())]
+        start = 0
+        for i in np.flatnonzero(~((arrow_xs >= half) & (arrow_ys >= 0))).tolist():
+            screen.blits(blit_seq[start:i], doreturn=False)
+            color, up = ARROW_KINDS[kinds[i]]
+            _draw_arrow(screen, color, arrow_xs[i].item(), arrow_ys[i].item(), up)
+            start = i + 1
+        screen.blits(blit_seq[start:], doreturn=False)
+
+        # Labels centered above the bars and below them, rounded like Rect centers
+        center_x = _round_half_away(bar_x + BAR_WIDTH // 2).tolist()
+        name_y = _round_half_away(name_y + 10 // 2).tolist()
+        reason_y = _round_half_away(reason_y + 4).tolist()
+        health_changing = (health_effect < 0) | (health_effect > 0)
+        labels = []
+        for animal, x, ny, ry, terrain, (hunger_or_thirst, _, mood_reason) in zip(
+                animals, center_x, name_y, reason_y, health_changing.tolist(), statuses):
+            label = _render_label(animal.name, 16)
+            width, height = label.get_size()
+            labels.append((label, (x - width // 2, ny - height // 2)))
+
+            health_reason = "Terrain" if terrain else "Hunger/Thirst" if hunger_or_thirst else ""
+            if health_reason and mood_reason:
+                reason = f"{health_reason}, {mood_reason}"
+            else:
+                reason = health_reason or mood_reason
+            if reason:
+                label = _render_label(reason, 14)
+                width, height = label.get_size()
+                labels.append((label, (x - width // 2, ry - height // 2)))
+        screen.blits(labels, doreturn=False)
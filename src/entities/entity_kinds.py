@@ -0,0 +1,5 @@
+"""Integer tags for telling entity classes apart without isinstance or class-name checks."""
+
+# Each entity class sets KIND to one of these
+ANIMAL = 0
+ROBOT = 1
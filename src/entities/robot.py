@@ -1,15 +1,46 @@
 import random
 import math
 import pygame
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional, TYPE_CHECKING
 
 from src.entities.team import Team
+from src.entities.entity_kinds import ROBOT
 
 if TYPE_CHECKING:
     from src.entities.animal import Animal
     from src.resources.resource_system import ResourceSystem
 
+
+@lru_cache(maxsize=None)
+def _load_robot_sprite() -> pygame.Surface:
+    """Load the robot sprite once; every robot shares (and never modifies) it."""
+    try:
+        filename = "static/images/robot/robot.png"
+        try:
+            img = pygame.image.load(filename).convert_alpha()
+            return pygame.transform.scale(img, (128, 128))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error loading sprite from {filename}: {e}")
+            surf = pygame.Surface((128, 128), pygame.SRCALPHA)
+            surf.fill((0, 255, 255))
+            return surf
+    except Exception as e:
+        print(f"Error creating sprite for robot: {e}")
+        surf = pygame.Surface((128, 128), pygame.SRCALPHA)
+        surf.fill((255, 0, 255, 255))
+        return surf
+
+
+@lru_cache(maxsize=None)
+def _render_state_symbol(symbol: str) -> pygame.Surface:
+    """Render a state indicator symbol once; every robot shares it."""
+    return pygame.font.SysFont('Arial', 16).render(symbol, True, (0, 0, 0))
+
+
 class Robot(pygame.sprite.Sprite):
+    KIND = ROBOT
+
     def __init__(self, x: int, y: int):
         super().__init__()
         self.x = x
@@ -92,21 +123,7 @@ class Robot(pygame.sprite.Sprite):
         self.resource_priority = ['food_plant', 'food_meat', 'medicinal', 'wood', 'stone', 'minerals']
 
     def _load_sprite(self) -> pygame.Surface:
-        try:
-            filename = "static/images/robot/robot.png"
-            try:
-                img = pygame.image.load(filename).convert_alpha()
-                return pygame.transform.scale(img, (128, 128))
-            except (pygame.error, FileNotFoundError) as e:
-                print(f"Error loading sprite from {filename}: {e}")
-                surf = pygame.Surface((128, 128), pygame.SRCALPHA)
-                surf.fill((0, 255, 255))
-                return surf
-        except Exception as e:
-            print(f"Error creating sprite for robot: {e}")
-            surf = pygame.Surface((128, 128), pygame.SRCALPHA)
-            surf.fill((255, 0, 255, 255))
-            return surf
+        return _load_robot_sprite()
 
     def _init_strategy(self) -> Dict[str, Any]:
         strategies = {
@@ -219,15 +236,14 @@ class Robot(pygame.sprite.Sprite):
 
     def detect_nearby_animals(self, animals: List['Animal']) -> None:
         self.nearby_animals = []
+        scan_radius_sq = self.scan_radius * self.scan_radius  # Compare squared, no sqrt
         for animal in animals:
             if animal.health <= 0 or animal.team:
                 continue
                 
             dx = animal.x - self.x
             dy = animal.y - self.y
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist <= self.scan_radius:
+            if dx*dx + dy*dy <= scan_radius_sq:
                 self.nearby_animals.append(animal)
         
         # Only log if debug mode is enabled
@@ -376,8 +392,7 @@ class Robot(pygame.sprite.Sprite):
         # Define icons/shapes for different states
         if self.state == 'searching':
             # Draw a question mark
-            font = pygame.font.SysFont('Arial', 16)
-            text = font.render('?', True, (0, 0, 0))
+            text = _render_state_symbol('?')
             bg_size = max(text.get_width(), text.get_height()) + 6
             
             # Draw background circle
@@ -388,8 +403,7 @@ class Robot(pygame.sprite.Sprite):
             
         elif self.state == 'recruiting':
             # Draw a plus sign
-            font = pygame.font.SysFont('Arial', 16)
-            text = font.render('+', True, (0, 0, 0))
+            text = _render_state_symbol('+')
             bg_size = max(text.get_width(), text.get_height()) + 6
             
             # Draw background circle
@@ -464,7 +478,7 @@ class Robot(pygame.sprite.Sprite):
 
     def cleanup(self):
         if hasattr(self, 'image'):
-            del self.image
+            del self.image  # Only drops this reference; the sprite stays cached and shared
 
     def _should_gather_resources(self) -> bool:
         """Determine if the robot should gather resources based on team needs."""
@@ -2,7 +2,9 @@ from typing import List, Tuple, Union, Optional, TYPE_CHECKING
 import pygame
 import random
 import math
+import numpy as np
 from src.entities.team_base import TeamBase
+from src.entities.entity_kinds import ROBOT
 
 if TYPE_CHECKING:
     from src.entities.animal import Animal
@@ -79,7 +81,7 @@ class Team:
         
         # Add leader health if present
         if self.leader:
-            if isinstance(self.leader, Robot):
+            if self.leader.KIND == ROBOT:
                 total += 100  # Robots have fixed health
             else:
                 total += self.leader.health
@@ -94,7 +96,7 @@ class Team:
         if not self.leader:
             return "No Leader"
             
-        if isinstance(self.leader, Robot):
+        if self.leader.KIND == ROBOT:
             return self.leader.name
         
         # Animal leader
@@ -113,6 +115,17 @@ class Team:
             elif random.random() < self.aggression * 0.3:
                 self.formation = random.choice(['aggressive', 'defensive', 'scout'])
 
+    def get_strength_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return per-member attack multipliers and health ratios as arrays."""
+        n = len(self.members)
+        attack = np.fromiter((m.attack_multiplier for m in self.members), dtype=np.float32, count=n)
+        health_ratio = np.fromiter((m.health / m.max_health for m in self.members), dtype=np.float32, count=n)
+        return attack, health_ratio
+
+    def compact_members(self, keep: np.ndarray) -> None:
+        """Keep only the members whose entry in the boolean mask is set."""
+        self.members = [m for m, k in zip(self.members, keep.tolist()) if k]
+
     def calculate_combat_strength(self) -> float:
         """Calculate the total combat strength of the team."""
         base_strength = sum(member.attack_multiplier for member in self.members if member.health > 0)
@@ -234,7 +247,7 @@ class Team:
             return
             
         # Update leader's target to base center
-        if isinstance(self.leader, Robot):
+        if self.leader.KIND == ROBOT:
             self.leader.target_x = self.base.position[0]
             self.leader.target_y = self.base.position[1]
             
@@ -348,7 +361,7 @@ class Team:
         angle_step = 2 * math.pi / len(self.members)
         
         # Calculate base formation point ahead of leader's movement
-        if isinstance(self.leader, Robot):
+        if self.leader.KIND == ROBOT:
             # Use leader's target position to anticipate movement
             lead_x = self.leader.x + (self.leader.target_x - self.leader.x) * 0.5
             lead_y = self.leader.y + (self.leader.target_y - self.leader.y) * 0.5
@@ -369,7 +382,7 @@ class Team:
         active_members = len([m for m in self.members if m.health > 0])
         # Add leader if present (Robot always counts as alive)
         if self.leader:
-            if isinstance(self.leader, Robot) or self.leader.health > 0:
+            if self.leader.KIND == ROBOT or self.leader.health > 0:
                 return active_members + 1
         return active_members
 
@@ -564,9 +577,10 @@ class Team:
             return False
 
         # First check if point is within radius of leader
+        radius_sq = self.territory_radius * self.territory_radius  # Compare squared, no sqrt
         dx = point[0] - self.leader.x
         dy = point[1] - self.leader.y
-        if math.sqrt(dx*dx + dy*dy) <= self.territory_radius:
+        if dx*dx + dy*dy <= radius_sq:
             return True
 
         # Get all active member positions
@@ -596,7 +610,7 @@ class Team:
         for pos in member_positions:
             dx = point[0] - pos[0]
             dy = point[1] - pos[1]
-            if math.sqrt(dx*dx + dy*dy) <= self.territory_radius:
+            if dx*dx + dy*dy <= radius_sq:
                 return True
 
         return False
@@ -613,7 +627,3 @@ class Team:
 
         # Check if territories overlap
         return distance < (self.territory_radius + other_team.territory_radius)
-
-# Import at bottom to avoid circular dependencies
-from .robot import Robot
-from .animal import Animal
\ No newline at end of file
@@ -1,12 +1,33 @@
 from typing import List, Tuple, Optional, TYPE_CHECKING
+from functools import lru_cache
+from itertools import compress
+import numpy as np
 import pygame
 import math
 
+from src.entities.animal_pool import AnimalPool
+
 if TYPE_CHECKING:
     from src.entities.team import Team
     from src.entities.animal import Animal
     from src.entities.robot import Robot
 
+
+@lru_cache(maxsize=None)
+def _fill_scratch(size: Tuple[int, int]) -> pygame.Surface:
+    """Get a transparent screen-sized surface, shared by every base for its fill.
+
+    Callers clear what they drew before returning, so it stays transparent.
+    """
+    return pygame.Surface(size, pygame.SRCALPHA)
+
+
+@lru_cache(maxsize=256)
+def _render_base_label(text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render a base's name label once and reuse it across frames."""
+    return pygame.font.SysFont('Arial', 20).render(text, True, color)
+
+
 class TeamBase:
     def __init__(self, team: 'Team', position: Tuple[float, float], radius: float = 400):
         """Initialize a team base."""
@@ -49,7 +70,7 @@ class TeamBase:
         """Check if a point is inside the base boundaries."""
         dx = point[0] - self.position[0]
         dy = point[1] - self.position[1]
-        return math.sqrt(dx*dx + dy*dy) <= self.radius
+        return dx*dx + dy*dy <= self.radius * self.radius
         
     def add_resource(self, resource_type: str, amount: float) -> float:
         """Add resources to the base storage, returns amount actually stored."""
@@ -69,22 +90,25 @@ class TeamBase:
         
     def update(self, dt: float, is_night: bool) -> None:
         """Update base state."""
-        if is_night:
-            # Heal team members inside the base during night
-            for member in self.team.members:
-                if self.is_point_inside((member.x, member.y)):
-                    healing = 5 * dt * self.get_night_bonus()
-                    member.heal(healing)
+        members = self.team.members
+        if is_night and members:
+            # Heal team members inside the base during night, all in one batch
+            n = len(members)
+            dx = np.fromiter((m.x for m in members), dtype=np.float64, count=n) - self.position[0]
+            dy = np.fromiter((m.y for m in members), dtype=np.float64, count=n) - self.position[1]
+            inside = dx * dx + dy * dy <= self.radius * self.radius
+            AnimalPool.heal(list(compress(members, inside.tolist())), 5 * dt * self.get_night_bonus())
                     
     def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float) -> None:
         """Draw the base on the screen."""
         # Draw base boundary
         points = [(x - camera_x, y - camera_y) for x, y in self.boundary_points]
         if len(points) > 2:
-            # Draw semi-transparent fill
-            base_surface = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-            pygame.draw.polygon(base_surface, (*self.color, 40), points)  # Alpha = 40
-            screen.blit(base_surface, (0, 0))
+            # Draw semi-transparent fill, blitting (then clearing) only the area it covers
+            fill_surface = _fill_scratch(screen.get_size())
+            area = pygame.draw.polygon(fill_surface, (*self.color, 40), points)  # Alpha = 40
+            screen.blit(fill_surface, area, area)
+            fill_surface.fill((0, 0, 0, 0), area)
             
             # Draw border
             pygame.draw.polygon(screen, self.color, points, 2)
@@ -95,6 +119,5 @@ class TeamBase:
             pygame.draw.circle(screen, self.color, (int(center_x), int(center_y)), 8)
             
             # Draw base name
-            font = pygame.font.SysFont('Arial', 20)
-            level_text = font.render(f"Base of {self.team.get_leader_name()}", True, self.color)
+            level_text = _render_base_label(f"Base of {self.team.get_leader_name()}", self.color)
             screen.blit(level_text, (center_x - level_text.get_width()//2, center_y - 30)) 
\ No newline at end of file
@@ -202,10 +202,9 @@ class EnvironmentSystem:
 
     def get_environment_effects(self, tile_x: int, tile_y: int) -> Dict[str, float]:
         """Get current environmental effects for a specific tile with more impactful modifiers."""
-        try:
-            terrain_type = self.world_grid[tile_y][tile_x]
-        except IndexError:
+        if not (0 <= tile_y < len(self.world_grid) and 0 <= tile_x < len(self.world_grid[tile_y])):
             return {'movement_speed': 1.0, 'stamina_drain': 1.0, 'visibility': 1.0}
+        terrain_type = self.world_grid[tile_y][tile_x]
 
         base_effects = self.terrain_effects.get(terrain_type, 
             {'movement_speed': 1.0, 'stamina_drain': 1.0, 'visibility': 1.0})
@@ -2,12 +2,17 @@ import os
 import sys
 import pygame
 import random
+import numpy as np
 import pandas as pd
 import math
-from typing import List, Any, Dict
+import re
+from typing import List, Any, Callable, Dict, Optional
 import time
+from collections import Counter
+from itertools import compress
 
 # Import modules for map, entities, UI, and utilities
+from map.terrain_codes import UNKNOWN_TERRAIN, terrain_color_table
 from map.map_generator import (
     get_spawn_points_by_terrain,
     resample_raster,
@@ -20,6 +25,8 @@ from map.map_generator import (
     TILE_SIZE
 )
 from entities.animal import Animal
+from entities.animal_pool import AnimalPool
+from spatial.hash_grid import SpatialHashGrid
 from entities.robot import Robot
 from entities.team import Team
 from ui.ui_manager import UIManager
@@ -34,6 +41,19 @@ from resources.team_resources import TeamResourceExtension
 from setup.game_setup import setup_player_robot, is_player_robot
 
 
+# Habitat description keywords that pick the spawn terrain, in priority order
+_SPAWN_TERRAIN_KEYWORDS = {
+    'aquatic': ('ocean', 'marine', 'water', 'aquatic', 'sea', 'river', 'lake'),
+    'forest': ('forest', 'woodland', 'jungle', 'rainforest', 'tropical'),
+    'mountain': ('mountain', 'alpine', 'highland', 'cliff', 'rocky'),
+    'desert': ('desert', 'arid', 'sand', 'dune'),
+    'grassland': ('grass', 'savanna', 'plain', 'meadow', 'prairie')
+}
+_SPAWN_TERRAIN_RES = {
+    terrain: re.compile('|'.join(map(re.escape, keywords))) for terrain, keywords in _SPAWN_TERRAIN_KEYWORDS.items()
+}
+
+
 class GameState:
     def __init__(self, screen_width: int, screen_height: int):
         """Initialize the game state."""
@@ -68,6 +88,7 @@ class GameState:
 
         # Weather and environment visualization
         self.particles = []
+        self.particle_dots: Dict[tuple, pygame.Surface] = {}  # Filled circle sprites per (color, radius)
         self.effect_overlays = self._create_effect_overlays()
         
         # Load map and terrain data
@@ -82,6 +103,8 @@ class GameState:
             self.land_gdf, (WORLD_HEIGHT, WORLD_WIDTH), self.new_transform
         )
         self.world_grid = self._initialize_world()
+        self.animal_pool = AnimalPool(self.world_grid)
+        self.animal_grid = SpatialHashGrid(cell_size=300)  # Matches the robots' scan and recruitment radius
 
         # Load animal data
         self.processed_animals = pd.read_csv('data/processed_animals.csv')
@@ -115,6 +138,7 @@ class GameState:
             'pixel_width': WORLD_WIDTH * TILE_SIZE,
             'pixel_height': WORLD_HEIGHT * TILE_SIZE
         }
+        self.tile_colors = terrain_color_table(tile_mapping)  # Indexed by the pool's terrain codes
 
         # Initialize resource system
         self.resource_system = ResourceSystem(self.world_grid)
@@ -456,6 +480,7 @@ class GameState:
                     animal.y = max(safe_margin, min(animal.y, world_height_px - safe_margin))
                     
                     animal.world_grid = self.world_grid
+                    animal.pooled = True
                     animals.append(animal)
                     
                     # Update counters
@@ -493,6 +518,7 @@ class GameState:
                     animal.y = max(safe_margin, min(animal.y, world_height_px - safe_margin))
                     
                     animal.world_grid = self.world_grid
+                    animal.pooled = True
                     animals.append(animal)
                     
                     # Update counters
@@ -551,6 +577,7 @@ class GameState:
             animal.y = max(safe_margin, min(animal.y, world_height_px - safe_margin))
             
             animal.world_grid = self.world_grid
+            animal.pooled = True
             animals.append(animal)
             
             # Update counters
@@ -573,27 +600,10 @@ class GameState:
     def _get_terrain_for_habitat(self, habitat: str) -> str:
         """Map habitat description to terrain type with improved matching."""
         habitat = habitat.lower()
-        
-        # Aquatic habitats
-        if any(term in habitat for term in ['ocean', 'marine', 'water', 'aquatic', 'sea', 'river', 'lake']):
-            return 'aquatic'
-        
-        # Forest habitats
-        elif any(term in habitat for term in ['forest', 'woodland', 'jungle', 'rainforest', 'tropical']):
-            return 'forest'
-        
-        # Mountain habitats
-        elif any(term in habitat for term in ['mountain', 'alpine', 'highland', 'cliff', 'rocky']):
-            return 'mountain'
-        
-        # Desert habitats
-        elif any(term in habitat for term in ['desert', 'arid', 'sand', 'dune']):
-            return 'desert'
-        
-        # Grassland habitats (default if no other match)
-        elif any(term in habitat for term in ['grass', 'savanna', 'plain', 'meadow', 'prairie']):
-            return 'grassland'
-        
+        for terrain, pattern in _SPAWN_TERRAIN_RES.items():
+            if pattern.search(habitat):
+                return terrain
+
         # Default to grassland if no clear match
         return 'grassland'
 
@@ -683,6 +693,8 @@ class GameState:
     def _handle_recruitment(self) -> None:
         """Handle the recruitment of animals into teams."""
         recruitment_radius = 300
+        recruitment_radius_sq = recruitment_radius * recruitment_radius  # Compare squared, no sqrt
+        nearby_animals = None
 
         for robot in self.robots:
             if robot.state == 'recruiting':
@@ -693,14 +705,18 @@ class GameState:
                 animals_to_add = []
                 current_team_ids = {id(m) for m in robot.team.members} if robot.team else set()
 
-                for animal in self.animals:
+                # Bucket the animals on the first recruiting robot only
+                if nearby_animals is None:
+                    nearby_animals = self._recruitable_animals_near()
+                for animal in nearby_animals(robot.x, robot.y, recruitment_radius):
                     if not animal.team and animal.health > 0:
                         # Skip if animal was already in this team
                         if id(animal) in current_team_ids:
                             continue
                             
-                        dist = math.sqrt((animal.x - robot.x) ** 2 + (animal.y - robot.y) ** 2)
-                        if dist < recruitment_radius:
+                        dx = animal.x - robot.x
+                        dy = animal.y - robot.y
+                        if dx*dx + dy*dy < recruitment_radius_sq:
                             animals_to_add.append(animal)
 
                 if animals_to_add:
@@ -720,6 +736,19 @@ class GameState:
                         robot.state = 'leading'
                         robot.set_team_status(True)
 
+    def _recruitable_animals_near(self) -> Callable[[float, float, float], List['Animal']]:
+        """Bucket the living animals without a team and get a function finding those near a point.
+
+        The function takes (x, y, radius) and returns a superset of the animals
+        within radius, in self.animals order; callers still do the exact tests.
+        Below SpatialHashGrid.MIN_POPULATION it returns all of them.
+        """
+        recruitable = [a for a in self.animals if a.health > 0 and not a.team]
+        if len(recruitable) < SpatialHashGrid.MIN_POPULATION:
+            return lambda x, y, radius: recruitable
+        self.animal_grid.rebuild(recruitable)
+        return self.animal_grid.query_in_order
+
     def _handle_battles(self) -> None:
         """Handle battles between nearby teams and territory conflicts."""
         battle_range = 600.0
@@ -816,6 +845,7 @@ class GameState:
         
         # Update systems
         self.environment_system.update(dt)
+        self.combat_manager.current_frame_ticks = pygame.time.get_ticks()
         self.combat_manager.update(dt)
         self.resource_system.update(dt)
         
@@ -830,9 +860,10 @@ class GameState:
             if avg_fps < 15:
                 do_full_update = (self.frame_count % 2 == 0)
         
-        # Always update robots
+        # Always update robots; each scans only the recruitable animals in the cells around it
+        nearby_animals = self._recruitable_animals_near()
         for robot in self.robots:
-            robot.detect_nearby_animals(self.animals)
+            robot.detect_nearby_animals(nearby_animals(robot.x, robot.y, robot.scan_radius))
             robot.update(dt, self.robots, self.resource_system)
             self._constrain_to_world(robot)
             if not robot.team or len(robot.team.members) == 0:
@@ -849,44 +880,87 @@ class GameState:
                     team.update(dt)
                     TeamResourceExtension.update_team_resources(team, dt, self.resource_system)
                     
-            # Update animals and handle breeding
-            for i, animal1 in enumerate(self.animals):
-                if animal1.health > 0:
-                    animal1.update(dt, self.environment_system, self.world_grid, self.animals + self.robots, self.resource_system)
-                    self._constrain_to_world(animal1)
-                    
-                    # Check for breeding opportunities
-                    if not animal1.team and self.frame_count % 10 == 0:
-                        for animal2 in self.animals[i+1:]:
-                            if (animal2.health > 0 and not animal2.team and 
-                                self._are_animals_close(animal1, animal2, 50)):
-                                current_pop = sum(1 for a in self.animals 
-                                              if a.name == animal1.name and a.health > 0)
-                                if self.evolution_manager.should_reproduce(animal1, animal2, current_pop):
-                                    self._handle_reproduction(animal1, animal2)
-
-                    # New behavior logic
-                    if animal1.hunger > 70:
-                        # Find food and eat
-                        animal1.eat('plant', 10)  # Example action
-                    if animal1.thirst > 70:
-                        # Find water and drink
-                        animal1.drink(10)  # Example action
-                    if animal1.exhaustion > 70:
-                        # Find a safe place to sleep
-                        animal1.sleep(5)  # Example action
-                    if animal1.social_needs > 70:
-                        # Find other animals to team up with
-                        for animal2 in self.animals[i+1:]:
-                            if animal2.health > 0 and not animal2.team:
-                                animal1.team_up(animal2)
-                                break
+            # Animals away from the camera tick every OFFSCREEN_INTERVAL frames,
+            # staggered by index, with the time they skipped
+            near_camera = self.animal_pool.near_camera(
+                self.animals, self.camera_x, self.camera_y, self.screen_width, self.screen_height
+            ).tolist()
+            interval = AnimalPool.OFFSCREEN_INTERVAL
+            ticking = []
+            step_dts = []
+            for i, animal in enumerate(self.animals):
+                if animal.health <= 0:
+                    continue
+                if near_camera[i]:
+                    step_dts.append(dt)
+                elif (i + self.frame_count) % interval == 0:
+                    step_dts.append(dt * interval)
+                else:
+                    continue
+                ticking.append(animal)
+
+            # Apply terrain effects and find threats in batch for just the pooled
+            # animals ticking this frame, searched against every carnivore; only
+            # animals outside the pool scan the entity list themselves
+            entities = self.animals + self.robots
+            self.animal_pool.step_terrain_effects(ticking, step_dts, dt)
+            self.animal_pool.find_threats(ticking, self.robots, self.animals)
+
+            # Update animals
+            for animal, step_dt in zip(ticking, step_dts):
+                animal.update(step_dt, self.environment_system, self.world_grid, entities, self.resource_system)
+                self._constrain_to_world(animal)
+            if self.resource_system:
+                self.animal_pool.step_resource_search(ticking, self.resource_system)
+            self.animal_pool.step_needs(ticking, step_dts, self.resource_system)
+
+            # Check for breeding opportunities every 10 frames; partners come from
+            # the animals without a team (in list order), and species counts are
+            # kept in a running tally
+            if self.frame_count % 10 == 0:
+                solo = [a for a in self.animals if not a.team]
+                population = Counter(a.name for a in self.animals if a.health > 0)
+                for k, animal1 in enumerate(solo):
+                    if animal1.health <= 0 or animal1.team:
+                        continue
+                    for animal2 in solo[k + 1:]:
+                        if (animal2.health > 0 and not animal2.team and 
+                            self._are_animals_close(animal1, animal2, 50)):
+                            if self.evolution_manager.should_reproduce(animal1, animal2, population[animal1.name]):
+                                if self._handle_reproduction(animal1, animal2) is not None:
+                                    population[animal1.name] += 1
+
+            # New behavior logic, one pass per need over the living animals
+            alive = [a for a in self.animals if a.health > 0]
+            for animal in alive:
+                if animal.hunger > 70:
+                    # Find food and eat
+                    animal.eat('plant', 10)  # Example action
+            for animal in alive:
+                if animal.thirst > 70:
+                    # Find water and drink
+                    animal.drink(10)  # Example action
+            for animal in alive:
+                if animal.exhaustion > 70:
+                    # Find a safe place to sleep
+                    animal.sleep(5)  # Example action
+            for i, animal1 in enumerate(alive):
+                if animal1.social_needs > 70:
+                    # Find other animals to team up with
+                    for animal2 in alive[i+1:]:
+                        if animal2.health > 0 and not animal2.team:
+                            animal1.team_up(animal2)
+                            break
+
+            # Fleeing animals, resource seekers, then wandering animals, move together in batched steps
+            self.animal_pool.step_flee(self.animals)
+            self.animal_pool.step_seek(self.animals)
+            self.animal_pool.step_wander(self.animals)
         else:
-            # Simplified update for animals when FPS is low
+            # Simplified update for animals when FPS is low: they hold position
+            # until the next full update, so only keep them inside the world
             for animal in self.animals:
                 if animal.health > 0:
-                    animal.x += animal.dx * dt
-                    animal.y += animal.dy * dt
                     self._constrain_to_world(animal)
 
         # These operations should run every frame for gameplay consistency
@@ -910,8 +984,8 @@ class GameState:
         # Constrain vertically (top/bottom)
         entity.y = max(32, min(entity.y, world_height_px - 64))
 
-    def _handle_reproduction(self, parent1: 'Animal', parent2: 'Animal') -> None:
-        """Handle reproduction between two animals."""
+    def _handle_reproduction(self, parent1: 'Animal', parent2: 'Animal') -> Optional['Animal']:
+        """Handle reproduction between two animals, returning the offspring if one was born."""
         # Get offspring traits from evolution manager
         offspring_data = self.evolution_manager.create_offspring(parent1, parent2)
         
@@ -935,6 +1009,7 @@ class GameState:
             offspring.x = spawn_x
             offspring.y = spawn_y
             offspring.world_grid = self.world_grid
+            offspring.pooled = True
             
             # Add to simulation
             self.animals.append(offspring)
@@ -943,12 +1018,14 @@ class GameState:
             species_pop = sum(1 for a in self.animals if a.name == parent1.name)
             if parent1.name in self.evolution_manager.species_stats:
                 self.evolution_manager.species_stats[parent1.name]['population_history'].append(species_pop)
+            return offspring
+        return None
 
     def _are_animals_close(self, animal1: 'Animal', animal2: 'Animal', distance: float) -> bool:
         """Check if two animals are within breeding distance."""
         dx = animal1.x - animal2.x
         dy = animal1.y - animal2.y
-        return math.sqrt(dx*dx + dy*dy) <= distance
+        return dx*dx + dy*dy <= distance * distance
 
     def handle_input(self) -> bool:
         """Handle user input."""
@@ -989,7 +1066,7 @@ class GameState:
             if animal.health > 0:
                 dx = world_x - animal.x
                 dy = world_y - animal.y
-                if math.sqrt(dx*dx + dy*dy) < 32:  # Radius for interaction
+                if dx*dx + dy*dy < 32 * 32:  # Radius for interaction
                     tooltip_text = self._get_entity_tooltip(animal)
                     self.ui_manager.active_tooltip = {
                         'text': tooltip_text,
@@ -1000,7 +1077,7 @@ class GameState:
         for robot in self.robots:
             dx = world_x - robot.x
             dy = world_y - robot.y
-            if math.sqrt(dx*dx + dy*dy) < 32:
+            if dx*dx + dy*dy < 32 * 32:
                 tooltip_text = self._get_entity_tooltip(robot)
                 self.ui_manager.active_tooltip = {
                     'text': tooltip_text,
@@ -1085,23 +1162,12 @@ class GameState:
             if team.base_established:
                 team.base.draw(self.screen, self.camera_x, self.camera_y)
         
-        # Draw visible animals
-        visible_animals = []
-        for animal in self.animals:
-            if animal.health > 0:
-                animal_x = animal.x
-                if abs(animal_x - self.camera_x) > self.width / 2:
-                    if animal_x > self.camera_x:
-                        animal_x -= self.width
-                    else:
-                        animal_x += self.width
-                    
-                if (visible_min_x <= animal_x <= visible_max_x and 
-                    visible_min_y <= animal.y <= visible_max_y):
-                    visible_animals.append(animal)
-        
-        for animal in visible_animals:
-            animal.draw(self.screen, self.camera_x, self.camera_y, self.ui_manager.show_health_bars)
+        # Draw visible animals, culled in one vectorized pass (draw_all skips the dead)
+        visible = self.animal_pool.near_camera(
+            self.animals, self.camera_x, self.camera_y, self.screen_width, self.screen_height, margin=TILE_SIZE
+        )
+        visible_animals = list(compress(self.animals, visible.tolist()))
+        self.animal_pool.draw_all(self.screen, visible_animals, self.camera_x, self.camera_y)
         
         # Draw robots
         for robot in self.robots:
@@ -1174,26 +1240,25 @@ class GameState:
         start_y_raw = max(0, int(self.camera_y // TILE_SIZE))
         end_y_raw = min(WORLD_HEIGHT, int((self.camera_y + self.screen_height) // TILE_SIZE + 1))
         
-        # Get world dimensions in tiles
-        world_width_tiles = WORLD_WIDTH
+        if end_x_raw <= start_x_raw or end_y_raw <= start_y_raw:
+            return
         
-        # Draw tiles in the visible range, wrapping horizontally but not vertically
-        for y in range(start_y_raw, end_y_raw):
-            for x_offset in range(start_x_raw, end_x_raw):
-                # Apply horizontal wrapping
-                x = x_offset % world_width_tiles
-                
-                # Get tile and color
-                tile = self.world_grid[y][x]
-                color = self.world_data['colors'].get(tile, (100, 100, 100))
-                
-                # Calculate screen position, accounting for wrapping
-                screen_x = int(x_offset * TILE_SIZE - self.camera_x)
-                screen_y = int(y * TILE_SIZE - self.camera_y)
-                
-                # Draw the tile
-                rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
-                pygame.draw.rect(self.screen, color, rect)
+        # Look up the visible tiles' colors by terrain code, wrapping horizontally but not vertically
+        columns = np.arange(start_x_raw, end_x_raw) % WORLD_WIDTH
+        codes = self.animal_pool.terrain_codes[start_y_raw:end_y_raw][:, columns]
+        colors = self.tile_colors[codes]
+        for y, x in zip(*np.nonzero(codes == UNKNOWN_TERRAIN)):
+            # Unrecognized names can still have their own color
+            tile = self.world_grid[start_y_raw + y][columns[x]]
+            colors[y, x] = self.world_data['colors'].get(tile, (100, 100, 100))
+        
+        # Draw them as one tile-per-pixel surface scaled up to the tile size. Only the
+        # first tile can start left of (or above) the screen, so flooring its
+        # position lines every later tile up on whole pixels
+        tiles = pygame.surfarray.make_surface(colors.transpose(1, 0, 2))
+        tiles = pygame.transform.scale(tiles, (tiles.get_width() * TILE_SIZE, tiles.get_height() * TILE_SIZE))
+        self.screen.blit(tiles, (math.floor(start_x_raw * TILE_SIZE - self.camera_x),
+                                 math.floor(start_y_raw * TILE_SIZE - self.camera_y)))
 
     def _draw_weather_effects(self) -> None:
         """Draw weather effects based on environment conditions with horizontal wrapping only."""
@@ -1210,11 +1275,12 @@ class GameState:
             hour = self.environment_system.time_of_day
             season = self.environment_system.season
             
-            # Apply weather overlays
+            # Apply weather overlays; each blit sets its overlay's alpha first,
+            # so the shared surfaces are used directly instead of copied
             if weather.get('precipitation', 0) > 0.3:
                 if weather.get('temperature', 20) < 5:
                     # Snow effect - more intense in winter
-                    snow_overlay = self.effect_overlays['snow'].copy()
+                    snow_overlay = self.effect_overlays['snow']
                     if season == 'Winter':
                         snow_overlay.set_alpha(60)  # More intense in winter
                     else:
@@ -1222,14 +1288,14 @@ class GameState:
                     self.screen.blit(snow_overlay, (0, 0))
                 else:
                     # Rain effect - varies by intensity
-                    rain_overlay = self.effect_overlays['rain'].copy()
+                    rain_overlay = self.effect_overlays['rain']
                     rain_intensity = min(80, int(weather.get('precipitation', 0) * 100))
                     rain_overlay.set_alpha(rain_intensity)
                     self.screen.blit(rain_overlay, (0, 0))
             
             # Heat effect - more intense in summer
             if weather.get('temperature', 20) > 30:
-                heat_overlay = self.effect_overlays['heat'].copy()
+                heat_overlay = self.effect_overlays['heat']
                 heat_intensity = min(60, int((weather.get('temperature', 20) - 30) * 10))
                 if season == 'Summer':
                     heat_intensity += 10  # More intense in summer
@@ -1238,7 +1304,7 @@ class GameState:
             
             # Wind effect - varies by intensity
             if weather.get('wind', 0) > 15:
-                wind_overlay = self.effect_overlays['wind'].copy()
+                wind_overlay = self.effect_overlays['wind']
                 wind_intensity = min(50, int(weather.get('wind', 0) * 2))
                 wind_overlay.set_alpha(wind_intensity)
                 self.screen.blit(wind_overlay, (0, 0))
@@ -1260,13 +1326,13 @@ class GameState:
             
             # Night time (full darkness)
             if hour < dawn_start or hour > dusk_end:
-                night_overlay = self.effect_overlays['night'].copy()
+                night_overlay = self.effect_overlays['night']
                 night_overlay.set_alpha(120)  # Darker nights
                 self.screen.blit(night_overlay, (0, 0))
             
             # Dawn transition (gradually getting lighter)
             elif dawn_start <= hour < dawn_end:
-                night_overlay = self.effect_overlays['night'].copy()
+                night_overlay = self.effect_overlays['night']
                 # Calculate alpha based on position in dawn transition
                 progress = (hour - dawn_start) / (dawn_end - dawn_start)
                 alpha = int(120 * (1 - progress))
@@ -1275,14 +1341,20 @@ class GameState:
             
             # Dusk transition (gradually getting darker)
             elif dusk_start <= hour < dusk_end:
-                night_overlay = self.effect_overlays['night'].copy()
+                night_overlay = self.effect_overlays['night']
                 # Calculate alpha based on position in dusk transition
                 progress = (hour - dusk_start) / (dusk_end - dusk_start)
                 alpha = int(120 * progress)
                 night_overlay.set_alpha(alpha)
                 self.screen.blit(night_overlay, (0, 0))
         
-            # Draw particles with improved effects
+            # Draw particles with improved effects: streaks one by one, then
+            # every snowflake and heat dot as a pre-rendered sprite in one blits() call
+            dots = []
+            snow_size = 3 if self.environment_system.season == 'Winter' else 2
+            heat_size = 4 if self.environment_system.season == 'Summer' else 3
+            snow_dot = self._particle_dot((255, 255, 255), snow_size)
+            heat_dot = self._particle_dot((255, 200, 100), heat_size)
             for particle in self.particles:
                 if particle['type'] == 'rain':
                     # Rain drops - longer when heavier precipitation
@@ -1296,26 +1368,10 @@ class GameState:
                     )
                 elif particle['type'] == 'snow':
                     # Snow flakes - larger in winter
-                    snow_size = 2
-                    if self.environment_system.season == 'Winter':
-                        snow_size = 3
-                    pygame.draw.circle(
-                        self.screen,
-                        (255, 255, 255),
-                        (int(particle['x']), int(particle['y'])),
-                        snow_size
-                    )
+                    dots.append((snow_dot, (int(particle['x']) - snow_size, int(particle['y']) - snow_size)))
                 elif particle['type'] == 'heat':
                     # Heat waves - more intense in summer
-                    heat_size = 3
-                    if self.environment_system.season == 'Summer':
-                        heat_size = 4
-                    pygame.draw.circle(
-                        self.screen,
-                        (255, 200, 100),
-                        (int(particle['x']), int(particle['y'])),
-                        heat_size
-                    )
+                    dots.append((heat_dot, (int(particle['x']) - heat_size, int(particle['y']) - heat_size)))
                 elif particle['type'] == 'wind':
                     # Wind streaks - longer with stronger wind
                     wind_length = 15 + int(weather.get('wind', 0) / 2)
@@ -1326,6 +1382,17 @@ class GameState:
                         (particle['x'] - wind_length, particle['y']),
                         1
                     )
+            self.screen.blits(dots, doreturn=False)
+
+    def _particle_dot(self, color, radius: int) -> pygame.Surface:
+        """Get a cached colorkeyed sprite of a filled circle, drawn like pygame.draw.circle."""
+        dot = self.particle_dots.get((color, radius))
+        if dot is None:
+            dot = pygame.Surface((2 * radius, 2 * radius))
+            dot.set_colorkey((0, 0, 0))
+            pygame.draw.circle(dot, color, (radius, radius), radius)
+            self.particle_dots[(color, radius)] = dot
+        return dot
 
     def _handle_keydown(self, event: pygame.event.Event) -> None:
         """Handle keydown events with improved UI feedback."""
@@ -1457,13 +1524,10 @@ class GameState:
         center_x = int((self.camera_x + self.screen_width/2) // self.TILE_SIZE) % world_width_tiles
         center_y = int((self.camera_y + self.screen_height/2) // self.TILE_SIZE)
         
-        try:
-            # Check if within vertical bounds
-            if 0 <= center_y < world_height_tiles:
-                return self.world_grid[center_y][center_x], center_x
-            return 'grassland', center_x  # Default if out of vertical bounds
-        except IndexError:
-            return 'grassland', center_x  # Default if out of bounds
+        # Check if within vertical bounds; the column is already wrapped into range
+        if 0 <= center_y < world_height_tiles:
+            return self.world_grid[center_y][center_x], center_x
+        return 'grassland', center_x  # Default if out of vertical bounds
 
     def cleanup(self) -> None:
         """Clean up resources when game ends."""
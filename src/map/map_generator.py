@@ -10,9 +10,9 @@ import shapely.geometry as geom
 import matplotlib.pyplot as plt
 from typing import Tuple, Dict, Optional, List
 import pygame
+from src.map.terrain_codes import TILE_SIZE
 
 # Constants
-TILE_SIZE = 32
 WORLD_HEIGHT = 400
 WORLD_WIDTH = 600
 
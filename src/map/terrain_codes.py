@@ -0,0 +1,70 @@
+"""Small integer codes for terrain and habitat names, and the tables indexed by them."""
+import numpy as np
+
+TILE_SIZE = 32  # Pixels per grid cell; a power of two, so Animal can shift pixels into tiles
+
+# Terrain names in tile_mapping order; the index is the terrain code
+TERRAIN_NAMES = (
+    'mountain', 'forest', 'grassland', 'aquatic', 'desert', 'polar',
+    'wetland', 'forest_edge', 'savanna', 'hills', 'wooded_hills', 'beach'
+)
+TERRAIN_IDS = {name: i for i, name in enumerate(TERRAIN_NAMES)}
+UNKNOWN_TERRAIN = len(TERRAIN_NAMES)  # Code for grid cells holding any other name
+
+# Preferred habitats an animal can parse to; the index is the habitat code
+HABITAT_NAMES = ('aquatic', 'forest', 'mountain', 'desert', 'wetland', 'grassland')
+HABITAT_IDS = {name: i for i, name in enumerate(HABITAT_NAMES)}
+
+# Terrain compatibility levels
+HARMFUL = -1
+SURVIVABLE = 0
+OPTIMAL = 1
+COMPATIBILITY_NAMES = {OPTIMAL: 'optimal', SURVIVABLE: 'survivable', HARMFUL: 'harmful'}
+
+# COMPAT[habitat_id, terrain_id] -> compatibility level
+COMPAT = np.array([
+    # mtn  for  grs  aqu  des  pol  wet  fre  sav  hil  whl  bch
+    [-1,  -1,  -1,   1,  -1,  -1,   1,  -1,  -1,  -1,  -1,   1],  # aquatic
+    [-1,   1,   0,  -1,  -1,  -1,   0,   1,   0,   0,   1,  -1],  # forest
+    [ 1,   0,   0,  -1,  -1,  -1,  -1,   0,  -1,   1,   0,  -1],  # mountain
+    [-1,  -1,   0,  -1,   1,  -1,  -1,  -1,   1,  -1,  -1,   1],  # desert
+    [-1,  -1,  -1,  -1,  -1,  -1,  -1,  -1,  -1,  -1,  -1,  -1],  # wetland
+    [-1,   0,   1,  -1,   0,  -1,   1,   0,   1,   1,   0,   0],  # grassland
+], dtype=np.int8)
+
+# SURVIVABLE_TERRAINS[habitat_id][terrain_name] -> whether the habitat can live there
+SURVIVABLE_TERRAINS = tuple(
+    {name: bool(COMPAT[habitat_id, terrain_id] != HARMFUL) for terrain_id, name in enumerate(TERRAIN_NAMES)}
+    for habitat_id in range(len(HABITAT_NAMES))
+)
+
+# TERRAIN_COMPATIBILITY[habitat_id][terrain_name] -> compatibility name
+TERRAIN_COMPATIBILITY = tuple(
+    {name: COMPATIBILITY_NAMES[COMPAT.item(habitat_id, terrain_id)] for terrain_id, name in enumerate(TERRAIN_NAMES)}
+    for habitat_id in range(len(HABITAT_NAMES))
+)
+
+
+def encode_world_grid(world_grid) -> np.ndarray:
+    """Convert a list-of-lists grid of terrain names to an int8 array of terrain codes."""
+    return np.array(
+        [[TERRAIN_IDS.get(terrain, UNKNOWN_TERRAIN) for terrain in row] for row in world_grid],
+        dtype=np.int8
+    )
+
+
+def habitat_compat_grids(terrain_codes: np.ndarray) -> np.ndarray:
+    """Get the compatibility level of every cell for every habitat, shape (habitats, H, W).
+
+    Unknown terrain is harmful to every habitat.
+    """
+    compat = np.hstack([COMPAT, np.full((len(HABITAT_NAMES), 1), HARMFUL, dtype=np.int8)])
+    return compat[:, terrain_codes]
+
+
+def terrain_color_table(colors, default=(100, 100, 100)) -> np.ndarray:
+    """Get the RGB color of every terrain code as a uint8 array, shape (codes, 3).
+
+    Terrain missing from colors, and unknown terrain, get default.
+    """
+    return np.array([colors.get(name, default) for name in TERRAIN_NAMES] + [default], dtype=np.uint8)
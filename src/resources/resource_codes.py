@@ -0,0 +1,9 @@
+"""Bit codes for resource types, so the set an animal can gather is one int."""
+
+# Resource types ResourceSystem spawns; the index is the bit number
+RESOURCE_NAMES = ('food_plant', 'food_meat', 'water', 'medicinal', 'wood', 'stone', 'minerals')
+RESOURCE_BITS = {name: 1 << i for i, name in enumerate(RESOURCE_NAMES)}
+
+# Anyone can gather these; only team members gather the materials
+ANYONE_GATHERS = RESOURCE_BITS['water'] | RESOURCE_BITS['medicinal']
+TEAM_MATERIALS = RESOURCE_BITS['wood'] | RESOURCE_BITS['stone'] | RESOURCE_BITS['minerals']
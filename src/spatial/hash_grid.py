@@ -0,0 +1,69 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+class SpatialHashGrid:
+    """Uniform hash grid for neighborhood queries over entities with x/y positions.
+
+    Buckets are kept across frames and only emptied on rebuild, so a steady
+    population doesn't reallocate them every frame. The grid also remembers
+    insertion order, for callers whose results must follow their input list.
+    """
+
+    # Below this many entities a plain linear scan is cheaper than the grid
+    MIN_POPULATION = 32
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self._buckets: Dict[Tuple[int, int], List[Any]] = {}  # Keyed by cell, so cells never share a bucket
+        self._rank: Dict[int, int] = {}  # id(entity) -> insertion index
+
+    def clear(self) -> None:
+        """Empty every bucket while keeping the bucket lists for reuse."""
+        for bucket in self._buckets.values():
+            bucket.clear()
+        self._rank.clear()
+
+    def insert(self, entity: Any) -> None:
+        """Add an entity to the bucket of the cell containing it."""
+        x, y = entity.x, entity.y
+        if x != x or y != y:  # NaN positions can't be bucketed
+            return
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = []
+        bucket.append(entity)
+        self._rank[id(entity)] = len(self._rank)
+
+    def rebuild(self, entities: Iterable[Any]) -> None:
+        """Re-bucket all entities for the current frame."""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def query(self, x: float, y: float, radius: float) -> List[Any]:
+        """Get entities in the cells overlapping the square of half-size radius around (x, y).
+
+        The result is a superset of the entities within radius; callers do the
+        exact distance test.
+        """
+        cell_size = self.cell_size
+        min_cx = int((x - radius) // cell_size)
+        max_cx = int((x + radius) // cell_size)
+        min_cy = int((y - radius) // cell_size)
+        max_cy = int((y + radius) // cell_size)
+
+        candidates = []
+        for cell_x in range(min_cx, max_cx + 1):
+            for cell_y in range(min_cy, max_cy + 1):
+                bucket = self._buckets.get((cell_x, cell_y))
+                if bucket:
+                    candidates.extend(bucket)
+        return candidates
+
+    def query_in_order(self, x: float, y: float, radius: float) -> List[Any]:
+        """Like query, but with the candidates in the order they were inserted."""
+        rank = self._rank
+        candidates = self.query(x, y, radius)
+        candidates.sort(key=lambda entity: rank[id(entity)])
+        return candidates
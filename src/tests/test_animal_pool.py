@@ -0,0 +1,299 @@
+import unittest
+import math
+import random
+import numpy as np
+import pygame
+from unittest.mock import patch
+
+from src.entities.animal import Animal
+from src.entities.animal_pool import AnimalPool
+from src.map.terrain_codes import TILE_SIZE
+
+# Initialize pygame for testing
+pygame.init()
+pygame.display.set_mode((1, 1))  # Create minimal display
+
+WORLD_WIDTH = 30
+WORLD_HEIGHT = 20
+TERRAINS = ['grassland', 'forest', 'aquatic', 'desert', 'mountain', 'savanna', 'wetland', 'beach', 'lava']
+HABITATS = ['Forest', 'Ocean, coastal', 'Mountains', 'Desert', 'Grassland savanna', 'Wetland marsh', 'Arctic']
+
+
+def _world_grid(seed=7):
+    """A small world with every known terrain plus one name the codes don't know."""
+    rng = random.Random(seed)
+    return [[rng.choice(TERRAINS) for _ in range(WORLD_WIDTH)] for _ in range(WORLD_HEIGHT)]
+
+
+def _population(n, seed):
+    """Animals with mixed species data; some stand off the grid or at NaN positions."""
+    rng = random.Random(seed)
+    animals = []
+    for i in range(n):
+        data = {
+            'Max_Health': rng.choice([50.0, 100.0, 250.0]),
+            'Speed_Max': rng.choice([40, float('nan')]),
+            'Habitat': rng.choice(HABITATS),
+            'Diet_Type': 'Herbivore',
+            'Weight_Max': 50
+        }
+        animal = Animal('A%d' % i, data)
+        if i % 37 == 0:
+            animal.x = rng.choice([rng.uniform(-100, 1100), float('nan')])
+        else:
+            animal.x = rng.uniform(0, WORLD_WIDTH * TILE_SIZE)
+        animal.y = rng.uniform(-40, WORLD_HEIGHT * TILE_SIZE + 60)  # Rows off both edges too
+        animal.health = rng.uniform(0.5, animal.max_health)
+        animal.mood_points = rng.uniform(0, 100)
+        animals.append(animal)
+    return animals
+
+
+def _constrain_to_world(animal):
+    """The game's world constraint, as GameState._constrain_to_world applies it after each update."""
+    width_px = WORLD_WIDTH * TILE_SIZE
+    if animal.x < 0:
+        animal.x += width_px
+    elif animal.x >= width_px:
+        animal.x -= width_px
+    animal.y = max(32, min(animal.y, WORLD_HEIGHT * TILE_SIZE - 64))
+
+
+class _NoTurnRng:
+    """Generator stand-in under which wanderers never turn and bounce straight back."""
+
+    def binomial(self, n, p):
+        return 0
+
+    def random(self, n, dtype=np.float64):
+        return np.full(n, 0.5, dtype=dtype)
+
+
+def _no_turn_random():
+    """Patch the random module so Animal._wander never turns and bounces straight back."""
+    return patch.multiple(random, random=lambda: 1.0, uniform=lambda a, b: 0.0)
+
+
+class TestAnimalPool(unittest.TestCase):
+    """Tests that AnimalPool's batch steps match the per-animal Animal methods they replace."""
+
+    def setUp(self):
+        self.world_grid = _world_grid()
+        self.pool = AnimalPool(self.world_grid, rng=_NoTurnRng())
+
+    def assertSameFloat(self, a, b, delta=0.0, msg=None):
+        """Equal within delta, with NaN equal to NaN."""
+        if isinstance(a, float) and math.isnan(a):
+            self.assertTrue(math.isnan(b), msg)
+        else:
+            self.assertAlmostEqual(a, b, delta=delta, msg=msg)
+
+    def test_step_terrain_effects_matches_animal(self):
+        """Batched terrain effects match Animal._update_terrain_effects over many steps."""
+        expected = _population(400, seed=11)
+        pooled = _population(400, seed=11)
+        for animal in pooled:
+            animal.pooled = True
+
+        rng = random.Random(3)
+        for _ in range(300):
+            dt = rng.choice([0.25, 0.5, 0.125])
+            # Some animals jump to a new spot between steps
+            for a, b in zip(expected, pooled):
+                if rng.random() < 0.05:
+                    a.x = b.x = rng.uniform(0, WORLD_WIDTH * TILE_SIZE)
+                    a.y = b.y = rng.uniform(-40, WORLD_HEIGHT * TILE_SIZE)
+
+            for animal in expected:
+                if animal.health > 0:
+                    animal._update_terrain_effects(dt, self.world_grid)
+            self.pool.step_terrain_effects(pooled, [dt] * len(pooled), dt)
+
+        for a, b in zip(expected, pooled):
+            for key in ('health', 'mood_points', 'speed', 'terrain_health_effect', 'terrain_speed_effect'):
+                self.assertSameFloat(getattr(a, key), getattr(b, key), msg=key)
+            self.assertEqual(a.current_terrain, b.current_terrain)
+            self.assertEqual(dict(a.status_effects), dict(b.status_effects))
+        self.assertTrue(any(a.health <= 0 for a in expected))  # Harmful terrain did its work
+
+    def test_step_terrain_effects_skips_bad_time_steps(self):
+        """NaN, zero and negative time steps leave animals alone, as in Animal._update_terrain_effects."""
+        animals = _population(3, seed=5)
+        for animal in animals:
+            animal.pooled = True
+        before = [(a.health, a.speed, a.current_terrain) for a in animals]
+
+        self.pool.step_terrain_effects(animals, [float('nan'), 0.0, -1.0], 0.5)
+
+        self.assertEqual([(a.health, a.speed, a.current_terrain) for a in animals], before)
+
+    def test_heal_matches_animal(self):
+        """Batch healing follows Animal.heal, including NaN and non-positive inputs."""
+        nan = float('nan')
+        cases = []
+        for health in (50.0, 0.0, -5.0, nan, 99.0):
+            for max_health in (100.0, nan):
+                for mood in (10.0, 99.5, nan):
+                    for amount in (5.0, 0.0, -1.0, nan, math.inf, 200.0):
+                        cases.append((health, max_health, mood, amount))
+
+        def make():
+            animals = []
+            for health, max_health, mood, _ in cases:
+                animal = Animal('A', {'Max_Health': 100.0})
+                animal.health, animal.max_health, animal.mood_points = health, max_health, mood
+                animals.append(animal)
+            return animals
+
+        expected = make()
+        for animal, (_, _, _, amount) in zip(expected, cases):
+            animal.heal(amount)
+        per_animal = make()
+        AnimalPool.heal(per_animal, [amount for _, _, _, amount in cases])
+
+        for a, b in zip(expected, per_animal):
+            self.assertSameFloat(a.health, b.health)
+            self.assertSameFloat(a.mood_points, b.mood_points)
+            self.assertEqual(dict(a.status_effects), dict(b.status_effects))
+
+        # One amount for every animal
+        expected = make()
+        for animal in expected:
+            animal.heal(7.0)
+        shared = make()
+        AnimalPool.heal(shared, 7.0)
+        for a, b in zip(expected, shared):
+            self.assertSameFloat(a.health, b.health)
+            self.assertSameFloat(a.mood_points, b.mood_points)
+
+    def test_step_flee_matches_animal(self):
+        """Batched fleeing matches Animal._flee followed by the world constraint."""
+        width_px = WORLD_WIDTH * TILE_SIZE
+        height_px = WORLD_HEIGHT * TILE_SIZE
+        # (x, y, threat x, threat y): open ground, across both edges of the wrap,
+        # into both vertical margins, a threat on top of the animal and a NaN threat
+        cases = [
+            (400.0, 300.0, 380.0, 310.0),
+            (5.0, 300.0, 40.0, 300.0),
+            (width_px - 5.0, 300.0, width_px - 40.0, 300.0),
+            (400.0, 40.0, 400.0, 90.0),
+            (400.0, height_px - 70.0, 400.0, height_px - 120.0),
+            (400.0, 300.0, 400.0, 300.0),
+            (400.0, 300.0, float('nan'), 300.0),
+        ]
+        distance = 30.0
+
+        for x, y, threat_x, threat_y in cases:
+            expected = Animal('A', {})
+            expected.x, expected.y = x, y
+            expected._flee(_Point(threat_x, threat_y), distance, 1.0)
+            _constrain_to_world(expected)
+
+            pooled = Animal('A', {})
+            pooled.x, pooled.y = x, y
+            pooled.flee_from = (threat_x, threat_y)
+            pooled.flee_distance = distance
+            self.pool.step_flee([pooled])
+
+            self.assertAlmostEqual(pooled.x, expected.x, delta=1e-3)
+            self.assertAlmostEqual(pooled.y, expected.y, delta=1e-3)
+            self.assertIsNone(pooled.flee_from)
+
+    def test_step_seek_matches_animal(self):
+        """Batched seeking, with stuck seekers wandering instead, matches Animal._move_to_resource."""
+        height_px = WORLD_HEIGHT * TILE_SIZE
+        # (x, y, target tile): open ground, a target in the top row (slides along x),
+        # from inside the bottom margin toward it (stuck, so wanders and bounces),
+        # and already on the target tile
+        cases = [
+            (400.0, 300.0, (20, 3)),
+            (400.0, 40.0, (5, 0)),
+            (400.0, height_px - 10.0, (12, WORLD_HEIGHT - 1)),
+            (400.0, 300.0, (12, 9)),
+        ]
+        for x, y, target in cases:
+            expected = Animal('A', {})
+            expected.x, expected.y, expected.direction = x, y, 0.3
+            expected.state = 'seeking_resource'
+            expected.resource_target = target
+            with _no_turn_random():
+                expected._move_to_resource(1.0, self.world_grid)
+
+            pooled = Animal('A', {})
+            pooled.pooled = True
+            pooled.x, pooled.y, pooled.direction = x, y, 0.3
+            pooled.state = 'seeking_resource'
+            pooled.resource_target = target
+            pooled._move_to_resource(1.0, self.world_grid)
+            self.pool.step_seek([pooled])
+            self.pool.step_wander([pooled])
+
+            for animal in (expected, pooled):
+                _constrain_to_world(animal)
+            self.assertEqual(pooled.state, expected.state)
+            self.assertSameFloat(pooled.x, expected.x, delta=1e-3)
+            self.assertSameFloat(pooled.y, expected.y, delta=1e-3)
+            self.assertAlmostEqual(pooled.direction, expected.direction, delta=1e-5)
+            self.assertIsNone(pooled.seek_target)
+            self.assertIsNone(pooled.wander_distance)
+
+    def test_step_wander_matches_animal(self):
+        """Batched wandering matches Animal._wander followed by the world constraint."""
+        width_px = WORLD_WIDTH * TILE_SIZE
+        height_px = WORLD_HEIGHT * TILE_SIZE
+        # (x, y, direction): open ground, across both edges of the wrap, and
+        # into both vertical margins (bouncing back)
+        cases = [
+            (400.0, 300.0, 0.7),
+            (5.0, 300.0, math.pi),
+            (width_px - 5.0, 300.0, 0.0),
+            (400.0, 40.0, -math.pi / 2),
+            (400.0, height_px - 40.0, math.pi / 2),
+        ]
+        distance = 20.0
+
+        for x, y, direction in cases:
+            expected = Animal('A', {})
+            expected.x, expected.y, expected.direction = x, y, direction
+            with _no_turn_random():
+                expected._wander(self.world_grid, distance, 1.0)
+            _constrain_to_world(expected)
+
+            pooled = Animal('A', {})
+            pooled.x, pooled.y, pooled.direction = x, y, direction
+            pooled.wander_distance = distance
+            self.pool.step_wander([pooled])
+
+            self.assertAlmostEqual(pooled.x, expected.x, delta=1e-3)
+            self.assertAlmostEqual(pooled.y, expected.y, delta=1e-3)
+            self.assertAlmostEqual(pooled.direction, expected.direction, delta=1e-5)
+            self.assertIsNone(pooled.wander_distance)
+
+    def test_bar_ratio_matches_draw_health_bar(self):
+        """Bar fill ratios clamp like Animal._draw_health_bar, NaN and infinities included."""
+        nan, inf = float('nan'), math.inf
+        values = [-5.0, 0.0, 0.5, 1.0, 50.0, 100.0, 150.0, nan, inf, -inf]
+        maxima = [-3.0, 0.0, 0.5, 1.0, 100.0, nan, inf]
+
+        def reference(value, maximum):
+            value = max(0, min(value, maximum))
+            ratio = value / max(1, maximum)
+            return ratio if 0 <= ratio <= 1 else 0
+
+        pairs = [(v, m) for v in values for m in maxima]
+        with np.errstate(invalid='ignore'):
+            ratios = AnimalPool._bar_ratio(np.array([v for v, _ in pairs]), np.array([m for _, m in pairs]))
+        for (value, maximum), ratio in zip(pairs, ratios.tolist()):
+            self.assertEqual(ratio, reference(value, maximum), msg=(value, maximum))
+
+
+class _Point:
+    """Threat stand-in; _flee only reads its position."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+if __name__ == '__main__':
+    unittest.main()
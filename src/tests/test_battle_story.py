@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from combat.combat_manager import _battle_story
+from utils.helpers import generate_battle_story
+
+
+def _team(leader, members):
+    return SimpleNamespace(get_leader_name=lambda: leader, members=members)
+
+
+class TestBattleStory(unittest.TestCase):
+    """Tests for the battle stories combat results carry."""
+
+    def setUp(self):
+        self.wolf = SimpleNamespace(name='Wolf', health=0)
+        self.bear = SimpleNamespace(name='Bear', health=40)
+        self.winner = _team('Robot-1', [SimpleNamespace(name='Lion', health=80)])
+        self.loser = _team('Robot-2', [self.wolf, self.bear])
+
+    def test_matches_eager_story(self):
+        """The deferred story reads the same as one generated right away."""
+        expected = generate_battle_story(self.winner, self.loser, {})
+        self.assertEqual(str(_battle_story(self.winner, self.loser)), expected)
+        self.assertEqual(expected, "Robot-1 emerged victorious over Robot-2.\n"
+                                   "Casualties: Wolf\n"
+                                   "Survivors retained their will to fight, though weakened.")
+
+    def test_story_describes_the_battle_not_later_state(self):
+        """Deaths and renames after the battle don't change its story."""
+        expected = generate_battle_story(self.winner, self.loser, {})
+        story = _battle_story(self.winner, self.loser)
+
+        self.bear.health = 0
+        self.bear.name = 'Renamed'
+        self.loser.members.append(SimpleNamespace(name='Latecomer', health=0))
+        self.loser.get_leader_name = lambda: 'Robot-9'
+
+        self.assertEqual(str(story), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from combat.combat_manager import CombatManager
+
+
+def _animal(name, health=100.0, armor_rating=1.0, agility_score=100.0):
+    return SimpleNamespace(name=name, health=health, armor_rating=armor_rating,
+                           agility_score=agility_score, habitat='Grassland', x=0.0, y=0.0)
+
+
+def _team(members):
+    team = SimpleNamespace(formation='defensive', members=members)
+    team.compact_members = lambda keep: setattr(
+        team, 'members', [m for m, k in zip(team.members, keep.tolist()) if k])
+    return team
+
+
+class TestTeamDamage(unittest.TestCase):
+    """Tests for the batched damage a team takes at the end of a battle."""
+
+    def setUp(self):
+        self.combat = CombatManager(seed=7)
+
+    def test_nan_armor_casualty_lands_on_zero_health(self):
+        """NaN damage from a blank Armor_Rating kills at 0 health, as max(0, ...) did."""
+        fallen = _animal('A', armor_rating=float('nan'))
+        survivor = _animal('B')
+        team = _team([fallen, survivor])
+
+        casualties = self.combat._apply_team_damage(team, 10, 20, {}, (0, 0))
+
+        self.assertEqual(casualties, ['A'])
+        self.assertEqual(fallen.health, 0)
+        self.assertEqual(team.members, [survivor])
+        self.assertGreater(survivor.health, 0)
+
+    def test_nan_agility_keeps_the_dodge_cap(self):
+        """NaN agility still dodges 30% of the time, as min(0.3, ...) did."""
+        nan_team = _team([_animal(str(i), health=1000.0, agility_score=float('nan')) for i in range(50)])
+        capped_team = _team([_animal(str(i), health=1000.0, agility_score=900.0) for i in range(50)])
+
+        CombatManager(seed=7)._apply_team_damage(nan_team, 10, 20, {}, (0, 0))
+        CombatManager(seed=7)._apply_team_damage(capped_team, 10, 20, {}, (0, 0))
+
+        self.assertEqual([a.health for a in nan_team.members],
+                         [a.health for a in capped_team.members])
+
+
+if __name__ == '__main__':
+    unittest.main()
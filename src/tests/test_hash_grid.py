@@ -0,0 +1,60 @@
+import unittest
+import random
+from types import SimpleNamespace
+from src.spatial.hash_grid import SpatialHashGrid
+
+
+def _entity(x, y):
+    return SimpleNamespace(x=x, y=y)
+
+
+class TestSpatialHashGrid(unittest.TestCase):
+    """Tests for the spatial hash grid's neighborhood queries."""
+
+    def test_query_returns_each_entity_once(self):
+        """Mirrored cells like (1, 1) and (-1, -1) must not share a bucket."""
+        grid = SpatialHashGrid(300)
+        animal = _entity(320, 320)
+        grid.rebuild([animal])
+
+        self.assertEqual(grid.query(250, 250, 300), [animal])
+        self.assertEqual(grid.query_in_order(250, 250, 300), [animal])
+
+    def test_query_straddling_origin_matches_brute_force(self):
+        """A query covering cells on both sides of the origin finds every nearby entity exactly once."""
+        rng = random.Random(3)
+        entities = [_entity(rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)) for _ in range(500)]
+        grid = SpatialHashGrid(100)
+        grid.rebuild(entities)
+
+        for x, y, radius in [(0, 0, 150), (-20, 30, 250), (50, -50, 100), (0, 0, 1000)]:
+            found = grid.query_in_order(x, y, radius)
+            self.assertEqual(len(found), len({id(e) for e in found}))
+
+            # Every entity within the radius is a candidate, in insertion order
+            within = [e for e in entities if (e.x - x) ** 2 + (e.y - y) ** 2 <= radius * radius]
+            found_ids = {id(e) for e in found}
+            self.assertTrue(all(id(e) in found_ids for e in within))
+            rank = {id(e): i for i, e in enumerate(entities)}
+            self.assertEqual([rank[id(e)] for e in found], sorted(rank[id(e)] for e in found))
+
+    def test_nan_positions_are_skipped(self):
+        """Entities at NaN positions can't be bucketed, so queries never return them."""
+        grid = SpatialHashGrid(300)
+        animal = _entity(10, 10)
+        grid.rebuild([_entity(float('nan'), 10), animal, _entity(10, float('nan'))])
+
+        self.assertEqual(grid.query_in_order(0, 0, 300), [animal])
+
+    def test_rebuild_drops_old_entities(self):
+        """Rebuilding empties the buckets left from the previous frame."""
+        grid = SpatialHashGrid(300)
+        grid.rebuild([_entity(-320, -320)])
+        animal = _entity(320, 320)
+        grid.rebuild([animal])
+
+        self.assertEqual(grid.query(0, 0, 600), [animal])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,282 @@
+import unittest
+import importlib.util
+import math
+import os
+import sys
+import numpy as np
+
+import src.utils
+
+try:
+    import numba  # noqa: F401 -- imported up front so blocking it below doesn't unload it
+    NUMBA_INSTALLED = True
+except ImportError:
+    NUMBA_INSTALLED = False
+
+_UTILS_DIR = os.path.dirname(os.path.abspath(src.utils.__file__))
+_COMPILED = ('src.utils._animal_step', 'src.utils._particle_step')
+
+
+def _load_kernels(name, use_numba):
+    """Load a fresh copy of src.utils.<name> on the Numba or the NumPy backend.
+
+    The compiled extensions are always blocked so the Numba copy really runs
+    Numba; blocking an import means mapping it to None in sys.modules.
+    """
+    blocked = list(_COMPILED) + ([] if use_numba else ['numba'])
+    saved = {key: sys.modules.get(key) for key in blocked}
+    try:
+        for key in blocked:
+            sys.modules[key] = None
+        spec = importlib.util.spec_from_file_location('src.utils.' + name, os.path.join(_UTILS_DIR, name + '.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                sys.modules.pop(key, None)
+            else:
+                sys.modules[key] = value
+    return module
+
+
+def _backends(name):
+    """The backends of a kernel module that can run here, as (label, module) pairs."""
+    backends = [('numpy', _load_kernels(name, use_numba=False))]
+    if NUMBA_INSTALLED:
+        backends.append(('numba', _load_kernels(name, use_numba=True)))
+    for label, module in backends:
+        assert module.NUMBA_AVAILABLE == (label == 'numba')
+    return backends
+
+
+def _nearest_reference(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner):
+    """Brute-force nearest threat: the closest strictly within the radius, ties to the lowest index."""
+    out = []
+    for i in range(len(xs)):
+        best, best_sq = -1, radius_sq[i]
+        for j in range(len(threat_xs)):
+            if threat_owner[j] == i:
+                continue
+            dist_sq = (threat_xs[j] - xs[i]) ** 2 + (threat_ys[j] - ys[i]) ** 2
+            if dist_sq < best_sq:  # NaN compares False
+                best, best_sq = j, dist_sq
+        out.append(best)
+    return out
+
+
+class TestKernelBackends(unittest.TestCase):
+    """Tests that each kernel module's NumPy and Numba backends agree with a plain-Python reference."""
+
+    def assertSameArray(self, actual, expected, delta, msg=None):
+        """Equal within delta elementwise, with NaN equal to NaN."""
+        actual = np.asarray(actual, dtype=np.float64)
+        expected = np.asarray(expected, dtype=np.float64)
+        self.assertTrue(np.array_equal(np.isnan(actual), np.isnan(expected)), msg)
+        finite = ~np.isnan(expected)
+        self.assertTrue(np.all(np.abs(actual[finite] - expected[finite]) <= delta), msg)
+
+    def _proximity_case(self, rng, n, t):
+        """Animals and threats on integer coordinates, so float32 distances (and ties) are exact."""
+        xs = rng.integers(0, 2000, n).astype(np.float32)
+        ys = rng.integers(0, 2000, n).astype(np.float32)
+        radius_sq = rng.choice([0, 100 ** 2, 150 ** 2, 300 ** 2], n).astype(np.float32)
+        threat_xs = rng.integers(0, 2000, t).astype(np.float32)
+        threat_ys = rng.integers(0, 2000, t).astype(np.float32)
+        threat_owner = np.full(t, -1, dtype=np.intp)
+
+        # Ties: mirrored and duplicated threats around some animals
+        for i in range(0, min(n, t // 4), 3):
+            for j, (dx, dy) in zip(range(4 * (i // 3), 4 * (i // 3) + 4), [(30, 0), (-30, 0), (0, 30), (0, 30)]):
+                threat_xs[j], threat_ys[j] = xs[i] + dx, ys[i] + dy
+        # Threats that are animals themselves, sitting where their owner is
+        for j in range(t // 2, t, 5):
+            i = int(rng.integers(0, n))
+            threat_owner[j] = i
+            threat_xs[j], threat_ys[j] = xs[i], ys[i]
+        # NaN and infinite threats
+        threat_xs[1::11] = np.nan
+        threat_ys[2::13] = np.nan
+        threat_xs[3::17] = np.inf
+        return xs, ys, radius_sq, threat_xs, threat_ys, threat_owner
+
+    def test_nearest_threats_matches_reference(self):
+        """Both backends find the reference's nearest threat, on both the brute-force and binned paths."""
+        rng = np.random.default_rng(5)
+        backends = _backends('proximity_kernels')
+        for n, t in [(1, 0), (40, 5), (40, 31), (300, 32), (500, 400), (700, 2000)]:
+            case = self._proximity_case(rng, n, t)
+            expected = _nearest_reference(*(c.tolist() for c in case))
+            for label, kernels in backends:
+                out = np.empty(n, dtype=np.intp)
+                kernels.nearest_threats(*case, out)
+                self.assertEqual(out.tolist(), expected, msg=(label, n, t))
+
+    def test_nearest_threats_nan_animals_and_radii(self):
+        """Animals at NaN positions or with NaN radii find nothing; infinite radii find the closest threat."""
+        rng = np.random.default_rng(8)
+        for t in (10, 64):
+            xs, ys, radius_sq, threat_xs, threat_ys, threat_owner = self._proximity_case(rng, 6, t)
+            xs[0] = np.nan
+            ys[1] = np.nan
+            radius_sq[2] = np.nan
+            radius_sq[3] = np.inf
+            case = (xs, ys, radius_sq, threat_xs, threat_ys, threat_owner)
+            expected = _nearest_reference(*(c.tolist() for c in case))
+            self.assertEqual(expected[:3], [-1, -1, -1])
+            for label, kernels in _backends('proximity_kernels'):
+                out = np.empty(6, dtype=np.intp)
+                kernels.nearest_threats(*case, out)
+                self.assertEqual(out.tolist(), expected, msg=(label, t))
+
+    def test_movement_kernels_match_reference(self):
+        """wander_step, seek_step and flee_step agree with per-element Python versions of their rules."""
+        world_width, world_height, tile = 30, 20, 32
+        width_px = world_width * tile
+        min_y, max_y = tile, world_height * tile - 2 * tile
+        rng = np.random.default_rng(13)
+        n = 400
+
+        def valid(y):
+            return y == y and 1 <= math.floor(y / tile) < world_height - 1
+
+        def constrain(x, y):
+            return math.fmod(x, width_px) % width_px if x == x else x, (y if y != y else min(max(y, min_y), max_y))
+
+        xs = rng.uniform(-50, width_px + 50, n).astype(np.float32)
+        ys = rng.uniform(0, world_height * tile, n).astype(np.float32)
+        xs[::41] = np.nan
+        ys[7::53] = np.nan
+        others_x = rng.uniform(0, width_px, n).astype(np.float32)
+        others_y = rng.uniform(0, world_height * tile, n).astype(np.float32)
+        others_x[::29] = xs[::29]  # Targets and threats on top of the animal
+        others_y[::29] = ys[::29]
+        others_x[5::31] = np.nan
+        distance = rng.uniform(0, 60, n).astype(np.float32)
+        direction = rng.uniform(-10, 10, n).astype(np.float32)
+        rolls = rng.random(n, dtype=np.float32)
+        max_turn = math.pi / 4
+
+        wander = ([], [], [])
+        seek = ([], [], [])
+        flee = ([], [])
+        for x, y, ox, oy, d, a, roll in zip(xs.tolist(), ys.tolist(), others_x.tolist(), others_y.tolist(),
+                                            distance.tolist(), direction.tolist(), rolls.tolist()):
+            nx, ny = x + math.cos(a) * d, y + math.sin(a) * d
+            if valid(ny):
+                wx, wy = nx, ny
+            else:
+                wx, wy, a = x, y, a + math.pi + (2 * roll - 1) * max_turn
+            wx, wy = constrain(wx, wy)
+            for values, value in zip(wander, (wx, wy, a)):
+                values.append(value)
+
+            dx, dy = ox - x, oy - y
+            length = math.hypot(dx, dy)
+            step = d / length if length else math.inf
+            nx, ny = x + dx * step, y + dy * step
+            if nx != nx:
+                result = (x, y, True)
+            elif valid(ny):
+                result = (nx, ny, False)
+            elif valid(y):
+                result = (nx, y, False)  # Slide along x
+            else:
+                result = (x, y, True)
+            for values, value in zip(seek, result):
+                values.append(value)
+
+            dx, dy = x - ox, y - oy
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > 0:
+                step = d / math.sqrt(dist_sq)
+                x, y = x + dx * step, y + dy * step
+            for values, value in zip(flee, constrain(x, y)):
+                values.append(value)
+
+        for label, kernels in _backends('movement_kernels'):
+            with np.errstate(all='ignore'):
+                wx, wy, wd = xs.copy(), ys.copy(), direction.copy()
+                kernels.wander_step(wx, wy, wd, distance, rolls, np.float32(1.0), world_width, world_height, tile)
+                sx, sy, stuck = xs.copy(), ys.copy(), np.empty(n, dtype=np.bool_)
+                kernels.seek_step(sx, sy, others_x, others_y, distance, world_height, tile, stuck)
+                fx, fy = xs.copy(), ys.copy()
+                kernels.flee_step(fx, fy, others_x, others_y, distance, world_width, world_height, tile)
+
+            self.assertSameArray(wx, wander[0], 1e-2, msg=(label, 'wander x'))
+            self.assertSameArray(wy, wander[1], 1e-2, msg=(label, 'wander y'))
+            self.assertSameArray(wd, wander[2], 1e-4, msg=(label, 'wander direction'))
+            self.assertSameArray(sx, seek[0], 1e-2, msg=(label, 'seek x'))
+            self.assertSameArray(sy, seek[1], 1e-2, msg=(label, 'seek y'))
+            self.assertEqual(stuck.tolist(), seek[2], msg=(label, 'seek stuck'))
+            self.assertSameArray(fx, flee[0], 1e-2, msg=(label, 'flee x'))
+            self.assertSameArray(fy, flee[1], 1e-2, msg=(label, 'flee y'))
+
+    def test_sample_terrain_matches_reference(self):
+        """Both backends read the same terrain and level, with off-grid and NaN positions falling back."""
+        rng = np.random.default_rng(21)
+        height, width, habitats, tile = 20, 30, 6, 32
+        terrain_codes = rng.integers(0, 13, (height, width)).astype(np.int8)
+        compat_grids = rng.integers(-1, 2, (habitats, height, width)).astype(np.int8)
+        off_grid_levels = rng.integers(-1, 2, habitats).astype(np.int8)
+        off_grid_terrain = 2
+
+        n = 500
+        xs = rng.uniform(-3 * width * tile, 3 * width * tile, n).astype(np.float32)  # Wraps both ways
+        ys = rng.uniform(-2 * tile, (height + 2) * tile, n).astype(np.float32)  # Rows off both edges
+        xs[::37] = np.nan
+        ys[5::41] = np.nan
+        habitat = rng.integers(0, habitats, n).astype(np.int8)
+
+        expected_terrain, expected_level = [], []
+        for x, y, h in zip(xs.tolist(), ys.tolist(), habitat.tolist()):
+            if x == x and y == y and 0 <= math.floor(y / tile) < height:
+                gy, gx = math.floor(y / tile), math.floor(x / tile) % width
+                expected_terrain.append(int(terrain_codes[gy, gx]))
+                expected_level.append(int(compat_grids[h, gy, gx]))
+            else:
+                expected_terrain.append(off_grid_terrain)
+                expected_level.append(int(off_grid_levels[h]))
+
+        for label, kernels in _backends('terrain_kernels'):
+            terrain = np.empty(n, dtype=np.int8)
+            level = np.empty(n, dtype=np.int8)
+            kernels.sample_terrain(xs, ys, habitat, terrain_codes, compat_grids, off_grid_levels,
+                                   off_grid_terrain, tile, terrain, level)
+            self.assertEqual(terrain.tolist(), expected_terrain, msg=label)
+            self.assertEqual(level.tolist(), expected_level, msg=label)
+
+    def test_particle_step_matches_reference(self):
+        """Both backends move, fade and compact particles the same way."""
+        rng = np.random.default_rng(34)
+        n = 300
+        fields = {
+            'x': rng.uniform(0, 800, n), 'y': rng.uniform(0, 600, n),
+            'dx': rng.uniform(-100, 100, n), 'dy': rng.uniform(-100, 100, n),
+            'size': rng.uniform(1, 6, n), 'alpha': rng.uniform(0, 255, n),
+        }
+        color_id = rng.integers(0, 6, n).astype(np.int16)
+        dt, fade, gravity, drag = 0.05, 2000.0, 300.0, 0.9  # Fade kills about 40%
+
+        expected = []
+        for i in range(n):
+            alpha = fields['alpha'][i] - fade * dt
+            if alpha > 0:
+                expected.append((fields['x'][i] + fields['dx'][i] * dt, fields['y'][i] + fields['dy'][i] * dt,
+                                 fields['dx'][i] * drag, (fields['dy'][i] + gravity * dt) * drag,
+                                 fields['size'][i], alpha, color_id[i]))
+        expected = list(zip(*expected))
+
+        for label, kernels in _backends('particle_kernels'):
+            arrays = [fields[key].astype(np.float32) for key in ('x', 'y', 'dx', 'dy', 'size', 'alpha')]
+            ids = color_id.copy()
+            live = kernels.make_step(gravity, drag)(*arrays, ids, dt, fade)
+            self.assertEqual(live, len(expected[0]), msg=label)
+            x, y, dx, dy, size, alpha = (a[:live] for a in arrays)
+            for actual, want, key in zip((x, y, dx, dy, size, alpha), expected, ('x', 'y', 'dx', 'dy', 'size', 'alpha')):
+                self.assertSameArray(actual, want, 1e-2, msg=(label, key))
+            self.assertEqual(ids[:live].tolist(), list(expected[6]), msg=label)
+
+
+if __name__ == '__main__':
+    unittest.main()
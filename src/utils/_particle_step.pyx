@@ -0,0 +1,30 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""Compiled particle step, used when available ahead of the Numba kernel.
+
+Build in place with:  cythonize -i -3 src/utils/_particle_step.pyx
+"""
+
+
+def step(float[:] x, float[:] y, float[:] dx, float[:] dy, float[:] size,
+         float[:] alpha, short[:] color_id, float dt, float fade,
+         float gravity, float drag):
+    """Advance particles and compact survivors to the front in one pass.
+
+    Returns the number of live particles.
+    """
+    cdef Py_ssize_t i, w = 0, n = x.shape[0]
+    cdef float a, vy
+    for i in range(n):
+        a = alpha[i] - fade * dt
+        if a <= 0.0:
+            continue
+        vy = dy[i]
+        x[w] = x[i] + dx[i] * dt
+        y[w] = y[i] + vy * dt
+        dy[w] = (vy + gravity * dt) * drag
+        dx[w] = dx[i] * drag
+        size[w] = size[i]
+        alpha[w] = a
+        color_id[w] = color_id[i]
+        w += 1
+    return w
@@ -27,15 +27,20 @@ def random_position(bounds: Tuple[int, int, int, int]) -> Tuple[int, int]:
 def generate_battle_story(winner: Any, loser: Any, 
                          initial_health: Dict[str, float]) -> str:
     """Generate battle outcome story."""
+    return battle_story_from(winner.get_leader_name(), loser.get_leader_name(),
+                             [(m.name, m.health > 0) for m in loser.members])
+
+def battle_story_from(winner_name: str, loser_name: str,
+                      loser_members: List[Tuple[str, bool]]) -> str:
+    """Generate battle outcome story from the leader names and (name, alive) of the loser's members."""
     story_parts = []
-    story_parts.append(f"{winner.get_leader_name()} emerged victorious over {loser.get_leader_name()}.")
+    story_parts.append(f"{winner_name} emerged victorious over {loser_name}.")
     
-    casualties = [m for m in loser.members if m.health <= 0]
+    casualties = [name for name, alive in loser_members if not alive]
     if casualties:
-        story_parts.append(f"Casualties: {', '.join(m.name for m in casualties)}")
+        story_parts.append(f"Casualties: {', '.join(casualties)}")
     
-    survivors = [m for m in loser.members if m.health > 0]
-    if survivors:
+    if any(alive for _, alive in loser_members):
         story_parts.append("Survivors retained their will to fight, though weakened.")
     
     return "\n".join(story_parts)
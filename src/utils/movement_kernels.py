@@ -0,0 +1,228 @@
+import math
+
+import numpy as np
+
+# Kernel backends in order of preference: compiled extension, Numba, NumPy
+try:
+    from ._animal_step import (flee_step as _compiled_flee_step, seek_step as _compiled_seek_step,
+                               wander_step as _compiled_wander_step)
+    COMPILED_AVAILABLE = True
+except ImportError:
+    COMPILED_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# float32 constants so the kernels stay in single precision
+TURN_CHANCE = np.float32(0.02)  # Per-frame chance a wandering animal changes heading
+MAX_TURN = np.float32(math.pi / 4)  # Largest heading change when turning or bouncing
+PI = np.float32(math.pi)
+
+
+if COMPILED_AVAILABLE:
+    def wander_step(xs, ys, direction, speed, bounce_rolls, dt, world_width, world_height, tile_size):
+        """Advance wandering animals in place with the compiled extension.
+
+        bounce_rolls holds a uniform [0, 1) draw per animal for the jitter
+        added when it bounces off the top or bottom of the world.
+        """
+        _compiled_wander_step(xs, ys, direction, speed, bounce_rolls, dt, world_width, world_height,
+                              tile_size, MAX_TURN)
+elif NUMBA_AVAILABLE:
+    # fastmath without 'nnan'/'ninf' so NaN positions are still rejected
+    @njit(parallel=True, nogil=True, fastmath={'contract', 'afn', 'reassoc', 'arcp'}, cache=True)
+    def wander_step(xs, ys, direction, speed, bounce_rolls, dt, world_width, world_height, tile_size):
+        """Advance wandering animals in place in a single fused pass.
+
+        bounce_rolls holds a uniform [0, 1) draw per animal for the jitter
+        added when it bounces off the top or bottom of the world.
+        """
+        width_px = np.float32(world_width * tile_size)
+        min_y = np.float32(tile_size)
+        max_y = np.float32(world_height * tile_size - 2 * tile_size)
+        for i in prange(xs.shape[0]):
+            d = direction[i]
+            nx = xs[i] + math.cos(d) * speed[i] * dt
+            ny = ys[i] + math.sin(d) * speed[i] * dt
+
+            # Horizontal wrapping, one-tile vertical margin
+            grid_y = math.floor(ny / np.float32(tile_size))
+            if grid_y >= 1 and grid_y < world_height - 1:
+                xs[i] = nx
+                ys[i] = ny
+            else:
+                d += PI + (np.float32(2.0) * bounce_rolls[i] - np.float32(1.0)) * MAX_TURN  # Bounce off boundaries
+
+            xs[i] = xs[i] % width_px
+            ys[i] = min(max(ys[i], min_y), max_y)
+            direction[i] = d
+else:
+    def wander_step(xs, ys, direction, speed, bounce_rolls, dt, world_width, world_height, tile_size):
+        """Advance wandering animals in place with whole-array NumPy operations.
+
+        bounce_rolls holds a uniform [0, 1) draw per animal for the jitter
+        added when it bounces off the top or bottom of the world.
+        """
+        new_x = xs + np.cos(direction) * speed * dt
+        new_y = ys + np.sin(direction) * speed * dt
+
+        # Horizontal wrapping, one-tile vertical margin (NaN compares False)
+        grid_y = np.floor(new_y / tile_size)
+        valid = (grid_y >= 1) & (grid_y < world_height - 1)
+        np.copyto(xs, new_x, where=valid)
+        np.copyto(ys, new_y, where=valid)
+
+        bounced = ~valid
+        direction[bounced] += PI + (2.0 * bounce_rolls[bounced] - 1.0) * MAX_TURN  # Bounce off boundaries
+
+        np.mod(xs, world_width * tile_size, out=xs)
+        np.clip(ys, tile_size, world_height * tile_size - 2 * tile_size, out=ys)
+
+
+def pick_randomly(n, chance, rng):
+    """Get the indices of the items out of n that each pass a roll with probability chance.
+
+    Draws how many pass from a binomial and picks them at random, so the
+    cost scales with the few that pass rather than with n.
+    """
+    picks = rng.binomial(n, chance)
+    if not picks:
+        return np.empty(0, dtype=np.intp)
+    return rng.choice(n, picks, replace=False)
+
+
+def turn_randomly(direction, rng):
+    """Turn each heading by up to MAX_TURN either way with probability TURN_CHANCE, in place.
+
+    Only the turning few get touched (see pick_randomly).
+    """
+    turning = pick_randomly(direction.shape[0], TURN_CHANCE, rng)
+    if turning.shape[0]:
+        direction[turning] += rng.uniform(-MAX_TURN, MAX_TURN, turning.shape[0]).astype(np.float32)
+
+
+def valid_rows(ys, world_height, tile_size):
+    """Mask of positions inside the one-tile vertical margin, like Animal._is_valid_position."""
+    grid_y = np.floor(ys / tile_size)
+    return (grid_y >= 1) & (grid_y < world_height - 1)
+
+
+if COMPILED_AVAILABLE:
+    def seek_step(xs, ys, target_xs, target_ys, distance, world_height, tile_size, stuck):
+        """Move resource seekers toward their targets in place with the compiled extension.
+
+        Seekers blocked vertically slide along x only. stuck[i] is set for
+        those that couldn't move at all (NaN positions included).
+        """
+        _compiled_seek_step(xs, ys, target_xs, target_ys, distance, world_height, tile_size,
+                            stuck.view(np.uint8))
+elif NUMBA_AVAILABLE:
+    # NumPy error model so a zero-length step yields NaN (stuck) instead of raising
+    @njit(parallel=True, nogil=True, fastmath={'contract', 'afn', 'reassoc', 'arcp'}, error_model='numpy', cache=True)
+    def seek_step(xs, ys, target_xs, target_ys, distance, world_height, tile_size, stuck):
+        """Move resource seekers toward their targets in place in a single fused pass.
+
+        Seekers blocked vertically slide along x only. stuck[i] is set for
+        those that couldn't move at all (NaN positions included).
+        """
+        for i in prange(xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            dx = target_xs[i] - x
+            dy = target_ys[i] - y
+            step = distance[i] / math.sqrt(dx * dx + dy * dy)
+            nx = x + dx * step
+            ny = y + dy * step
+
+            stuck[i] = False
+            if nx != nx:
+                stuck[i] = True
+                continue
+            grid_y = math.floor(ny / np.float32(tile_size))
+            if grid_y >= 1 and grid_y < world_height - 1:
+                xs[i] = nx
+                ys[i] = ny
+                continue
+            grid_y = math.floor(y / np.float32(tile_size))
+            if grid_y >= 1 and grid_y < world_height - 1:
+                xs[i] = nx  # Slide along x
+            else:
+                stuck[i] = True
+else:
+    def seek_step(xs, ys, target_xs, target_ys, distance, world_height, tile_size, stuck):
+        """Move resource seekers toward their targets in place.
+
+        Seekers blocked vertically slide along x only. stuck[i] is set for
+        those that couldn't move at all (NaN positions included).
+        """
+        dx = target_xs - xs
+        dy = target_ys - ys
+        step = distance / np.sqrt(dx * dx + dy * dy)
+        new_x = xs + dx * step
+        new_y = ys + dy * step
+
+        x_ok = new_x == new_x
+        both = x_ok & valid_rows(new_y, world_height, tile_size)
+        moved = both | (x_ok & valid_rows(ys, world_height, tile_size))
+        np.copyto(xs, new_x, where=moved)
+        np.copyto(ys, new_y, where=both)
+        np.logical_not(moved, out=stuck)
+
+
+if COMPILED_AVAILABLE:
+    def flee_step(xs, ys, threat_xs, threat_ys, distance, world_width, world_height, tile_size):
+        """Move fleeing animals directly away from their threats in place with the compiled extension.
+
+        Positions then wrap horizontally and clamp to the world's vertical margins.
+        """
+        _compiled_flee_step(xs, ys, threat_xs, threat_ys, distance, world_width, world_height, tile_size)
+elif NUMBA_AVAILABLE:
+    @njit(parallel=True, nogil=True, fastmath={'contract', 'afn', 'reassoc', 'arcp'}, cache=True)
+    def flee_step(xs, ys, threat_xs, threat_ys, distance, world_width, world_height, tile_size):
+        """Move fleeing animals directly away from their threats in place in a single fused pass.
+
+        Positions then wrap horizontally and clamp to the world's vertical margins.
+        """
+        width_px = np.float32(world_width * tile_size)
+        min_y = np.float32(tile_size)
+        max_y = np.float32(world_height * tile_size - 2 * tile_size)
+        for i in prange(xs.shape[0]):
+            dx = xs[i] - threat_xs[i]
+            dy = ys[i] - threat_ys[i]
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > 0:  # NaN compares False
+                step = distance[i] / math.sqrt(dist_sq)
+                xs[i] += dx * step
+                ys[i] += dy * step
+            xs[i] = xs[i] % width_px
+            ys[i] = min(max(ys[i], min_y), max_y)
+else:
+    def flee_step(xs, ys, threat_xs, threat_ys, distance, world_width, world_height, tile_size):
+        """Move fleeing animals directly away from their threats in place.
+
+        Positions then wrap horizontally and clamp to the world's vertical margins.
+        """
+        dx = xs - threat_xs
+        dy = ys - threat_ys
+        dist_sq = dx * dx + dy * dy
+        moving = dist_sq > 0  # NaN compares False
+        step = distance[moving] / np.sqrt(dist_sq[moving])
+        xs[moving] += dx[moving] * step
+        ys[moving] += dy[moving] * step
+        np.mod(xs, world_width * tile_size, out=xs)
+        np.clip(ys, tile_size, world_height * tile_size - 2 * tile_size, out=ys)
+
+
+def _warmup():
+    """Compile the kernels up front so the first frame doesn't stall."""
+    buf = np.zeros(1, dtype=np.float32)
+    wander_step(buf, buf.copy(), buf.copy(), buf.copy(), buf.copy(), np.float32(0.0), 1, 3, 32)
+    seek_step(buf, buf.copy(), buf.copy(), buf.copy(), buf.copy(), 3, 32, np.zeros(1, dtype=np.bool_))
+    flee_step(buf, buf.copy(), buf.copy(), buf.copy(), buf.copy(), 1, 3, 32)
+
+
+if NUMBA_AVAILABLE and not COMPILED_AVAILABLE:
+    _warmup()
@@ -0,0 +1,92 @@
+from functools import lru_cache
+
+import numpy as np
+
+# Kernel backends in order of preference: compiled extension, Numba, NumPy
+try:
+    from ._particle_step import step as _compiled_step
+    COMPILED_AVAILABLE = True
+except ImportError:
+    COMPILED_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+GRAVITY = 400.0
+DRAG = 0.95
+
+
+@lru_cache(maxsize=None)
+def make_step(gravity: float = GRAVITY, drag: float = DRAG):
+    """Build a particle step kernel with gravity and drag baked in as constants.
+
+    Kernels are cached per (gravity, drag) so each variant compiles once.
+    """
+    if COMPILED_AVAILABLE:
+        def step(x, y, dx, dy, size, alpha, color_id, dt, fade):
+            """Advance particles with the compiled extension.
+
+            Returns the number of live particles.
+            """
+            return _compiled_step(x, y, dx, dy, size, alpha, color_id, dt, fade, gravity, drag)
+    elif NUMBA_AVAILABLE:
+        @njit(fastmath=True)
+        def step(x, y, dx, dy, size, alpha, color_id, dt, fade):
+            """Advance particles and compact survivors to the front in one pass.
+
+            Returns the number of live particles.
+            """
+            w = 0
+            for i in range(x.shape[0]):
+                a = alpha[i] - fade * dt
+                if a <= 0.0:
+                    continue
+                vy = dy[i]
+                x[w] = x[i] + dx[i] * dt
+                y[w] = y[i] + vy * dt
+                dy[w] = (vy + gravity * dt) * drag
+                dx[w] = dx[i] * drag
+                size[w] = size[i]
+                alpha[w] = a
+                color_id[w] = color_id[i]
+                w += 1
+            return w
+    else:
+        def step(x, y, dx, dy, size, alpha, color_id, dt, fade):
+            """Advance particles with whole-array NumPy operations, then compact survivors.
+
+            Returns the number of live particles.
+            """
+            x += dx * dt
+            y += dy * dt
+            dy += gravity * dt
+            dx *= drag
+            dy *= drag
+            np.maximum(alpha - fade * dt, 0, out=alpha)
+
+            n = x.shape[0]
+            alive = alpha > 0
+            live = int(np.count_nonzero(alive))
+            if live < n:
+                for values in (x, y, dx, dy, size, alpha, color_id):
+                    values[:live] = values[alive]
+            return live
+
+    return step
+
+
+step_particles = make_step()
+
+
+def _warmup():
+    """Compile the kernel up front so the first battle doesn't stall a frame."""
+    buf = np.zeros(1, dtype=np.float32)
+    step_particles(buf, buf.copy(), buf.copy(), buf.copy(), buf.copy(), buf.copy(),
+                   np.zeros(1, dtype=np.int16), 0.0, 0.0)
+
+
+if NUMBA_AVAILABLE and not COMPILED_AVAILABLE:
+    _warmup()
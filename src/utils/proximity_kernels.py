@@ -0,0 +1,234 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+CHUNK = 256  # Rows per distance block in the NumPy fallback
+GRID_MIN_THREATS = 32  # Below this many threats a brute-force scan beats binning them
+GRID_MAX_CELLS_PER_AXIS = 256  # Caps the cell grid for tiny radii over a wide spread
+
+
+def _grid_layout(threat_xs, threat_ys, radius_sq):
+    """Size a cell grid over the finite threats, cells the size of the largest radius.
+
+    Returns (finite, min_x, min_y, cell_size, cells_x, cells_y), or None when
+    a brute-force scan should be used instead.
+    """
+    finite = np.isfinite(threat_xs) & np.isfinite(threat_ys)
+    max_radius_sq = radius_sq.max() if radius_sq.shape[0] else 0.0
+    if threat_xs.shape[0] < GRID_MIN_THREATS or not finite.any() or not np.isfinite(max_radius_sq):
+        return None
+
+    min_x = float(threat_xs[finite].min())
+    min_y = float(threat_ys[finite].min())
+    span_x = float(threat_xs[finite].max()) - min_x
+    span_y = float(threat_ys[finite].max()) - min_y
+    cell_size = max(math.sqrt(max(float(max_radius_sq), 0.0)),
+                    span_x / GRID_MAX_CELLS_PER_AXIS, span_y / GRID_MAX_CELLS_PER_AXIS, 1.0)
+    return finite, min_x, min_y, cell_size, int(span_x / cell_size) + 1, int(span_y / cell_size) + 1
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, nogil=True, cache=True)
+    def _nearest_brute(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner, out):
+        """Test every animal against every threat."""
+        for i in prange(xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            best = -1
+            best_sq = radius_sq[i]
+            for j in range(threat_xs.shape[0]):
+                if threat_owner[j] == i:
+                    continue
+                dx = threat_xs[j] - x
+                dy = threat_ys[j] - y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < best_sq:  # NaN compares False
+                    best_sq = dist_sq
+                    best = j
+            out[i] = best
+
+    @njit(nogil=True, cache=True)
+    def _bin_threats(threat_xs, threat_ys, min_x, min_y, cell_size, cells_x, cells_y):
+        """Counting-sort finite threats by cell; cell c holds order[starts[c]:starts[c + 1]]."""
+        n_cells = cells_x * cells_y
+        cell_of = np.full(threat_xs.shape[0], -1, dtype=np.intp)
+        starts = np.zeros(n_cells + 1, dtype=np.intp)
+        for j in range(threat_xs.shape[0]):
+            x = threat_xs[j]
+            y = threat_ys[j]
+            if np.isfinite(x) and np.isfinite(y):
+                cx = min(int((x - min_x) / cell_size), cells_x - 1)
+                cy = min(int((y - min_y) / cell_size), cells_y - 1)
+                cell_of[j] = cy * cells_x + cx
+                starts[cell_of[j] + 1] += 1
+        for c in range(n_cells):
+            starts[c + 1] += starts[c]
+        fill = starts[:-1].copy()
+        order = np.empty(starts[n_cells], dtype=np.intp)
+        for j in range(threat_xs.shape[0]):  # Ascending j keeps each cell sorted
+            c = cell_of[j]
+            if c >= 0:
+                order[fill[c]] = j
+                fill[c] += 1
+        return order, starts
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _nearest_in_cells(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner,
+                          min_x, min_y, cell_size, cells_x, cells_y, order, starts, out):
+        """Test each animal against the threats in the cells its radius overlaps."""
+        for i in prange(xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            best = -1
+            best_sq = radius_sq[i]
+            radius = np.sqrt(best_sq)
+            lo_x = (x - radius - min_x) / cell_size
+            hi_x = (x + radius - min_x) / cell_size
+            lo_y = (y - radius - min_y) / cell_size
+            hi_y = (y + radius - min_y) / cell_size
+            # Skip radii missing the grid (NaN compares False), then clamp in float
+            # space so far-off animals can't overflow the casts
+            if lo_x < cells_x and hi_x >= 0 and lo_y < cells_y and hi_y >= 0:
+                first_x = int(max(lo_x, 0.0))
+                last_x = int(min(hi_x, cells_x - 1.0))
+                for cy in range(int(max(lo_y, 0.0)), int(min(hi_y, cells_y - 1.0)) + 1):
+                    for c in range(cy * cells_x + first_x, cy * cells_x + last_x + 1):
+                        for k in range(starts[c], starts[c + 1]):
+                            j = order[k]
+                            if threat_owner[j] == i:
+                                continue
+                            dx = threat_xs[j] - x
+                            dy = threat_ys[j] - y
+                            dist_sq = dx * dx + dy * dy
+                            # Ties go to the lowest index, as in a full scan
+                            if dist_sq < best_sq or (dist_sq == best_sq and best >= 0 and j < best):
+                                best_sq = dist_sq
+                                best = j
+            out[i] = best
+
+    def nearest_threats(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner, out):
+        """Find the index of the closest threat within each animal's radius.
+
+        threat_owner[j] is the animal index of threat j (-1 for non-animals),
+        so an animal never counts itself. out[i] is -1 when nothing is in range.
+        Larger threat sets are binned into cells the size of the largest radius,
+        so each animal only tests the threats in neighboring cells.
+        """
+        layout = _grid_layout(threat_xs, threat_ys, radius_sq)
+        if layout is None:
+            _nearest_brute(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner, out)
+            return
+
+        _, min_x, min_y, cell_size, cells_x, cells_y = layout
+        order, starts = _bin_threats(threat_xs, threat_ys, min_x, min_y, cell_size, cells_x, cells_y)
+        _nearest_in_cells(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner,
+                          min_x, min_y, cell_size, cells_x, cells_y, order, starts, out)
+else:
+    def _nearest_brute(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner, out):
+        """Test every animal against every threat, a block of rows at a time."""
+        out.fill(-1)
+        if threat_xs.shape[0] == 0:
+            return
+        for start in range(0, xs.shape[0], CHUNK):
+            rows = slice(start, start + CHUNK)
+            dist_sq = ((threat_xs[None, :] - xs[rows, None]) ** 2 +
+                       (threat_ys[None, :] - ys[rows, None]) ** 2)
+            dist_sq[threat_owner[None, :] == np.arange(start, start + dist_sq.shape[0])[:, None]] = np.inf
+            dist_sq[np.isnan(dist_sq)] = np.inf
+            best = np.argmin(dist_sq, axis=1)
+            in_range = dist_sq[np.arange(dist_sq.shape[0]), best] < radius_sq[rows]
+            out[rows] = np.where(in_range, best, -1)
+
+    def _bin_threats(threat_xs, threat_ys, finite, min_x, min_y, cell_size, cells_x, cells_y):
+        """Sort finite threats by cell; cell c holds order[starts[c]:starts[c + 1]]."""
+        held = np.flatnonzero(finite)
+        # Cell math in float64, as in the Numba kernels
+        cx = np.minimum(((threat_xs[held].astype(np.float64) - min_x) / cell_size).astype(np.intp), cells_x - 1)
+        cy = np.minimum(((threat_ys[held].astype(np.float64) - min_y) / cell_size).astype(np.intp), cells_y - 1)
+        cell_of = cy * cells_x + cx
+        by_cell = np.argsort(cell_of, kind='stable')
+        starts = np.searchsorted(cell_of[by_cell], np.arange(cells_x * cells_y + 1))
+        return held[by_cell], starts
+
+    def _nearest_in_cells(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner,
+                          min_x, min_y, cell_size, cells_x, cells_y, order, starts, out):
+        """Test each animal against the threats in the cells its radius overlaps, a block of rows at a time."""
+        out.fill(-1)
+        for start in range(0, xs.shape[0], CHUNK):
+            x = xs[start:start + CHUNK]
+            y = ys[start:start + CHUNK]
+            radius = np.sqrt(radius_sq[start:start + CHUNK])
+            lo_x = ((x - radius).astype(np.float64) - min_x) / cell_size
+            hi_x = ((x + radius).astype(np.float64) - min_x) / cell_size
+            lo_y = ((y - radius).astype(np.float64) - min_y) / cell_size
+            hi_y = ((y + radius).astype(np.float64) - min_y) / cell_size
+            # Skip radii missing the grid (NaN compares False), then clamp in float
+            # space so far-off animals can't overflow the casts
+            hit = np.flatnonzero((lo_x < cells_x) & (hi_x >= 0) & (lo_y < cells_y) & (hi_y >= 0))
+            if hit.shape[0] == 0:
+                continue
+            first_x = np.maximum(lo_x[hit], 0.0).astype(np.intp)
+            last_x = np.minimum(hi_x[hit], cells_x - 1.0).astype(np.intp)
+            first_y = np.maximum(lo_y[hit], 0.0).astype(np.intp)
+            last_y = np.minimum(hi_y[hit], cells_y - 1.0).astype(np.intp)
+
+            # One (animal, cell) entry per overlapped cell, then one row per candidate threat
+            rows = []
+            cells = []
+            for oy in range(int((last_y - first_y).max()) + 1):
+                for ox in range(int((last_x - first_x).max()) + 1):
+                    inside = (first_x + ox <= last_x) & (first_y + oy <= last_y)
+                    rows.append(hit[inside])
+                    cells.append((first_y[inside] + oy) * cells_x + first_x[inside] + ox)
+            rows = np.concatenate(rows)
+            cells = np.concatenate(cells)
+            counts = starts[cells + 1] - starts[cells]
+            offsets = np.cumsum(counts) - counts
+            owner = np.repeat(rows, counts)
+            j = order[np.repeat(starts[cells] - offsets, counts) + np.arange(counts.sum())]
+
+            dist_sq = (threat_xs[j] - x[owner]) ** 2 + (threat_ys[j] - y[owner]) ** 2
+            keep = (dist_sq < radius_sq[start + owner]) & (threat_owner[j] != start + owner)  # NaN compares False
+            owner, j, dist_sq = owner[keep], j[keep], dist_sq[keep]
+
+            # Closest per animal, ties going to the lowest index as in a full scan
+            ranked = np.lexsort((j, dist_sq, owner))
+            owner, j = owner[ranked], j[ranked]
+            first = np.ones(owner.shape[0], dtype=np.bool_)
+            first[1:] = owner[1:] != owner[:-1]
+            out[start + owner[first]] = j[first]
+
+    def nearest_threats(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner, out):
+        """Find the index of the closest threat within each animal's radius.
+
+        threat_owner[j] is the animal index of threat j (-1 for non-animals),
+        so an animal never counts itself. out[i] is -1 when nothing is in range.
+        Larger threat sets are binned into cells the size of the largest radius,
+        so each animal only tests the threats in neighboring cells.
+        """
+        layout = _grid_layout(threat_xs, threat_ys, radius_sq)
+        if layout is None:
+            _nearest_brute(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner, out)
+            return
+
+        finite, min_x, min_y, cell_size, cells_x, cells_y = layout
+        order, starts = _bin_threats(threat_xs, threat_ys, finite, min_x, min_y, cell_size, cells_x, cells_y)
+        _nearest_in_cells(xs, ys, radius_sq, threat_xs, threat_ys, threat_owner,
+                          min_x, min_y, cell_size, cells_x, cells_y, order, starts, out)
+
+def _warmup():
+    """Compile the kernels up front so the first frame doesn't stall."""
+    for t in (1, GRID_MIN_THREATS):  # Brute-force and binned paths
+        buf = np.zeros(t, dtype=np.float32)
+        nearest_threats(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32), np.ones(1, dtype=np.float32),
+                        buf, buf.copy(), np.full(t, -1, dtype=np.intp), np.zeros(1, dtype=np.intp))
+
+
+if NUMBA_AVAILABLE:
+    _warmup()
@@ -0,0 +1,69 @@
+import math
+
+import numpy as np
+
+# Kernel backends in order of preference: compiled extension, Numba, NumPy
+try:
+    from ._animal_step import sample_terrain as _compiled_sample_terrain
+    COMPILED_AVAILABLE = True
+except ImportError:
+    COMPILED_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if COMPILED_AVAILABLE:
+    sample_terrain = _compiled_sample_terrain
+elif NUMBA_AVAILABLE:
+    @njit(parallel=True, nogil=True, cache=True)
+    def sample_terrain(xs, ys, habitat, terrain_codes, compat_grids, off_grid_levels,
+                       off_grid_terrain, tile_size, terrain_out, level_out):
+        """Fetch the terrain code and compatibility level under each position in one pass.
+
+        Rows off the grid and NaN positions get off_grid_terrain, with the level
+        off_grid_levels[habitat] gives for it.
+        """
+        height, width = terrain_codes.shape
+        for i in prange(xs.shape[0]):
+            x = xs[i]
+            grid_y = math.floor(ys[i] / tile_size)
+            if grid_y >= 0 and grid_y < height and x == x:
+                gy = int(grid_y)
+                gx = int(math.floor(x / tile_size)) % width  # Wrap horizontally
+                terrain_out[i] = terrain_codes[gy, gx]
+                level_out[i] = compat_grids[habitat[i], gy, gx]
+            else:
+                terrain_out[i] = off_grid_terrain
+                level_out[i] = off_grid_levels[habitat[i]]
+else:
+    def sample_terrain(xs, ys, habitat, terrain_codes, compat_grids, off_grid_levels,
+                       off_grid_terrain, tile_size, terrain_out, level_out):
+        """Fetch the terrain code and compatibility level under each position.
+
+        Rows off the grid and NaN positions get off_grid_terrain, with the level
+        off_grid_levels[habitat] gives for it.
+        """
+        height, width = terrain_codes.shape
+        grid_y = np.floor(ys / tile_size)
+        on_grid = (grid_y >= 0) & (grid_y < height) & (xs == xs)
+        gy = np.where(on_grid, grid_y, 0).astype(np.int16)
+        gx = (np.where(on_grid, np.floor(xs / tile_size), 0) % width).astype(np.int16)  # Wrap horizontally
+
+        np.copyto(terrain_out, np.where(on_grid, terrain_codes[gy, gx], off_grid_terrain))
+        np.copyto(level_out, np.where(on_grid, compat_grids[habitat, gy, gx], off_grid_levels[habitat]))
+
+
+def _warmup():
+    """Compile the kernel up front so the first frame doesn't stall."""
+    codes = np.zeros((1, 1), dtype=np.int8)
+    sample_terrain(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.int8), codes,
+                   np.zeros((1, 1, 1), dtype=np.int8), np.zeros(1, dtype=np.int8), 0, 32,
+                   np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int8))
+
+
+if NUMBA_AVAILABLE and not COMPILED_AVAILABLE:
+    _warmup()